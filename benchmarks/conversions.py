@@ -0,0 +1,136 @@
+"""Compares the guard and chat completion conversion helpers with the
+dump and revalidate round trips they replaced.
+
+Usage: python benchmarks/conversions.py [--iterations N]
+
+Reports the time per conversion and the peak memory allocated while
+converting, which bounds the garbage each request leaves behind.
+"""
+
+import argparse
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from guardrails import Guard
+from guardrails.classes import ValidationOutcome
+from guardrails_ai.types import Guard as IGuard
+from litellm import ModelResponse
+
+from guardrails_api.api.guards import to_IGuard
+from guardrails_api.classes.guarded_chat_completion import GuardedChatCompletion
+from guardrails_api.clients.pg_guard_client import from_guard_item
+from guardrails_api.utils.openai import to_guarded_chat_completion
+
+
+def make_guard_json() -> dict[str, Any]:
+    return {
+        "id": "benchmark-guard",
+        "name": "benchmark-guard",
+        "description": "A guard with a few validators and an object schema",
+        "validators": [
+            {
+                "id": f"guardrails/validator_{i}",
+                "on": "$",
+                "onFail": "exception",
+                "kwargs": {"threshold": i, "choices": ["a", "b", "c"]},
+            }
+            for i in range(5)
+        ],
+        "output_schema": {
+            "type": "object",
+            "properties": {
+                f"property_{i}": {"type": "string", "description": "x" * 50}
+                for i in range(20)
+            },
+        },
+    }
+
+
+def make_chat_completion() -> ModelResponse:
+    return ModelResponse(
+        id="chatcmpl-benchmark",
+        model="gpt-4o",
+        choices=[
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "Hello! " * 100},
+            }
+        ],
+        usage={"prompt_tokens": 20, "completion_tokens": 100, "total_tokens": 120},
+    )
+
+
+def measure(fn: Callable[[], Any], iterations: int) -> tuple[float, int]:
+    """Returns microseconds per call and peak bytes allocated by one call."""
+    fn()  # Warm up caches on both sides
+    seconds = timeit.timeit(fn, number=iterations)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds / iterations * 1e6, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    iterations = parser.parse_args().iterations
+
+    guard_json = make_guard_json()
+    guard_item = SimpleNamespace(id=guard_json["id"], guard=guard_json)
+    # A Guard like the ones registered in config.py
+    guard = Guard(
+        id=guard_json["id"],
+        name=guard_json["name"],
+        description=guard_json["description"],
+        validators=IGuard.model_validate(guard_json).validators,
+    )
+    chat_completion = make_chat_completion()
+    validation_outcome = ValidationOutcome(
+        callId="call-1",
+        validationPassed=True,
+        validatedOutput="Hello!",
+        rawLlmOutput="Hello!",
+    )
+
+    def guarded_chat_completion_before():
+        completion = chat_completion.model_dump(exclude_none=True)
+        completion["guardrails"] = validation_outcome.model_dump(exclude_none=True)
+        return GuardedChatCompletion.model_validate(completion)
+
+    cases = [
+        (
+            "to_IGuard",
+            lambda: IGuard.model_validate(guard.model_dump(exclude_none=True)),
+            lambda: to_IGuard(guard),
+        ),
+        (
+            "from_guard_item",
+            lambda: IGuard.model_validate(guard_json),
+            lambda: from_guard_item(guard_item),  # type: ignore
+        ),
+        (
+            "guarded_chat_completion",
+            guarded_chat_completion_before,
+            lambda: to_guarded_chat_completion(chat_completion, validation_outcome),
+        ),
+    ]
+
+    print(
+        f"{'conversion':<25}{'before us':>12}{'after us':>12}"
+        f"{'before bytes':>15}{'after bytes':>15}"
+    )
+    for name, before, after in cases:
+        before_us, before_bytes = measure(before, iterations)
+        after_us, after_bytes = measure(after, iterations)
+        print(
+            f"{name:<25}{before_us:>12.1f}{after_us:>12.1f}"
+            f"{before_bytes:>15,}{after_bytes:>15,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,57 +1,232 @@
+import asyncio
 import json
 import os
-import inspect
 from typing import Any, Optional
 import warnings
-from fastapi import HTTPException, Request, APIRouter
-from fastapi.responses import StreamingResponse
+from datetime import datetime
+from fastapi import HTTPException, Query, Request, APIRouter
+from fastapi.responses import Response, StreamingResponse
 from urllib.parse import unquote_plus
 from guardrails import AsyncGuard, Guard
 from guardrails.classes import ValidationOutcome
 from guardrails.classes.history import Call
+from guardrails.classes.validation.validation_summary import ValidatorLogs
 from guardrails_api.classes.create_chat_completion_request import (
     CreateChatCompletionRequest,
 )
 from guardrails_api.classes.guarded_chat_completion import GuardedChatCompletion
 from guardrails_api.clients.get_guard_client import get_guard_client
 from guardrails_api.clients.cache_client import CacheClient
+from guardrails_api.clients.guard_client import GUARD_LIST_FIELDS
+from guardrails_api.clients.guard_call_store import (
+    DEFAULT_GUARD_CALLS_PAGE_SIZE,
+    MAX_GUARD_CALLS_PAGE_SIZE,
+    GuardCallStore,
+)
+from guardrails_api.clients.guard_history_store import GuardHistoryStore
+from guardrails_api.clients.hydrated_guard_cache import (
+    HydratedGuardCache,
+    get_guard_version,
+)
+from guardrails_api.clients.validation_outcome_cache import ValidationOutcomeCache
 from guardrails_api.db.postgres_client import postgres_is_enabled
 from guardrails_api.utils.attach_validation_summaries import attach_validation_summaries
+from guardrails_api.utils.cursor import decode_cursor, encode_cursor
+from guardrails_api.utils.client_disconnect import (
+    cancel_on_disconnect,
+    cancel_stream_on_disconnect,
+)
 from guardrails_api.utils.openai import (
     guarded_chat_completion,
     guarded_chat_completion_stream,
 )
+from guardrails_api.utils.guard_executor import GuardExecutor
+from guardrails_api.utils.guard_history import copy_guard
+from guardrails_api.utils.guard_ndjson import (
+    NDJSON_MEDIA_TYPE,
+    GuardImport,
+    aiter_lines,
+    dump_guard_line,
+)
+from guardrails_api.utils.guard_process_pool import GuardProcessPool
+from guardrails_api.utils.fast_json import (
+    JSON_MEDIA_TYPE,
+    FastJSONResponse,
+    dumps,
+    loads,
+)
+from guardrails_api.utils.get_int_env_var import get_int_env_var
 from guardrails_api.utils.handle_error import handle_error
+from guardrails_api.utils.logger import logger
+from guardrails_api.utils.maybe_await import maybe_await
+from guardrails_api.utils.request_coalescer import (
+    BYPASS_COALESCING_HEADER,
+    RequestCoalescer,
+)
 from guardrails_api.classes.http_error import HttpError
 from guardrails_ai.types import Guard as IGuard, CreateGuardRequest
+from guardrails_api.classes.guards_page import GuardsPage
+from guardrails_api.classes.validate_batch_request import ValidateBatchRequest
 from guardrails_api.classes.validate_request import ValidateRequest
 
 cache_client = CacheClient()
 
 cache_client.initialize()
 
+guard_history_store = GuardHistoryStore()
+
+guard_history_store.initialize()
+
+guard_call_store = GuardCallStore()
+
+guard_call_store.initialize()
+
+guard_cache = HydratedGuardCache()
+
+guard_cache.initialize()
+
+guard_executor = GuardExecutor()
+
+guard_executor.initialize()
+
+guard_process_pool = GuardProcessPool()
+
+guard_process_pool.initialize()
+
+validation_outcome_cache = ValidationOutcomeCache()
+
+validation_outcome_cache.initialize()
+
+request_coalescer = RequestCoalescer()
+
+request_coalescer.initialize()
+
 router = APIRouter()
 
+DEFAULT_VALIDATE_BATCH_MAX_CONCURRENCY = 8
+DEFAULT_GUARDS_STREAM_BATCH_SIZE = 500
+MAX_GUARDS_PAGE_SIZE = 1000
+
 
 def guard_history_is_enabled():
     return os.environ.get("GUARD_HISTORY_ENABLED", "true").lower() == "true"
 
 
+def record_call(guard_id: str, call: Call):
+    if guard_history_is_enabled():
+        guard_history_store.record(guard_id, call)
+    if guard_call_store.enabled:
+        guard_call_store.record(guard_id, call)
+
+
 def to_IGuard(guard: Guard | AsyncGuard | IGuard) -> IGuard:
-    return (
-        IGuard.model_validate(guard.model_dump(exclude_none=True))
-        if isinstance(guard, Guard)
-        else guard
-    )
+    # Guard and AsyncGuard subclass IGuard and FastAPI serializes them with
+    # the IGuard schema, so they're returned as is instead of being dumped
+    # and validated into a new IGuard
+    return guard
+
+
+def get_validate_batch_max_concurrency() -> int:
+    max_concurrency = get_int_env_var("VALIDATE_BATCH_MAX_CONCURRENCY")
+    return max_concurrency or DEFAULT_VALIDATE_BATCH_MAX_CONCURRENCY
+
+
+def to_executable_guard(
+    guard_struct: Guard | AsyncGuard | IGuard, guard_version: str
+) -> Guard | AsyncGuard:
+    # Guards registered from config.py are already Guard instances; use them
+    # as is so sync guards reach the guard executor.
+    if isinstance(guard_struct, IGuard) and not isinstance(guard_struct, Guard):
+        return guard_cache.hydrate(guard_struct, guard_version)
+    return guard_struct
+
+
+def parse_guard_fields(fields: Optional[str]) -> Optional[list[str]]:
+    if not fields:
+        return None
+    parsed = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in parsed if f not in GUARD_LIST_FIELDS]
+    if unknown:
+        raise HttpError(
+            status=400,
+            message="BadRequest",
+            cause=f"Unknown guard fields {unknown}! fields must be a subset of {list(GUARD_LIST_FIELDS)}.",
+        )
+    return parsed
+
+
+async def stream_guards(
+    guard_name: Optional[str],
+    after: Optional[tuple[str, str]],
+    fields: Optional[list[str]],
+    batch_size: int,
+):
+    guard_client = get_guard_client()
+    while True:
+        items, after = await maybe_await(
+            guard_client.list_guards(
+                guard_name=guard_name, limit=batch_size, after=after, fields=fields
+            )
+        )
+        yield b"".join(dump_guard_line(item) for item in items)
+        if after is None:
+            return
 
 
-@router.get("/guards")
+@router.get(
+    "/guards",
+    # Every guard without limit, cursor or fields, a page of guards with them
+    response_model=list[IGuard] | GuardsPage,
+    responses={
+        200: {
+            "description": "Successful Response",
+            "content": {NDJSON_MEDIA_TYPE: {"additionalProperties": True}},
+        }
+    },
+)
 @handle_error
-async def get_guards(name: Optional[str] = None) -> list[IGuard]:
+async def get_guards(
+    name: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_GUARDS_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    stream: bool = False,
+) -> list[IGuard] | GuardsPage | Response:
     guard_client = get_guard_client()
     guard_name = unquote_plus(name) if name else None
-    guards = guard_client.get_guards(guard_name=guard_name)
-    return [to_IGuard(g) for g in guards]
+    projected_fields = parse_guard_fields(fields)
+    after = decode_cursor(cursor, 2) if cursor else None
+
+    if stream:
+        # NDJSON of every guard after the cursor, read limit guards at a time
+        return StreamingResponse(
+            stream_guards(
+                guard_name,
+                after,  # type: ignore
+                projected_fields,
+                limit or DEFAULT_GUARDS_STREAM_BATCH_SIZE,
+            ),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
+    if limit is None and after is None and projected_fields is None:
+        guards = await maybe_await(guard_client.get_guards(guard_name=guard_name))
+        return [to_IGuard(g) for g in guards]
+
+    items, next_after = await maybe_await(
+        guard_client.list_guards(
+            guard_name=guard_name,
+            limit=limit or MAX_GUARDS_PAGE_SIZE,
+            after=after,
+            fields=projected_fields,
+        )
+    )
+    next_cursor = encode_cursor(*next_after) if next_after else None
+    page = b'{"guards":[%b],"nextCursor":%b}' % (
+        b",".join(dump_guard_line(item).rstrip(b"\n") for item in items),
+        dumps(next_cursor),
+    )
+    return Response(page, media_type=JSON_MEDIA_TYPE)
 
 
 @router.post("/guards")
@@ -64,16 +239,43 @@ async def create_guard(guard: CreateGuardRequest) -> IGuard:
             detail="Not Implemented POST /guards is not implemented for in-memory guards.",
         )
 
-    new_guard = guard_client.create_guard(guard)  # type: ignore
+    new_guard = await maybe_await(guard_client.create_guard(guard))  # type: ignore
     return new_guard
 
 
+@router.post("/guards:bulk")
+@handle_error
+async def bulk_import_guards(request: Request, overwrite: bool = True) -> Response:
+    """Creates or replaces the guards in an NDJSON body, one guard per line,
+    in one transaction. Responds with NDJSON reporting whether each line
+    was written, conflicted with an existing guard (only when overwrite is
+    false) or was not a valid guard."""
+    guard_client = get_guard_client()
+    if not postgres_is_enabled():
+        raise HTTPException(
+            status_code=501,
+            detail="POST /guards:bulk is not implemented for in-memory guards.",
+        )
+
+    guard_import = GuardImport()
+    async for line in aiter_lines(request.stream()):
+        guard_import.add_line(line)
+    written = await maybe_await(
+        guard_client.upsert_guards(guard_import.guards, overwrite)  # type: ignore
+    )
+    guard_import.add_written(written)
+    for guard in written:
+        if guard is not None:
+            guard_cache.invalidate(guard.id)
+    return Response(guard_import.dump_results(), media_type=NDJSON_MEDIA_TYPE)
+
+
 @router.get("/guards/{id}")
 @handle_error
 async def get_guard(id: str, asOf: Optional[str] = None) -> IGuard:
     guard_client = get_guard_client()
     decoded_guard_id = unquote_plus(id)
-    guard = guard_client.get_guard(decoded_guard_id, asOf)
+    guard = await maybe_await(guard_client.get_guard(decoded_guard_id, asOf))
     if guard is None:
         raise HTTPException(
             status_code=404,
@@ -93,7 +295,10 @@ async def update_guard(id: str, guard: IGuard) -> IGuard:
         )
 
     decoded_guard_id = unquote_plus(id)
-    updated_guard = guard_client.upsert_guard(decoded_guard_id, guard)  # type: ignore
+    updated_guard = await maybe_await(
+        guard_client.upsert_guard(decoded_guard_id, guard)  # type: ignore
+    )
+    guard_cache.invalidate(decoded_guard_id)
     return updated_guard
 
 
@@ -107,7 +312,8 @@ async def delete_guard(id: str) -> IGuard:
             detail="DELETE /guards/{id} is not implemented for in-memory guards.",
         )
     decoded_guard_id = unquote_plus(id)
-    guard = guard_client.delete_guard(decoded_guard_id)
+    guard = await maybe_await(guard_client.delete_guard(decoded_guard_id))
+    guard_cache.invalidate(decoded_guard_id)
     return guard
 
 
@@ -129,12 +335,14 @@ async def delete_guard(id: str) -> IGuard:
 )
 @handle_error
 async def openai_v1_chat_completions(
-    id: str, create_chat_completion_request: CreateChatCompletionRequest
+    id: str,
+    create_chat_completion_request: CreateChatCompletionRequest,
+    request: Request,
 ) -> GuardedChatCompletion | StreamingResponse:
     payload = dict(create_chat_completion_request)
     guard_client = get_guard_client()
     decoded_guard_id = unquote_plus(id)
-    guard_struct = guard_client.get_guard(decoded_guard_id)
+    guard_struct = await maybe_await(guard_client.get_guard(decoded_guard_id))
     if guard_struct is None:
         raise HTTPException(
             status_code=404,
@@ -142,7 +350,7 @@ async def openai_v1_chat_completions(
         )
 
     guard = (
-        AsyncGuard.from_dict(guard_struct.model_dump(exclude_none=True))
+        guard_cache.hydrate(guard_struct, get_guard_version(guard_struct))
         if not isinstance(guard_struct, Guard)
         else guard_struct
     )
@@ -153,12 +361,27 @@ async def openai_v1_chat_completions(
     stream = payload.get("stream", False)
 
     if not stream:
-        guarded_completion = await guarded_chat_completion(guard, payload)
-        return guarded_completion.model_dump(exclude_none=True)  # type: ignore - force snake_case
+        guarded_completion = await cancel_on_disconnect(
+            request,
+            guarded_chat_completion(
+                guard, payload, on_call=lambda call: record_call(guard.id, call)
+            ),
+            "chat_completions",
+        )
+        # by_alias=False forces snake_case
+        return Response(
+            dumps(guarded_completion, by_alias=False, exclude_none=True),
+            media_type=JSON_MEDIA_TYPE,
+        )
     else:
-        guarded_completion_stream = await guarded_chat_completion_stream(guard, payload)
+        guarded_completion_stream = await guarded_chat_completion_stream(
+            guard, payload, on_call=lambda call: record_call(guard.id, call)
+        )
         return StreamingResponse(
-            guarded_completion_stream, media_type="text/event-stream"
+            cancel_stream_on_disconnect(
+                request, guarded_completion_stream, "chat_completions"
+            ),
+            media_type="text/event-stream",
         )
 
 
@@ -185,7 +408,7 @@ async def validate(
         "x-openai-api-key", os.environ.get("OPENAI_API_KEY")
     )
     decoded_guard_id = unquote_plus(id)
-    guard_struct = guard_client.get_guard(decoded_guard_id)
+    guard_struct = await maybe_await(guard_client.get_guard(decoded_guard_id))
 
     llm_output = payload.pop("llm_output", None)
     num_reasks = payload.pop("num_reasks", None)
@@ -201,62 +424,109 @@ async def validate(
 
     payload["api_key"] = payload.get("api_key", openai_api_key)
 
-    guard: Guard | AsyncGuard | None
-    if isinstance(guard_struct, IGuard):
-        guard = AsyncGuard.from_dict(guard_struct.model_dump(exclude_none=True))
-    else:
-        guard = guard_struct
-
-    if not guard:
+    if not guard_struct:
         raise HttpError(
             status=404,
             message="NotFound",
             cause="A Guard with the id {id} does not exist!".format(id=id),
         )
-
+    # Hashing the guard definition isn't free, so it is done once per request
+    guard_version = get_guard_version(guard_struct)
+    guard = to_executable_guard(guard_struct, guard_version)
+    # The guard is shared by concurrent requests; this one's call runs on
+    # a copy with its own history
+    request_guard = copy_guard(guard)
+
+    call: Optional[Call] = None
+    validator_logs: list[ValidatorLogs] = []
+    outcome_cache_key: Optional[str] = None
     if llm_output is not None:
         if stream:
             raise HTTPException(
                 status_code=400, detail="Streaming is not supported for parse calls!"
             )
-        execution = guard.parse(
-            llm_output=llm_output,
-            num_reasks=num_reasks,
-            prompt_params=prompt_params,
-            **payload,
-        )
-        if inspect.iscoroutine(execution):
-            result: ValidationOutcome = await execution  # type: ignore - AsyncGuard.parse returns Awaitable[ValidationOutcome] when it doesn't need to
+        if validation_outcome_cache.is_cacheable(guard_struct):
+            outcome_cache_key = validation_outcome_cache.get_key(
+                guard_struct,
+                guard_version,
+                llm_output,
+                payload.get("metadata"),
+                prompt_params,
+            )
+            cached_outcome = validation_outcome_cache.get(outcome_cache_key)
+            if cached_outcome is not None:
+                return Response(cached_outcome, media_type=JSON_MEDIA_TYPE)  # type: ignore
+
+        async def parse() -> tuple[ValidationOutcome, Optional[Call]]:
+            if guard_process_pool.enabled:
+                # The call is recorded in the worker's copy of the guard
+                parse_result, parse_call = await guard_process_pool.parse(
+                    guard,
+                    guard_version,
+                    llm_output=llm_output,
+                    num_reasks=num_reasks,
+                    prompt_params=prompt_params,
+                    **payload,
+                )
+            else:
+                # Sync guards run in the guard executor's thread pool when enabled
+                parse_result = await guard_executor.run(
+                    request_guard.parse,
+                    llm_output=llm_output,
+                    num_reasks=num_reasks,
+                    prompt_params=prompt_params,
+                    **payload,
+                )
+                parse_call = request_guard.history.last
+            # Recorded by the request that ran the parse, not again by every
+            # request coalesced onto it
+            if parse_call is not None:
+                record_call(guard.id, parse_call)
+            return parse_result, parse_call
+
+        coalesce_key = None
+        if request.headers.get(BYPASS_COALESCING_HEADER, "").lower() != "true":
+            coalesce_key = request_coalescer.get_key(
+                guard_struct,
+                guard_version,
+                {**validate_request, "api_key": payload["api_key"]},
+            )
+        if coalesce_key is not None:
+            result, call = await cancel_on_disconnect(
+                request, request_coalescer.run(coalesce_key, parse), "validate"
+            )
         else:
-            result: ValidationOutcome = execution
+            result, call = await cancel_on_disconnect(request, parse(), "validate")
+        if call is not None:
+            validator_logs = call.validator_logs
     else:
         if stream:
 
             async def guard_streamer():
-                call = guard(
+                guard_stream = await guard_executor.run(
+                    request_guard,
+                    *args,
                     prompt_params=prompt_params,
                     num_reasks=num_reasks,
                     stream=stream,
-                    *args,
                     **payload,
                 )
-                is_async = inspect.iscoroutine(call)
+                is_async = hasattr(guard_stream, "__aiter__")
                 if is_async:
-                    guard_stream = await call
                     async for result in guard_stream:  # type: ignore
                         validation_output = ValidationOutcome.from_guard_history(
-                            guard.history.last  # type: ignore
+                            request_guard.history.last  # type: ignore
                         )
                         yield validation_output, result
                 else:
-                    guard_stream = call
-                    for result in guard_stream:  # type: ignore
+                    async for result in guard_executor.iterate(guard_stream):  # type: ignore
                         validation_output = ValidationOutcome.from_guard_history(
-                            guard.history.last  # type: ignore
+                            request_guard.history.last  # type: ignore
                         )
                         yield validation_output, result
 
             async def validate_streamer(guard_iter):
+                call = None
                 try:
                     async for validation_output, result in guard_iter:
                         fragment_dict = result.model_dump(
@@ -266,68 +536,206 @@ async def validate(
                             json.dumps(
                                 {"start": x.start, "end": x.end, "reason": x.reason}
                             )
-                            for x in guard.error_spans_in_output()
-                        ]
-                        yield json.dumps(fragment_dict) + "\n"
-
-                    call = guard.history.last
-                    if call:
-                        final_validation_output = ValidationOutcome(
-                            callId=call.id,
-                            validationPassed=result.validation_passed,  # type: ignore
-                            validatedOutput=result.validated_output,  # type: ignore
-                            rawLlmOutput=result.raw_llm_output,  # type: ignore
-                        )
-                        final_output_dict = final_validation_output.model_dump(
-                            exclude_none=True, by_alias=True
-                        )
-                        final_output_dict["error_spans"] = [
-                            json.dumps(
-                                {"start": x.start, "end": x.end, "reason": x.reason}
-                            )
-                            for x in guard.error_spans_in_output()
+                            for x in request_guard.error_spans_in_output()
                         ]
+                        yield dumps(fragment_dict).decode() + "\n"
+
+                    call = request_guard.history.last
                 except Exception as e:
-                    yield json.dumps({"error": {"message": str(e)}}) + "\n"
-
-                if guard_history_is_enabled():
-                    serialized_history = [
-                        call.model_dump(exclude_none=True, by_alias=True)
-                        for call in guard.history
-                    ]
-                    cache_key = f"{guard.id}-{final_validation_output.call_id}"  # type: ignore
-                    await cache_client.set(
-                        cache_key, json.dumps(serialized_history), 300
-                    )
+                    yield dumps({"error": {"message": str(e)}}).decode() + "\n"
+
+                if call:
+                    record_call(guard.id, call)
 
             return StreamingResponse(
-                validate_streamer(guard_streamer()), media_type="application/json"
+                cancel_stream_on_disconnect(
+                    request, validate_streamer(guard_streamer()), "validate"
+                ),
+                media_type="application/json",
             )
         else:
-            execution = guard(
-                prompt_params=prompt_params,
-                num_reasks=num_reasks,
-                *args,
-                **payload,
+            result: ValidationOutcome = await cancel_on_disconnect(
+                request,
+                guard_executor.run(
+                    request_guard,
+                    *args,
+                    prompt_params=prompt_params,
+                    num_reasks=num_reasks,
+                    **payload,
+                ),
+                "validate",
             )
-            if inspect.iscoroutine(execution):
-                result: ValidationOutcome = await execution  # type: ignore
-            else:
-                result: ValidationOutcome = execution
-    if guard_history_is_enabled():
-        serialized_history = [
-            call.model_dump(exclude_none=True, by_alias=True) for call in guard.history
+            call = request_guard.history.last
+            if call is not None:
+                record_call(guard.id, call)
+    result = attach_validation_summaries(result, request_guard, validator_logs)
+    if outcome_cache_key is not None:
+        validation_outcome_cache.set(
+            outcome_cache_key, result.model_dump(mode="json", by_alias=True)
+        )
+    return Response(dumps(result), media_type=JSON_MEDIA_TYPE)  # type: ignore
+
+
+@router.post(
+    "/guards/{id}/validate/batch",
+    response_model=None,  # Disable default to allow Union/Direct Response
+    responses={
+        200: {
+            "description": "Successful Response",
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": ValidationOutcome.model_json_schema(),
+                    }
+                },
+                "application/x-ndjson": {"additionalProperties": True},
+            },
+        }
+    },
+)
+@handle_error
+async def validate_batch(
+    id: str, validate_batch_request: ValidateBatchRequest, request: Request
+) -> list[dict[str, Any]] | StreamingResponse:
+    guard_client = get_guard_client()
+    openai_api_key = request.headers.get(
+        "x-openai-api-key", os.environ.get("OPENAI_API_KEY")
+    )
+    decoded_guard_id = unquote_plus(id)
+    # Resolved, versioned and hydrated once for every item in the batch
+    guard_struct = await maybe_await(guard_client.get_guard(decoded_guard_id))
+    if not guard_struct:
+        raise HttpError(
+            status=404,
+            message="NotFound",
+            cause="A Guard with the id {id} does not exist!".format(id=id),
+        )
+    guard_version = get_guard_version(guard_struct)
+    guard = to_executable_guard(guard_struct, guard_version)
+
+    items = validate_batch_request.get("items", [])
+    stream = validate_batch_request.get("stream", False)
+    api_key = validate_batch_request.get("api_key", openai_api_key)
+    semaphore = asyncio.Semaphore(get_validate_batch_max_concurrency())
+    use_outcome_cache = validation_outcome_cache.is_cacheable(guard_struct)
+
+    async def validate_item(item: dict[str, Any]) -> dict[str, Any]:
+        payload = {**item}
+        llm_output = payload.pop("llm_output")
+        num_reasks = payload.pop("num_reasks", None)
+        prompt_params = payload.pop("prompt_params", {})
+        payload["api_key"] = api_key
+        outcome_cache_key = None
+        if use_outcome_cache:
+            outcome_cache_key = validation_outcome_cache.get_key(
+                guard_struct,
+                guard_version,
+                llm_output,
+                payload.get("metadata"),
+                prompt_params,
+            )
+            cached_outcome = validation_outcome_cache.get(outcome_cache_key)
+            if cached_outcome is not None:
+                return loads(cached_outcome)
+        item_guard = copy_guard(guard)
+        async with semaphore:
+            try:
+                if guard_process_pool.enabled:
+                    result, call = await guard_process_pool.parse(
+                        guard,
+                        guard_version,
+                        llm_output=llm_output,
+                        num_reasks=num_reasks,
+                        prompt_params=prompt_params,
+                        **payload,
+                    )
+                else:
+                    result = await guard_executor.run(
+                        item_guard.parse,
+                        llm_output=llm_output,
+                        num_reasks=num_reasks,
+                        prompt_params=prompt_params,
+                        **payload,
+                    )
+                    call = next(
+                        (c for c in item_guard.history if c.id == result.call_id), None
+                    )
+            except Exception as e:
+                logger.error(e)
+                return {"error": {"message": str(e)}}
+
+        if call:
+            record_call(guard.id, call)
+        result = attach_validation_summaries(
+            result, item_guard, call.validator_logs if call else []
+        )
+        outcome = result.model_dump(mode="json", by_alias=True)
+        if outcome_cache_key is not None:
+            validation_outcome_cache.set(outcome_cache_key, outcome)
+        return outcome
+
+    if not stream:
+        return FastJSONResponse(
+            await asyncio.gather(*[validate_item(item) for item in items])
+        )
+
+    async def validate_batch_streamer():
+        async def indexed(index: int, item: dict[str, Any]):
+            return index, await validate_item(item)
+
+        tasks = [
+            asyncio.ensure_future(indexed(index, item))
+            for index, item in enumerate(items)
         ]
-        cache_key = f"{guard.id}-{result.call_id}"
-        await cache_client.set(cache_key, json.dumps(serialized_history), 300)
-    result = attach_validation_summaries(result, guard)
-    return result
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, item_result = await next_done
+                yield dumps({"index": index, **item_result}).decode() + "\n"
+        finally:
+            # Stop outstanding items if the client goes away mid stream
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(
+        validate_batch_streamer(), media_type="application/x-ndjson"
+    )
 
 
 # Deprecate this in favor of standard OTEL tracing
 @router.get("/guards/{id}/history/{call_id}", deprecated=True)
 @handle_error
 async def guard_history(id: str, call_id: str) -> list[Call]:
-    cache_key = f"{id}-{call_id}"
-    cached_value = await cache_client.get(cache_key) or "[]"
-    return json.loads(cached_value)
+    return await guard_history_store.get_history(id, call_id)  # type: ignore
+
+
+@router.get("/guards/{id}/calls")
+@handle_error
+async def get_guard_calls(
+    id: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = Query(
+        default=DEFAULT_GUARD_CALLS_PAGE_SIZE, ge=1, le=MAX_GUARD_CALLS_PAGE_SIZE
+    ),
+    cursor: Optional[str] = None,
+) -> dict[str, Any]:
+    if not guard_call_store.enabled:
+        raise HTTPException(
+            status_code=501,
+            detail="GET /guards/{id}/calls requires Postgres and GUARD_CALLS_ENABLED=true.",
+        )
+    return await guard_call_store.get_calls(
+        unquote_plus(id), start=start, end=end, limit=limit, cursor=cursor
+    )
+
+
+@router.get("/guards/{id}/calls/{call_id}")
+@handle_error
+async def get_guard_call(id: str, call_id: str) -> dict[str, Any]:
+    if not guard_call_store.enabled:
+        raise HTTPException(
+            status_code=501,
+            detail="GET /guards/{id}/calls/{call_id} requires Postgres and GUARD_CALLS_ENABLED=true.",
+        )
+    return await guard_call_store.get_call(unquote_plus(id), call_id)
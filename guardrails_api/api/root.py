@@ -3,8 +3,13 @@ from pydantic import BaseModel
 
 from sqlalchemy import text
 from guardrails_api.classes.health_check import HealthCheck
-from guardrails_api.db.postgres_client import PostgresClient, postgres_is_enabled
+from guardrails_api.db.postgres_client import (
+    PostgresClient,
+    postgres_async_is_enabled,
+    postgres_is_enabled,
+)
 from guardrails_api.utils.logger import logger
+from guardrails_api.utils.metrics import Metrics
 
 
 class HealthCheckResponse(BaseModel):
@@ -12,6 +17,11 @@ class HealthCheckResponse(BaseModel):
     message: str
 
 
+class MetricsResponse(BaseModel):
+    counters: dict[str, float]
+    gauges: dict[str, float]
+
+
 router = APIRouter()
 
 
@@ -28,6 +38,14 @@ async def health_check():
 
         pg_client = PostgresClient()
         query = text("SELECT count(datid) FROM pg_stat_activity;")
+        if postgres_async_is_enabled():
+            async with pg_client.AsyncSessionLocal() as async_session:
+                response = (await async_session.execute(query)).all()
+
+                logger.debug("response: %s", response)
+
+                return HealthCheck(200, "Ok").to_dict()
+
         with pg_client.SessionLocal() as session:
             response = session.execute(query).all()
 
@@ -37,3 +55,8 @@ async def health_check():
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
+
+
+@router.get("/metrics", response_model=MetricsResponse)
+async def metrics():
+    return Metrics().snapshot()
@@ -1,4 +1,5 @@
 import sys
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
@@ -6,7 +7,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from guardrails import configure_logging
+from guardrails_api.clients.async_pg_guard_client import AsyncPGGuardClient
 from guardrails_api.clients.cache_client import CacheClient
+from guardrails_api.clients.pg_guard_client import PGGuardClient
 from guardrails_api.db.postgres_client import postgres_is_enabled
 
 from rich.console import Console
@@ -78,6 +81,62 @@ def register_middleware(*, middleware: Optional[str] = None, app: FastAPI):
             )
 
 
+def start_guard_change_listener():
+    from guardrails_api.clients.get_guard_client import get_guard_client
+    from guardrails_api.clients.hydrated_guard_cache import HydratedGuardCache
+    from guardrails_api.db.guard_change_listener import (
+        GuardChangeListener,
+        guard_change_notify_is_enabled,
+    )
+    from guardrails_api.db.postgres_client import PostgresClient
+
+    if not guard_change_notify_is_enabled():
+        return None
+
+    guard_client = get_guard_client()
+    guard_cache = HydratedGuardCache()
+
+    def on_change(guard_id: str):
+        guard_client.evict_guard(guard_id)
+        guard_cache.invalidate(guard_id)
+
+    def on_disconnect():
+        guard_client.disable_guard_cache()
+        guard_cache.clear()
+
+    listener = GuardChangeListener(
+        PostgresClient().engine,
+        on_change=on_change,
+        on_listen=guard_client.enable_guard_cache,
+        on_disconnect=on_disconnect,
+    )
+    listener.start()
+    return listener
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Started per worker so each worker hears about guard changes
+    guard_change_listener = (
+        start_guard_change_listener() if postgres_is_enabled() else None
+    )
+    yield
+    if guard_change_listener:
+        guard_change_listener.stop()
+    from guardrails_api.api.guards import (
+        guard_call_store,
+        guard_executor,
+        guard_history_store,
+        guard_process_pool,
+    )
+
+    guard_executor.shutdown(wait=False)
+    guard_process_pool.shutdown(wait=False)
+    # Store calls still queued by the background history writer
+    await guard_history_store.flush()
+    await guard_call_store.flush()
+
+
 # Support for providing env vars as uvicorn does not support supplying args to create_app
 # - Usage: GR_CONFIG_FILE_PATH=config.py GR_ENV_FILE=.env PORT=8080 uvicorn --factory 'guardrails_api.app:create_app' --host 0.0.0.0 --port $PORT --workers 2 --timeout-keep-alive 90
 # - Usage: gunicorn -k uvicorn.workers.UvicornWorker --bind 0.0.0.0:$PORT --timeout=90 --workers=2 "guardrails_api.app:create_app(None, None, $PORT)"
@@ -106,7 +165,7 @@ def create_app(
 
     resolved_config_file_path = register_config(config)
 
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
 
     # Add CORS middleware
     app.add_middleware(
@@ -168,7 +227,13 @@ def create_app(
     console.print(":green_circle: Active guards and OpenAI compatible endpoints:")
 
     guard_client = get_guard_client()
-    guards = guard_client.get_guards()
+    # The async guard client can't be awaited before the server is running,
+    # so list guards over the sync engine instead.
+    guards = (
+        PGGuardClient().get_guards()
+        if isinstance(guard_client, AsyncPGGuardClient)
+        else guard_client.get_guards()
+    )
 
     for g in guards:
         g_dict = g.model_dump(exclude_none=True, by_alias=True)
@@ -0,0 +1,29 @@
+import sys
+
+from datetime import datetime
+from typing import Optional
+
+from guardrails_ai.types import Guard as IGuard
+from typing_extensions import TypedDict
+
+if sys.version_info.minor < 11:
+    from typing_extensions import NotRequired
+else:
+    from typing import NotRequired  # type: ignore
+
+
+class GuardFields(TypedDict):
+    # The subset of these selected with GET /guards?fields=
+    id: NotRequired[str]
+    name: NotRequired[str]
+    created_by: NotRequired[str]
+    created_at: NotRequired[datetime]
+    updated_by: NotRequired[str]
+    updated_at: NotRequired[datetime]
+
+
+class GuardsPage(TypedDict):
+    # Whole guards, or only their selected fields when fields is given
+    guards: list[IGuard] | list[GuardFields]
+    # Pass as the cursor to get the next page; null on the last page
+    nextCursor: Optional[str]
@@ -0,0 +1,25 @@
+import sys
+
+from typing import Any, Optional
+
+from typing_extensions import TypedDict
+
+if sys.version_info.minor < 11:
+    from typing_extensions import NotRequired
+else:
+    from typing import NotRequired  # type: ignore
+
+
+class ValidateBatchItem(TypedDict):
+    llm_output: str
+    prompt_params: NotRequired[Optional[dict[str, Any]]]
+    num_reasks: NotRequired[Optional[int]]
+    metadata: NotRequired[Optional[dict[str, Any]]]
+    full_schema_reask: NotRequired[Optional[bool]]
+
+
+class ValidateBatchRequest(TypedDict):
+    items: list[ValidateBatchItem]
+    # Stream results as NDJSON in completion order instead of one array
+    stream: NotRequired[Optional[bool]]
+    api_key: NotRequired[Optional[str]]
@@ -4,8 +4,12 @@ import guardrails_api.cli.start  # noqa
 from typing import Optional
 from guardrails_api.cli.cli import cli
 from guardrails_api.cli.db import db_command
+from guardrails_api.cli.guards import guards_command
 
 cli.add_typer(db_command, name="db", help="Manage database migrations.")
+cli.add_typer(
+    guards_command, name="guards", help="Import and export guards (PostgreSQL only)."
+)
 
 
 def version_callback(value: bool):
@@ -1,3 +1,5 @@
 from guardrails_api.cli.db.db import db_command  # noqa
 from guardrails_api.cli.db.upgrade import upgrade  # noqa
 from guardrails_api.cli.db.downgrade import downgrade  # noqa
+from guardrails_api.cli.db.compact_audit import compact_audit  # noqa
+from guardrails_api.cli.db.partition_audit import partition_audit  # noqa
@@ -0,0 +1,66 @@
+import os
+from typing import Annotated, Optional
+import typer
+from dotenv import load_dotenv
+from guardrails_api.cli.db.db import db_command
+from guardrails_api.db.audit_retention import (
+    DEFAULT_COMPACT_AUDIT_BATCH_SIZE,
+    compact_audit as compact_audit_db,
+    get_audit_retention_days,
+)
+from guardrails_api.db.postgres_client import PostgresClient
+
+
+@db_command.command(name="compact-audit")
+def compact_audit(
+    older_than_days: Annotated[
+        Optional[int],
+        typer.Option(
+            min=1,
+            help="Remove guard versions replaced more than this many days ago. Defaults to GUARD_AUDIT_RETENTION_DAYS.",
+        ),
+    ] = None,
+    batch_size: int = typer.Option(
+        default=DEFAULT_COMPACT_AUDIT_BATCH_SIZE,
+        min=1,
+        help="How many versions to delete per transaction.",
+    ),
+    archive: Annotated[
+        Optional[typer.FileBinaryWrite],
+        typer.Option(
+            help="An NDJSON file to append the removed versions to, or - for stdout."
+        ),
+    ] = None,
+    env: str = typer.Option(
+        default=".env",
+        help="An env file to load environment variables from.",
+    ),
+    env_override: bool = typer.Option(
+        default=False,
+        help="Override existing environment variables with values from the env file.",
+    ),
+):
+    """Removes old guard versions from the guards_audit table.
+
+    Versions are deleted in small batches, each in its own transaction,
+    so the guards table stays writable while this runs. If guards_audit
+    is partitioned, expired partitions are dropped whole. Run it
+    periodically, e.g. from cron.
+    """
+    env_file_path = os.path.abspath(env)
+    if os.path.isfile(env_file_path):
+        load_dotenv(env_file_path, override=env_override)
+
+    retention_days = older_than_days or get_audit_retention_days()
+    if retention_days is None:
+        raise typer.BadParameter(
+            "Pass --older-than-days or set GUARD_AUDIT_RETENTION_DAYS!",
+            param_hint="--older-than-days",
+        )
+
+    pg_client = PostgresClient()
+    pg_client.create_engines()
+    removed = compact_audit_db(
+        pg_client.engine, retention_days, batch_size=batch_size, archive=archive
+    )
+    typer.echo(f"Removed {removed} guard versions.", err=True)
@@ -0,0 +1,33 @@
+import os
+import typer
+from dotenv import load_dotenv
+from guardrails_api.cli.db.db import db_command
+from guardrails_api.db.audit_retention import partition_audit as partition_audit_db
+from guardrails_api.db.postgres_client import PostgresClient
+
+
+@db_command.command(name="partition-audit")
+def partition_audit(
+    env: str = typer.Option(
+        default=".env",
+        help="An env file to load environment variables from.",
+    ),
+    env_override: bool = typer.Option(
+        default=False,
+        help="Override existing environment variables with values from the env file.",
+    ),
+):
+    """Partitions the guards_audit table by month, so compact-audit can
+    drop expired months whole instead of deleting their rows.
+
+    The existing versions are kept in one partition without being
+    copied. Guards can't be written until this finishes, which takes as
+    long as one scan of guards_audit.
+    """
+    env_file_path = os.path.abspath(env)
+    if os.path.isfile(env_file_path):
+        load_dotenv(env_file_path, override=env_override)
+
+    pg_client = PostgresClient()
+    pg_client.create_engines()
+    partition_audit_db(pg_client.engine)
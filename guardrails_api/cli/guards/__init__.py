@@ -0,0 +1,3 @@
+from guardrails_api.cli.guards.guards import guards_command  # noqa
+from guardrails_api.cli.guards.import_guards import import_guards  # noqa
+from guardrails_api.cli.guards.export_guards import export_guards  # noqa
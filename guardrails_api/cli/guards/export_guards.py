@@ -0,0 +1,49 @@
+import os
+from typing import Annotated
+import typer
+from dotenv import load_dotenv
+from guardrails_api.cli.guards.guards import guards_command
+from guardrails_api.clients.pg_guard_client import PGGuardClient
+from guardrails_api.db.postgres_client import PostgresClient
+from guardrails_api.utils.guard_ndjson import dump_guard_line
+
+DEFAULT_EXPORT_BATCH_SIZE = 500
+
+
+@guards_command.command(name="export")
+def export_guards(
+    file: Annotated[
+        typer.FileBinaryWrite,
+        typer.Argument(help="The NDJSON file to write, or - for stdout."),
+    ] = "-",  # type: ignore
+    batch_size: int = typer.Option(
+        default=DEFAULT_EXPORT_BATCH_SIZE,
+        min=1,
+        help="How many guards to read from the database at a time.",
+    ),
+    env: str = typer.Option(
+        default=".env",
+        help="An env file to load environment variables from.",
+    ),
+    env_override: bool = typer.Option(
+        default=False,
+        help="Override existing environment variables with values from the env file.",
+    ),
+):
+    """Writes every guard as NDJSON, one guard per line, ordered by name.
+
+    The output can be loaded into another database with
+    guardrails-api guards import.
+    """
+    env_file_path = os.path.abspath(env)
+    if os.path.isfile(env_file_path):
+        load_dotenv(env_file_path, override=env_override)
+
+    PostgresClient().create_engines()
+    guard_client = PGGuardClient()
+    after = None
+    while True:
+        guards, after = guard_client.list_guards(limit=batch_size, after=after)
+        file.write(b"".join(dump_guard_line(guard) for guard in guards))
+        if after is None:
+            break
@@ -0,0 +1,3 @@
+import typer
+
+guards_command = typer.Typer()
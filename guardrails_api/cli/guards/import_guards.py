@@ -0,0 +1,56 @@
+import os
+from typing import Annotated
+import typer
+from dotenv import load_dotenv
+from guardrails_api.cli.guards.guards import guards_command
+from guardrails_api.clients.pg_guard_client import PGGuardClient
+from guardrails_api.db.postgres_client import PostgresClient
+from guardrails_api.utils.guard_ndjson import INVALID, WRITTEN, GuardImport
+
+
+@guards_command.command(name="import")
+def import_guards(
+    file: Annotated[
+        typer.FileBinaryRead,
+        typer.Argument(help="An NDJSON file of guards, or - for stdin."),
+    ] = "-",  # type: ignore
+    overwrite: bool = typer.Option(
+        default=True,
+        help="Replace guards that already exist instead of reporting them as conflicts.",
+    ),
+    env: str = typer.Option(
+        default=".env",
+        help="An env file to load environment variables from.",
+    ),
+    env_override: bool = typer.Option(
+        default=False,
+        help="Override existing environment variables with values from the env file.",
+    ),
+):
+    """Creates or replaces guards from NDJSON, one guard per line, in one
+    transaction.
+
+    Lines that were not written are reported on stderr.  Exits with 1 if
+    any line is not a valid guard.
+    """
+    env_file_path = os.path.abspath(env)
+    if os.path.isfile(env_file_path):
+        load_dotenv(env_file_path, override=env_override)
+
+    guard_import = GuardImport()
+    for line in file:
+        guard_import.add_line(line)
+
+    PostgresClient().create_engines()
+    written = PGGuardClient().upsert_guards(guard_import.guards, overwrite)  # type: ignore
+    guard_import.add_written(written)
+
+    for result in guard_import.results:
+        if result["status"] != WRITTEN:
+            typer.echo(guard_import.dump_result(result), err=True, nl=False)
+    counts = guard_import.counts()
+    typer.echo(
+        ", ".join(f"{count} {status}" for status, count in counts.items()), err=True
+    )
+    if counts[INVALID]:
+        raise typer.Exit(code=1)
@@ -0,0 +1,203 @@
+from contextlib import asynccontextmanager
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import Row, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from guardrails_api.classes.http_error import HttpError
+from guardrails_api.clients.guard_client import GuardPage
+from guardrails_api.clients.pg_guard_client import (
+    BasePGGuardClient,
+    delete_guard_statement,
+    from_guard_item,
+    guard_as_of_query,
+    insert_guard_statement,
+    list_guards_query,
+    to_guard_id,
+    to_guard_page,
+    to_guard_row,
+    to_upsert_batches,
+    update_guard_statement,
+    upsert_guards_statement,
+)
+from guardrails_api.db.models.guard_item import GuardItem
+from guardrails_ai.types import CreateGuardRequest, Guard
+
+UNIQUE_VIOLATION = "23505"
+
+
+def is_unique_violation(error: IntegrityError) -> bool:
+    # psycopg exposes the SQLSTATE as pgcode/sqlstate, asyncpg as sqlstate
+    orig = error.orig
+    code = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    return code == UNIQUE_VIOLATION
+
+
+class AsyncPGGuardClient(BasePGGuardClient):
+    """The async counterpart of PGGuardClient. Its controller facing
+    methods are coroutines backed by SQLAlchemy's async engine, so guard
+    reads and writes do not block the event loop."""
+
+    @asynccontextmanager
+    async def get_async_db_context(self, read_only: bool = False):
+        db: AsyncSession
+        if read_only and self.read_from_replica():
+            db = self.pgClient.AsyncReplicaSessionLocal()
+        else:
+            db = self.pgClient.AsyncSessionLocal()
+        try:
+            yield db
+        finally:
+            await db.close()
+
+    # These are only internal utilities and do not start db sessions
+
+    async def util_write_guards(
+        self, statements: list, db: AsyncSession, conflict_cause: str
+    ) -> List[Row]:
+        try:
+            rows = [
+                row for statement in statements for row in await db.execute(statement)
+            ]
+            await db.commit()
+            self.mark_write()
+            return rows
+        except IntegrityError as ie:
+            if is_unique_violation(ie):
+                raise HttpError(
+                    status=409,
+                    message="Conflict",
+                    cause=conflict_cause,
+                )
+            raise ie
+
+    async def util_create_guard(
+        self, guard: Guard | CreateGuardRequest, db: AsyncSession
+    ) -> Guard:
+        (guard_item,) = await self.util_write_guards(
+            [insert_guard_statement(to_guard_row(to_guard_id(guard), guard))],
+            db,
+            f"A Guard with the name {guard.name} already exists!",
+        )
+        return from_guard_item(guard_item)
+
+    # Below are used directly by Controllers and start db sessions
+
+    async def get_guard(self, id: str, as_of_date: Optional[str] = None) -> Guard:
+        if as_of_date is not None:
+            historical_guard = self.util_get_historical_guard(id, as_of_date)
+            if historical_guard is not None:
+                return historical_guard
+            guard, historical = await self.util_load_guard_as_of(id, as_of_date)
+            if historical:
+                self.util_cache_historical_guard(id, as_of_date, guard)
+            return guard
+
+        cached_guard, generation = self.util_get_cached_guard(id)
+        if cached_guard is not None:
+            return cached_guard
+
+        guard = await self.util_load_guard(id)
+        self.util_cache_guard(id, guard, generation)
+        return guard
+
+    async def util_load_guard(self, id: str) -> Guard:
+        async with self.get_async_db_context(read_only=True) as db:
+            guard_item = await db.get(GuardItem, id)
+            if guard_item is None:
+                raise HttpError(
+                    status=404,
+                    message="NotFound",
+                    cause="A Guard with the id {id} does not exist!".format(id=id),
+                )
+            return from_guard_item(guard_item)
+
+    async def util_load_guard_as_of(
+        self, id: str, as_of_date: str
+    ) -> Tuple[Guard, bool]:
+        async with self.get_async_db_context(read_only=True) as db:
+            guard_item = (await db.execute(guard_as_of_query(id, as_of_date))).first()
+            if guard_item is None:
+                raise HttpError(
+                    status=404,
+                    message="NotFound",
+                    cause="A Guard with the id {id} does not exist!".format(id=id),
+                )
+            return from_guard_item(guard_item), guard_item.historical  # type: ignore
+
+    async def get_guards(self, guard_name: Optional[str] = None) -> List[Guard]:
+        async with self.get_async_db_context(read_only=True) as db:
+            query = select(GuardItem)
+            if guard_name:
+                query = query.filter_by(name=guard_name)
+            guard_items = (await db.scalars(query)).all()
+            return [from_guard_item(gi) for gi in guard_items]
+
+    async def list_guards(
+        self,
+        guard_name: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[str, str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> GuardPage:
+        query = list_guards_query(guard_name, limit, after, fields)
+        async with self.get_async_db_context(read_only=True) as db:
+            if fields:
+                rows = (await db.execute(query)).all()
+            else:
+                rows = (await db.scalars(query)).all()
+            return to_guard_page(rows, limit, fields)
+
+    async def create_guard(self, guard: Guard | CreateGuardRequest) -> Guard:
+        async with self.get_async_db_context() as db:
+            return await self.util_create_guard(guard, db)
+
+    async def update_guard(self, id: str, guard: Guard) -> Guard:
+        async with self.get_async_db_context() as db:
+            guard_items = await self.util_write_guards(
+                [update_guard_statement(id, guard)],
+                db,
+                f"A Guard with the name {guard.name} already exists!",
+            )
+            if not guard_items:
+                raise HttpError(
+                    status=404,
+                    message="NotFound",
+                    cause="A Guard with the id {id} does not exist!".format(id=id),
+                )
+            self.evict_guard(id)
+            return from_guard_item(guard_items[0])
+
+    async def upsert_guard(self, id: str, guard: Guard | CreateGuardRequest) -> Guard:
+        async with self.get_async_db_context() as db:
+            (guard_item,) = await self.util_write_guards(
+                [upsert_guards_statement([to_guard_row(id, guard)])],
+                db,
+                f"A Guard with the name {guard.name} already exists!",
+            )
+            self.evict_guard(id)
+            return from_guard_item(guard_item)
+
+    async def upsert_guards(
+        self, guards: Sequence[Guard | CreateGuardRequest], overwrite: bool = True
+    ) -> List[Optional[Guard]]:
+        ids, batches = to_upsert_batches(guards)
+        async with self.get_async_db_context() as db:
+            guard_items = await self.util_write_guards(
+                [upsert_guards_statement(batch, overwrite) for batch in batches],
+                db,
+                "Guards conflict with existing guards!",
+            )
+        return self.util_to_upserted_guards(ids, guard_items)
+
+    async def delete_guard(self, id: str) -> Guard:
+        async with self.get_async_db_context() as db:
+            guard_items = (await db.execute(delete_guard_statement(id))).all()
+            await db.commit()
+            if not guard_items:
+                raise HttpError(
+                    status=404,
+                    message="NotFound",
+                    cause="A Guard with the id {id} does not exist!".format(id=id),
+                )
+            self.evict_guard(id)
+            return from_guard_item(guard_items[0])
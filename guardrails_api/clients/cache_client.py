@@ -1,8 +1,61 @@
+import os
 import threading
+from typing import Any, Dict
+from urllib.parse import unquote, urlparse
+
 from aiocache import caches
 
+from guardrails_api.clients.cache_serializer import (
+    DEFAULT_CACHE_COMPRESSION_LEVEL,
+    CacheSerializer,
+    get_cache_compression,
+)
+from guardrails_api.clients.memory_cache import MemoryCache
+from guardrails_api.utils.get_int_env_var import get_int_env_var
+
+MEMORY_CACHE_BACKEND = "memory"
+REDIS_CACHE_BACKEND = "redis"
+CACHE_BACKENDS = {MEMORY_CACHE_BACKEND, REDIS_CACHE_BACKEND}
+
+DEFAULT_CACHE_URL = "redis://localhost:6379/0"
+DEFAULT_CACHE_NAMESPACE = "guardrails-api"
+DEFAULT_CACHE_POOL_MAX_SIZE = 10
+DEFAULT_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+
+def get_cache_backend() -> str:
+    backend = os.environ.get("CACHE_BACKEND", MEMORY_CACHE_BACKEND).lower()
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(
+            f"Invalid value for environment variable CACHE_BACKEND: {backend}! CACHE_BACKEND must be one of {sorted(CACHE_BACKENDS)}!"
+        )
+    return backend
+
+
+def get_redis_cache_config() -> Dict[str, Any]:
+    # Any Redis protocol compatible server works, e.g. Valkey or KeyDB
+    url = urlparse(os.environ.get("CACHE_URL", DEFAULT_CACHE_URL))
+    pool_max_size = get_int_env_var("CACHE_POOL_MAX_SIZE")
+    return {
+        "cache": "aiocache.RedisCache",
+        "endpoint": url.hostname or "localhost",
+        "port": url.port or 6379,
+        "db": int(url.path.lstrip("/") or 0),
+        "password": unquote(url.password) if url.password else None,
+        "ssl": url.scheme == "rediss",
+        # Connections are pooled per worker and shared by every request
+        "pool_max_size": pool_max_size or DEFAULT_CACHE_POOL_MAX_SIZE,
+    }
+
 
 class CacheClient:
+    """Key value cache shared by the API, e.g. for validation history.
+
+    The default in-memory backend is per worker and bounded by
+    CACHE_MAX_BYTES. Set CACHE_BACKEND=redis to share entries across
+    workers and nodes.
+    """
+
     _instance = None
     _lock = threading.Lock()
 
@@ -14,25 +67,86 @@ class CacheClient:
         return cls._instance
 
     def initialize(self):
+        self.backend = get_cache_backend()
+        namespace = os.environ.get("CACHE_NAMESPACE", DEFAULT_CACHE_NAMESPACE)
+        compression_level = get_int_env_var("CACHE_COMPRESSION_LEVEL")
+        serializer_config = {
+            "compression": get_cache_compression(),
+            "compression_level": compression_level or DEFAULT_CACHE_COMPRESSION_LEVEL,
+        }
+        if self.backend == MEMORY_CACHE_BACKEND:
+            max_bytes = get_int_env_var("CACHE_MAX_BYTES")
+            self.cache = MemoryCache(
+                DEFAULT_CACHE_MAX_BYTES if max_bytes is None else max_bytes,
+                namespace,
+                CacheSerializer(**serializer_config),
+            )
+            return
+        try:
+            import redis  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "CACHE_BACKEND=redis requires the redis package! Install it with pip install 'guardrails-api[redis]'."
+            )
         caches.set_config(
             {
                 "default": {
-                    "cache": "aiocache.SimpleMemoryCache",
-                    "serializer": {"class": "aiocache.serializers.JsonSerializer"},
+                    **get_redis_cache_config(),
+                    "namespace": namespace,
+                    "serializer": {"class": CacheSerializer, **serializer_config},
                     "ttl": 300,
                 }
             }
         )
         self.cache = caches.get("default")
 
+    def stats(self) -> Dict[str, int]:
+        """Size, entry count and eviction counters of the memory backend;
+        Redis reports these itself, e.g. with INFO memory."""
+        if isinstance(self.cache, MemoryCache):
+            return self.cache.stats()
+        return {}
+
     async def get(self, key: str):
         return await self.cache.get(key)  # type: ignore
 
-    async def set(self, key: str, value: str, ttl: int):
+    async def set(self, key: str, value: Any, ttl: int):
         await self.cache.set(key, value, ttl=ttl)  # type: ignore
 
+    async def multi_get(self, keys: list[str]) -> list:
+        return await self.cache.multi_get(keys)  # type: ignore
+
+    async def multi_set(self, pairs: list[tuple[str, Any]], ttl: int):
+        await self.cache.multi_set(pairs, ttl=ttl)  # type: ignore
+
+    async def get_list(self, key: str) -> list[str]:
+        if isinstance(self.cache, MemoryCache):
+            return await self.cache.get(key) or []
+        values = await self.cache.client.lrange(self.cache.build_key(key), 0, -1)  # type: ignore
+        return [value.decode() for value in values]
+
+    async def append_to_list(
+        self, key: str, values: list[str], max_length: int, ttl: int
+    ):
+        """Appends values to the list at key, keeping its last max_length
+        values.
+
+        The append is atomic, so writers in other workers sharing Redis
+        don't drop each other's values.
+        """
+        if isinstance(self.cache, MemoryCache):
+            await self.cache.append(key, values, max_length, ttl)
+            return
+        redis_key = self.cache.build_key(key)  # type: ignore
+        async with self.cache.client.pipeline(transaction=True) as pipeline:  # type: ignore
+            pipeline.rpush(redis_key, *values)
+            pipeline.ltrim(redis_key, -max_length, -1)
+            pipeline.expire(redis_key, ttl)
+            await pipeline.execute()
+
     async def delete(self, key: str):
         await self.cache.delete(key)  # type: ignore
 
     async def clear(self):
-        await self.cache.clear()  # type: ignore
+        # Only clear our namespace; a shared Redis may hold other data
+        await self.cache.clear(namespace=self.cache.namespace)  # type: ignore
@@ -0,0 +1,79 @@
+import os
+from typing import Any, Optional
+
+import msgpack
+from aiocache.serializers import BaseSerializer
+
+NO_CACHE_COMPRESSION = "none"
+ZSTD_CACHE_COMPRESSION = "zstd"
+CACHE_COMPRESSIONS = {NO_CACHE_COMPRESSION, ZSTD_CACHE_COMPRESSION}
+
+DEFAULT_CACHE_COMPRESSION_LEVEL = 3
+# Smaller payloads don't shrink enough to be worth compressing
+MIN_COMPRESSED_SIZE = 256
+
+# The first byte of every value says how the msgpack payload after it is
+# stored, so values stay readable when the compression setting changes
+RAW_HEADER = b"\x00"
+ZSTD_HEADER = b"\x01"
+
+
+def get_cache_compression() -> str:
+    compression = os.environ.get("CACHE_COMPRESSION", NO_CACHE_COMPRESSION).lower()
+    if compression not in CACHE_COMPRESSIONS:
+        raise ValueError(
+            f"Invalid value for environment variable CACHE_COMPRESSION: {compression}! CACHE_COMPRESSION must be one of {sorted(CACHE_COMPRESSIONS)}!"
+        )
+    return compression
+
+
+def import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "CACHE_COMPRESSION=zstd requires the zstandard package! Install it with pip install 'guardrails-api[zstd]'."
+        )
+    return zstandard
+
+
+class CacheSerializer(BaseSerializer):
+    """Encodes cache values as msgpack, optionally compressed with zstd.
+
+    Values are encoded once, straight from Python objects, instead of
+    being JSON encoded by the caller and again by the cache.
+    """
+
+    # Values are bytes; tell aiocache not to decode them
+    DEFAULT_ENCODING = None
+
+    def __init__(
+        self,
+        *args,
+        compression: str = NO_CACHE_COMPRESSION,
+        compression_level: int = DEFAULT_CACHE_COMPRESSION_LEVEL,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.compression = compression
+        self.compressor = None
+        self.decompressor = None
+        if compression == ZSTD_CACHE_COMPRESSION:
+            zstandard = import_zstandard()
+            self.compressor = zstandard.ZstdCompressor(level=compression_level)
+
+    def dumps(self, value: Any) -> bytes:
+        packed = msgpack.packb(value, use_bin_type=True)
+        if self.compressor is None or len(packed) < MIN_COMPRESSED_SIZE:
+            return RAW_HEADER + packed
+        return ZSTD_HEADER + self.compressor.compress(packed)
+
+    def loads(self, value: Optional[bytes]) -> Any:
+        if value is None:
+            return None
+        header, payload = value[:1], value[1:]
+        if header == ZSTD_HEADER:
+            if self.decompressor is None:
+                self.decompressor = import_zstandard().ZstdDecompressor()
+            payload = self.decompressor.decompress(payload)
+        return msgpack.unpackb(payload, raw=False)
@@ -1,8 +1,13 @@
 import importlib
 from guardrails import Guard, AsyncGuard
+from guardrails_api.clients.async_pg_guard_client import AsyncPGGuardClient
 from guardrails_api.clients.memory_guard_client import MemoryGuardClient
 from guardrails_api.clients.pg_guard_client import PGGuardClient
-from guardrails_api.db.postgres_client import postgres_is_enabled
+from guardrails_api.db.postgres_client import (
+    postgres_async_is_enabled,
+    postgres_is_enabled,
+)
+from guardrails_api.utils.guard_history import bound_guard_history
 
 
 guard_client = None
@@ -13,7 +18,9 @@ def get_guard_client():
 
     if not guard_client:
         # if no pg_host is set, use in memory guards
-        if postgres_is_enabled():
+        if postgres_async_is_enabled():
+            guard_client = AsyncPGGuardClient()
+        elif postgres_is_enabled():
             guard_client = PGGuardClient()
         else:
             guard_client = MemoryGuardClient()
@@ -28,6 +35,6 @@ def get_guard_client():
                 export = getattr(config, export_name)
                 is_guard = isinstance(export, Guard) or isinstance(export, AsyncGuard)
                 if is_guard:
-                    guard_client.guards[export.id] = export
+                    guard_client.guards[export.id] = bound_guard_history(export)
 
     return guard_client
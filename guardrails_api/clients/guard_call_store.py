@@ -0,0 +1,187 @@
+import asyncio
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from guardrails.classes.history import Call
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from guardrails_api.classes.http_error import HttpError
+from guardrails_api.db.models.guard_call_item import GuardCallItem
+from guardrails_api.db.postgres_client import (
+    PostgresClient,
+    postgres_async_is_enabled,
+    postgres_is_enabled,
+)
+from guardrails_api.utils import cursor
+from guardrails_api.utils.batch_writer import BatchWriter
+from guardrails_api.utils.get_int_env_var import get_int_env_var
+
+DEFAULT_GUARD_CALLS_QUEUE_SIZE = 1000
+DEFAULT_GUARD_CALLS_BATCH_SIZE = 100
+DEFAULT_GUARD_CALLS_PAGE_SIZE = 50
+MAX_GUARD_CALLS_PAGE_SIZE = 500
+
+
+def guard_calls_is_enabled() -> bool:
+    return (
+        os.environ.get("GUARD_CALLS_ENABLED", "false").lower() == "true"
+        and postgres_is_enabled()
+    )
+
+
+def encode_cursor(created_at: datetime, call_id: str) -> str:
+    return cursor.encode_cursor(created_at.isoformat(), call_id)
+
+
+def decode_cursor(encoded_cursor: str) -> Tuple[datetime, str]:
+    created_at, call_id = cursor.decode_cursor(encoded_cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), call_id
+    except ValueError:
+        raise HttpError(
+            status=400,
+            message="BadRequest",
+            cause=f"Invalid cursor {encoded_cursor}!",
+        )
+
+
+def from_guard_call_item(guard_call_item: GuardCallItem) -> Dict[str, Any]:
+    return {
+        "id": guard_call_item.id,
+        "guardId": guard_call_item.guard_id,
+        "createdAt": guard_call_item.created_at.isoformat(),  # type: ignore
+        "call": guard_call_item.call,
+    }
+
+
+class GuardCallStore:
+    """Durably records validation calls in the guard_calls table.
+
+    Like the GuardHistoryStore, record() only enqueues the call and a
+    background writer inserts queued calls in batches, one statement per
+    batch. Calls are dropped while the queue is full, unless
+    GUARD_CALLS_QUEUE_SIZE is 0.
+
+    Requires Postgres and GUARD_CALLS_ENABLED=true.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:  # Double-checked locking
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def initialize(self):
+        self.enabled = guard_calls_is_enabled()
+        self.pg_client = PostgresClient()
+        queue_size = get_int_env_var("GUARD_CALLS_QUEUE_SIZE")
+        if queue_size is None:
+            queue_size = DEFAULT_GUARD_CALLS_QUEUE_SIZE
+        batch_size = get_int_env_var("GUARD_CALLS_BATCH_SIZE")
+        self.batch_writer: BatchWriter[Tuple[str, Call]] = BatchWriter(
+            self.write_batch,
+            queue_size,
+            batch_size or DEFAULT_GUARD_CALLS_BATCH_SIZE,
+            "guard_calls",
+        )
+
+    def record(self, guard_id: str, call: Call):
+        """Queues the call to be inserted by the background writer."""
+        self.batch_writer.add((guard_id, call))
+
+    async def write_batch(self, batch: List[Tuple[str, Call]]):
+        rows = [
+            {
+                "id": call.id,
+                "guard_id": guard_id,
+                "call": call.model_dump(mode="json", exclude_none=True, by_alias=True),
+            }
+            for guard_id, call in batch
+        ]
+        await self.insert(rows)
+
+    async def flush(self):
+        """Inserts every queued call and stops the writer."""
+        await self.batch_writer.flush()
+
+    # These run the queries on the async engine when it is configured and
+    # on the sync engine in a thread otherwise. A call that is already
+    # stored is skipped instead of failing the rest of its batch.
+
+    def util_insert(self, rows: List[Dict[str, Any]]):
+        with self.pg_client.SessionLocal() as db:
+            db.execute(insert(GuardCallItem).on_conflict_do_nothing(), rows)
+            db.commit()
+
+    async def insert(self, rows: List[Dict[str, Any]]):
+        if not postgres_async_is_enabled():
+            return await asyncio.to_thread(self.util_insert, rows)
+        async with self.pg_client.AsyncSessionLocal() as db:
+            await db.execute(insert(GuardCallItem).on_conflict_do_nothing(), rows)
+            await db.commit()
+
+    def util_scalars(self, query) -> List[GuardCallItem]:
+        with self.pg_client.SessionLocal() as db:
+            return list(db.scalars(query).all())
+
+    async def scalars(self, query) -> List[GuardCallItem]:
+        if not postgres_async_is_enabled():
+            return await asyncio.to_thread(self.util_scalars, query)
+        async with self.pg_client.AsyncSessionLocal() as db:
+            return list((await db.scalars(query)).all())
+
+    async def get_call(self, guard_id: str, call_id: str) -> Dict[str, Any]:
+        guard_call_items = await self.scalars(
+            select(GuardCallItem).filter_by(id=call_id, guard_id=guard_id)
+        )
+        if not guard_call_items:
+            raise HttpError(
+                status=404,
+                message="NotFound",
+                cause=f"A call with the id {call_id} does not exist for the Guard {guard_id}!",
+            )
+        return from_guard_call_item(guard_call_items[0])
+
+    async def get_calls(
+        self,
+        guard_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = DEFAULT_GUARD_CALLS_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Returns a page of the guard's calls, newest first, recorded at
+        or after start and before end. Pass the returned nextCursor to get
+        the next page."""
+        # Served by the (guard_id, created_at) index
+        query = select(GuardCallItem).filter_by(guard_id=guard_id)
+        if start is not None:
+            query = query.filter(GuardCallItem.created_at >= start)
+        if end is not None:
+            query = query.filter(GuardCallItem.created_at < end)
+        if cursor is not None:
+            query = query.filter(
+                tuple_(GuardCallItem.created_at, GuardCallItem.id)
+                < tuple_(*decode_cursor(cursor))
+            )
+        query = query.order_by(
+            GuardCallItem.created_at.desc(), GuardCallItem.id.desc()
+        ).limit(limit + 1)
+        guard_call_items = await self.scalars(query)
+
+        next_cursor = None
+        if len(guard_call_items) > limit:
+            guard_call_items = guard_call_items[:limit]
+            last = guard_call_items[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)  # type: ignore
+        return {
+            "calls": [from_guard_call_item(gci) for gci in guard_call_items],
+            "nextCursor": next_cursor,
+        }
@@ -1,6 +1,20 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from guardrails_ai.types import Guard, CreateGuardRequest
 
+# Guard row columns that list_guards can project instead of whole guards
+GUARD_LIST_FIELDS = (
+    "id",
+    "name",
+    "created_by",
+    "created_at",
+    "updated_by",
+    "updated_at",
+)
+
+# A page of guards, or of projected fields, and the (name, id) of its last
+# guard when there are more
+GuardPage = Tuple[List[Guard] | List[Dict[str, Any]], Optional[Tuple[str, str]]]
+
 
 class GuardClient:
     def __init__(self):
@@ -12,6 +26,18 @@ class GuardClient:
     def get_guards(self, guard_name: Optional[str] = None) -> List[Guard]:
         raise NotImplementedError
 
+    def list_guards(
+        self,
+        guard_name: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[str, str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> GuardPage:
+        """Returns up to limit guards ordered by (name, id), starting after
+        the given (name, id). When fields are given only those are read and
+        returned, as dicts, instead of whole guards."""
+        raise NotImplementedError
+
     def create_guard(self, guard: CreateGuardRequest) -> Guard:
         raise NotImplementedError
 
@@ -21,5 +47,13 @@ class GuardClient:
     def upsert_guard(self, id: str, guard: Guard | CreateGuardRequest) -> Guard:
         raise NotImplementedError
 
+    def upsert_guards(
+        self, guards: List[Guard | CreateGuardRequest], overwrite: bool = True
+    ) -> List[Optional[Guard]]:
+        """Creates or replaces every guard in one transaction and returns
+        them in order. Unless overwrite, existing guards are left as they
+        are and returned as None."""
+        raise NotImplementedError
+
     def delete_guard(self, id: str) -> Guard:
         raise NotImplementedError
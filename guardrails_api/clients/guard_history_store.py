@@ -0,0 +1,98 @@
+import threading
+from typing import Any, Dict, List, Tuple
+
+from guardrails.classes.history import Call
+
+from guardrails_api.clients.cache_client import CacheClient
+from guardrails_api.utils.batch_writer import BatchWriter
+from guardrails_api.utils.get_int_env_var import get_int_env_var
+from guardrails_api.utils.guard_history import get_guard_history_max_length
+
+DEFAULT_GUARD_HISTORY_TTL = 300
+DEFAULT_GUARD_HISTORY_QUEUE_SIZE = 1000
+DEFAULT_GUARD_HISTORY_BATCH_SIZE = 100
+
+
+class GuardHistoryStore:
+    """Records validation calls for GET /guards/{id}/history/{call_id}.
+
+    Each call is serialized once and stored under its own key, and every
+    guard keeps an index of its latest call ids. The history of a call is
+    rebuilt from the index instead of storing a copy of the guard's whole
+    history with every call.
+
+    Calls are recorded off of the response path: record() only enqueues
+    the call and a background writer serializes and stores queued calls
+    in batches. Calls are dropped while the queue is full, unless
+    GUARD_HISTORY_QUEUE_SIZE is 0.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:  # Double-checked locking
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def initialize(self):
+        self.cache_client = CacheClient()
+        self.ttl = DEFAULT_GUARD_HISTORY_TTL
+        self.max_length = get_guard_history_max_length()
+        queue_size = get_int_env_var("GUARD_HISTORY_QUEUE_SIZE")
+        if queue_size is None:
+            queue_size = DEFAULT_GUARD_HISTORY_QUEUE_SIZE
+        batch_size = get_int_env_var("GUARD_HISTORY_BATCH_SIZE")
+        self.batch_writer: BatchWriter[Tuple[str, Call]] = BatchWriter(
+            self.write_batch,
+            queue_size,
+            batch_size or DEFAULT_GUARD_HISTORY_BATCH_SIZE,
+            "guard_history",
+        )
+
+    def get_call_key(self, guard_id: str, call_id: str) -> str:
+        return f"{guard_id}-{call_id}"
+
+    def get_index_key(self, guard_id: str) -> str:
+        return f"{guard_id}-history"
+
+    async def get_index(self, guard_id: str) -> List[str]:
+        return await self.cache_client.get_list(self.get_index_key(guard_id))
+
+    def record(self, guard_id: str, call: Call):
+        """Queues the call to be stored by the background writer."""
+        self.batch_writer.add((guard_id, call))
+
+    async def write_batch(self, batch: List[Tuple[str, Call]]):
+        pairs = []
+        call_ids: Dict[str, List[str]] = {}
+        for guard_id, call in batch:
+            # The cache serializer encodes the dict itself
+            serialized_call = call.model_dump(
+                mode="json", exclude_none=True, by_alias=True
+            )
+            pairs.append((self.get_call_key(guard_id, call.id), serialized_call))
+            call_ids.setdefault(guard_id, []).append(call.id)
+        await self.cache_client.multi_set(pairs, self.ttl)
+        # Every worker has its own writer, so indexes shared through
+        # Redis are appended to atomically rather than read and rewritten
+        for guard_id, ids in call_ids.items():
+            await self.cache_client.append_to_list(
+                self.get_index_key(guard_id), ids, self.max_length, self.ttl
+            )
+
+    async def flush(self):
+        """Stores every queued call and stops the writer."""
+        await self.batch_writer.flush()
+
+    async def get_history(self, guard_id: str, call_id: str) -> List[Dict[str, Any]]:
+        """Returns the guard's calls up to and including call_id, oldest
+        first, or just the call if it has fallen out of the index."""
+        index = await self.get_index(guard_id)
+        call_ids = index[: index.index(call_id) + 1] if call_id in index else [call_id]
+        cached_calls = await self.cache_client.multi_get(
+            [self.get_call_key(guard_id, id) for id in call_ids]
+        )
+        return [c for c in cached_calls if c is not None]
@@ -0,0 +1,85 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from guardrails import AsyncGuard
+from guardrails_ai.types import Guard as IGuard
+
+from guardrails_api.utils.get_int_env_var import get_int_env_var
+from guardrails_api.utils.guard_history import bound_guard_history
+
+DEFAULT_GUARD_CACHE_MAX_SIZE = 128
+
+
+def get_guard_version(guard_struct: IGuard) -> str:
+    """Returns a content hash of the guard definition.
+
+    History is excluded since it changes on every call without changing
+    how the guard is hydrated.
+    """
+    guard_dict = guard_struct.model_dump(exclude_none=True, exclude={"history"})
+    serialized = json.dumps(guard_dict, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+class HydratedGuardCache:
+    """A per-worker LRU cache of AsyncGuards keyed by guard id.
+
+    Each entry remembers the version it was hydrated from so that a
+    changed guard definition is rehydrated instead of served stale.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:  # Double-checked locking
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def initialize(self):
+        max_size = get_int_env_var("GUARD_CACHE_MAX_SIZE")
+        self.max_size = DEFAULT_GUARD_CACHE_MAX_SIZE if max_size is None else max_size
+        self.guards: OrderedDict[str, Tuple[str, AsyncGuard]] = OrderedDict()
+        self.entries_lock = threading.Lock()
+
+    def get(self, id: str, version: str) -> Optional[AsyncGuard]:
+        with self.entries_lock:
+            entry = self.guards.get(id)
+            if entry is None or entry[0] != version:
+                return None
+            self.guards.move_to_end(id)
+            return entry[1]
+
+    def set(self, id: str, version: str, guard: AsyncGuard):
+        if self.max_size <= 0:
+            return
+        with self.entries_lock:
+            self.guards[id] = (version, guard)
+            self.guards.move_to_end(id)
+            while len(self.guards) > self.max_size:
+                self.guards.popitem(last=False)
+
+    def hydrate(self, guard_struct: IGuard, version: str) -> AsyncGuard:
+        """Returns a cached AsyncGuard for the guard struct at the given
+        version (see get_guard_version), hydrating and caching a new one
+        if the cached entry is missing or stale."""
+        guard = self.get(guard_struct.id, version)  # type: ignore
+        if guard is None:
+            guard = bound_guard_history(
+                AsyncGuard.from_dict(guard_struct.model_dump(exclude_none=True))  # type: ignore
+            )
+            self.set(guard_struct.id, version, guard)  # type: ignore
+        return guard  # type: ignore
+
+    def invalidate(self, id: str):
+        with self.entries_lock:
+            self.guards.pop(id, None)
+
+    def clear(self):
+        with self.entries_lock:
+            self.guards.clear()
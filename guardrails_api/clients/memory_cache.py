@@ -0,0 +1,76 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from guardrails_api.clients.cache_serializer import CacheSerializer
+from guardrails_api.utils.byte_lru_cache import ByteLRUCache
+from guardrails_api.utils.metrics import Metrics
+
+
+class MemoryCache:
+    """The per worker CacheClient backend.
+
+    Values are encoded with the same serializer as the Redis backend and
+    kept in a ByteLRUCache, so a burst of large entries evicts the least
+    recently used ones instead of growing the worker without bound.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        namespace: Optional[str] = None,
+        serializer: Optional[CacheSerializer] = None,
+    ):
+        self.namespace = namespace
+        self.serializer = serializer or CacheSerializer()
+        self.entries = ByteLRUCache(max_bytes)
+        self.metrics = Metrics()
+
+    def get_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}" if self.namespace else key
+
+    def util_set(self, key: str, value: Any, ttl: Optional[int]):
+        self.entries.set(self.get_key(key), self.serializer.dumps(value), ttl or None)
+
+    def util_report(self, evictions: int):
+        if self.entries.evictions > evictions:
+            self.metrics.increment(
+                "cache_evictions_total", self.entries.evictions - evictions
+            )
+        self.metrics.set_gauge("cache_bytes", self.entries.total_bytes)
+        self.metrics.set_gauge("cache_entries", len(self.entries))
+
+    async def get(self, key: str) -> Any:
+        value = self.entries.get(self.get_key(key))
+        return self.serializer.loads(value)
+
+    async def multi_get(self, keys: List[str]) -> List[Any]:
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        evictions = self.entries.evictions
+        self.util_set(key, value, ttl)
+        self.util_report(evictions)
+
+    async def multi_set(self, pairs: List[Tuple[str, Any]], ttl: Optional[int] = None):
+        evictions = self.entries.evictions
+        for key, value in pairs:
+            self.util_set(key, value, ttl)
+        self.util_report(evictions)
+
+    async def append(self, key: str, values: List[Any], max_length: int, ttl: int):
+        # Nothing awaits between the read and the write, so appends from
+        # concurrent tasks can't interleave
+        evictions = self.entries.evictions
+        value = self.serializer.loads(self.entries.get(self.get_key(key))) or []
+        self.util_set(key, (value + values)[-max_length:], ttl)
+        self.util_report(evictions)
+
+    async def delete(self, key: str):
+        self.entries.delete(self.get_key(key))
+        self.util_report(self.entries.evictions)
+
+    async def clear(self, namespace: Optional[str] = None):
+        self.entries.clear()
+        self.util_report(self.entries.evictions)
+
+    def stats(self) -> Dict[str, int]:
+        return self.entries.stats()
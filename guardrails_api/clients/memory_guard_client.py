@@ -1,8 +1,8 @@
-from typing import Optional, Sequence
+from typing import List, Optional, Sequence, Tuple
 
 from guardrails import AsyncGuard, Guard
 from guardrails_api.classes.http_error import HttpError
-from guardrails_api.clients.guard_client import GuardClient
+from guardrails_api.clients.guard_client import GuardClient, GuardPage
 
 
 class MemoryGuardClient(GuardClient):
@@ -31,3 +31,24 @@ class MemoryGuardClient(GuardClient):
             return [g for g in list(self.guards.values()) if g.name == guard_name]
         else:
             return [g for g in list(self.guards.values())]
+
+    def list_guards(
+        self,
+        guard_name: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[str, str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> GuardPage:
+        guards = sorted(self.get_guards(guard_name), key=lambda g: (g.name, g.id))
+        if after is not None:
+            guards = [g for g in guards if (g.name, g.id) > after]
+        next_after = None
+        if limit is not None and len(guards) > limit:
+            guards = guards[:limit]
+            next_after = (guards[-1].name, guards[-1].id)
+        if fields:
+            # Guards from config.py have no created/updated metadata
+            return [
+                {field: getattr(g, field, None) for field in fields} for g in guards
+            ], next_after  # type: ignore
+        return guards, next_after  # type: ignore
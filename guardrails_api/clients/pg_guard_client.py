@@ -1,40 +1,324 @@
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import List, Optional, Any
+from datetime import datetime
+import threading
+import time
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 import uuid
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Row,
+    Select,
+    delete,
+    false,
+    func,
+    select,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from psycopg2.errors import UniqueViolation
 from sqlalchemy.orm import Session
 from guardrails_api.classes.http_error import HttpError
-from guardrails_api.clients.guard_client import GuardClient
+from guardrails_api.clients.guard_client import GuardClient, GuardPage
 from guardrails_api.db.models.guard_item import GuardItem
-from guardrails_api.db.postgres_client import PostgresClient
+from guardrails_api.db.postgres_client import (
+    PostgresClient,
+    postgres_replica_is_enabled,
+)
 from guardrails_api.db.models.guard_item_audit import GuardItemAudit
+from guardrails_api.utils.fast_json import dumps
+from guardrails_api.utils.get_int_env_var import get_int_env_var
 from guardrails_ai.types import CreateGuardRequest, Guard
 
+VALIDATED_GUARDS_MAX_SIZE = 1024
+UPSERT_GUARDS_BATCH_SIZE = 500
+HISTORICAL_GUARDS_MAX_SIZE = 1024
+DEFAULT_DB_REPLICA_READ_YOUR_WRITES_SECONDS = 5
+
+# Guards validated from guard rows, keyed by the row's id and updated_at,
+# which every write bumps, so reading an unchanged row again neither encodes
+# nor validates its whole JSONB again
+validated_guards: OrderedDict[Tuple[str, datetime], Guard] = OrderedDict()
+validated_guards_lock = threading.Lock()
+
 
 def from_guard_item(
     guard_item: GuardItem | GuardItemAudit,
 ) -> Guard:
+    # Versions audited before updated_at existed have none, so aren't cached
+    key = None
+    if guard_item.id is not None and guard_item.updated_at is not None:
+        key = (guard_item.id, guard_item.updated_at)
+        with validated_guards_lock:
+            guard = validated_guards.get(key)  # type: ignore
+            if guard is not None:
+                validated_guards.move_to_end(key)  # type: ignore
+                return guard
     guard_json: dict[str, Any] = guard_item.guard  # type: ignore
     if (
         guard_json
         and guard_item.id is not None
-        and (not guard_json.get("id") or guard_json.get("id") != guard_item.id)
+        and guard_json.get("id") != guard_item.id
     ):
-        guard_json["id"] = str(guard_item.id)
-    guard = Guard.model_validate(guard_json)
+        guard_json = {**guard_json, "id": str(guard_item.id)}
+    guard = Guard.model_validate_json(dumps(guard_json))
+    if key is not None:
+        with validated_guards_lock:
+            validated_guards[key] = guard  # type: ignore
+            while len(validated_guards) > VALIDATED_GUARDS_MAX_SIZE:
+                validated_guards.popitem(last=False)
     return guard
 
 
-class PGGuardClient(GuardClient):
+# Write statements return these columns instead of guard items, so the
+# guards are built from the written rows without reading them back
+RETURNED_COLUMNS = (GuardItem.id, GuardItem.guard, GuardItem.updated_at)
+
+
+def to_guard_row(id: str, guard: Guard | CreateGuardRequest) -> Dict[str, Any]:
+    return {
+        "id": id,
+        "name": guard.name,
+        "guard": guard.model_dump(exclude_none=True, by_alias=True),
+    }
+
+
+def to_guard_id(guard: Guard | CreateGuardRequest) -> str:
+    # Should remove id property from Guard
+    return guard.id if isinstance(guard, Guard) else str(uuid.uuid4())
+
+
+def insert_guard_statement(row: Dict[str, Any]):
+    return insert(GuardItem).values(row).returning(*RETURNED_COLUMNS)
+
+
+def upsert_guards_statement(rows: List[Dict[str, Any]], overwrite: bool = True):
+    """One INSERT ... ON CONFLICT (id) DO UPDATE ... RETURNING for all rows,
+    or DO NOTHING, which only returns the inserted rows, unless overwrite.
+    Rows must have distinct ids."""
+    statement = insert(GuardItem).values(rows)
+    if not overwrite:
+        return statement.on_conflict_do_nothing(
+            index_elements=[GuardItem.id]
+        ).returning(*RETURNED_COLUMNS)
+    return statement.on_conflict_do_update(
+        index_elements=[GuardItem.id],
+        set_={
+            "name": statement.excluded.name,
+            "guard": statement.excluded.guard,
+            "updated_at": func.current_timestamp(),
+        },
+    ).returning(*RETURNED_COLUMNS)
+
+
+def update_guard_statement(id: str, guard: Guard):
+    row = to_guard_row(id, guard)
+    return (
+        update(GuardItem)
+        .where(GuardItem.id == id)
+        .values(
+            name=row["name"], guard=row["guard"], updated_at=func.current_timestamp()
+        )
+        .returning(*RETURNED_COLUMNS)
+    )
+
+
+def delete_guard_statement(id: str):
+    return delete(GuardItem).where(GuardItem.id == id).returning(*RETURNED_COLUMNS)
+
+
+def to_upsert_batches(
+    guards: Sequence[Guard | CreateGuardRequest],
+) -> Tuple[List[str], List[List[Dict[str, Any]]]]:
+    """Returns the ids of the guards, in order, and their rows in batches of
+    UPSERT_GUARDS_BATCH_SIZE. Postgres can't update a row twice in one
+    statement, so only the last guard with a given id is kept."""
+    ids = [to_guard_id(guard) for guard in guards]
+    rows = {id: to_guard_row(id, guard) for id, guard in zip(ids, guards)}
+    unique_rows = list(rows.values())
+    batches = [
+        unique_rows[i : i + UPSERT_GUARDS_BATCH_SIZE]
+        for i in range(0, len(unique_rows), UPSERT_GUARDS_BATCH_SIZE)
+    ]
+    return ids, batches
+
+
+def guard_as_of_query(id: str, as_of_date: str) -> Select:
+    """Selects the version of the guard that was current at as_of_date in
+    one round trip: the first audit row replaced after as_of_date, served
+    by the (guard_id, replaced_on) index, or else the latest guard. The
+    historical column tells which one was found."""
+    audit = (
+        select(
+            GuardItemAudit.guard_id.label("id"),
+            GuardItemAudit.guard,
+            GuardItemAudit.updated_at,
+            true().label("historical"),
+        )
+        .filter(GuardItemAudit.guard_id == id, GuardItemAudit.replaced_on > as_of_date)
+        .order_by(GuardItemAudit.replaced_on.asc())
+        .limit(1)
+    )
+    latest = select(
+        GuardItem.id, GuardItem.guard, GuardItem.updated_at, false().label("historical")
+    ).filter(GuardItem.id == id)
+    versions = union_all(audit, latest).subquery()
+    return (
+        select(
+            versions.c.id,
+            versions.c.guard,
+            versions.c.updated_at,
+            versions.c.historical,
+        )
+        .order_by(versions.c.historical.desc())
+        .limit(1)
+    )
+
+
+def list_guards_query(
+    guard_name: Optional[str] = None,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[str, str]] = None,
+    fields: Optional[List[str]] = None,
+) -> Select:
+    # Served by the (name, id) index. Projections only select their columns
+    # so the guard JSONB is neither fetched nor parsed.
+    if fields:
+        columns = dict.fromkeys(["name", "id", *fields])
+        query = select(*[getattr(GuardItem, column) for column in columns])
+    else:
+        query = select(GuardItem)
+    if guard_name:
+        query = query.filter(GuardItem.name == guard_name)
+    if after is not None:
+        query = query.filter(tuple_(GuardItem.name, GuardItem.id) > tuple_(*after))
+    query = query.order_by(GuardItem.name, GuardItem.id)
+    if limit is not None:
+        # One extra row tells us whether there is another page
+        query = query.limit(limit + 1)
+    return query
+
+
+def to_guard_page(
+    rows: Sequence[Any],
+    limit: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+) -> GuardPage:
+    next_after = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_after = (rows[-1].name, rows[-1].id)
+    if fields:
+        return [
+            {field: getattr(row, field) for field in fields} for row in rows
+        ], next_after
+    return [from_guard_item(row) for row in rows], next_after
+
+
+class BasePGGuardClient:
+    """The guard caches and replica routing shared by PGGuardClient and
+    AsyncPGGuardClient, which add the sync and async db facing methods."""
+
     def __init__(self):
         self.initialized = True
         self.pgClient = PostgresClient()
+        # Latest guards are only cached while a GuardChangeListener is
+        # connected and can tell us when they change.
+        self.guard_cache_enabled = False
+        self.cached_guards: dict[str, Guard] = {}
+        self.guard_cache_generation = 0
+        self.guard_cache_lock = threading.Lock()
+        # Past versions never change, so they're cached whether or not a
+        # GuardChangeListener is connected
+        self.historical_guards: OrderedDict[Tuple[str, str], Guard] = OrderedDict()
+        # Reads go to the replica, if there is one, except for a while
+        # after guards change, since the replica may not have replayed
+        # the change yet
+        self.replica_enabled = postgres_replica_is_enabled()
+        read_your_writes_seconds = get_int_env_var(
+            "DB_REPLICA_READ_YOUR_WRITES_SECONDS"
+        )
+        self.read_your_writes_seconds = (
+            DEFAULT_DB_REPLICA_READ_YOUR_WRITES_SECONDS
+            if read_your_writes_seconds is None
+            else read_your_writes_seconds
+        )
+        self.last_write_at = float("-inf")
+
+    def enable_guard_cache(self):
+        with self.guard_cache_lock:
+            self.guard_cache_enabled = True
+            self.guard_cache_generation += 1
+
+    def disable_guard_cache(self):
+        with self.guard_cache_lock:
+            self.guard_cache_enabled = False
+            self.cached_guards.clear()
+            self.guard_cache_generation += 1
+            # Changes made while the listener is disconnected go unnoticed
+            self.last_write_at = time.monotonic()
+
+    def evict_guard(self, id: str):
+        """Called after this worker writes the guard and when the
+        GuardChangeListener reports another worker's write."""
+        with self.guard_cache_lock:
+            self.cached_guards.pop(id, None)
+            self.guard_cache_generation += 1
+            self.last_write_at = time.monotonic()
+
+    def mark_write(self):
+        with self.guard_cache_lock:
+            self.last_write_at = time.monotonic()
+
+    def read_from_replica(self) -> bool:
+        with self.guard_cache_lock:
+            elapsed = time.monotonic() - self.last_write_at
+        return self.replica_enabled and elapsed >= self.read_your_writes_seconds
+
+    # These are only internal utilities and do not start db sessions
+
+    def util_get_cached_guard(self, id: str) -> tuple[Guard | None, int]:
+        with self.guard_cache_lock:
+            return self.cached_guards.get(id), self.guard_cache_generation
+
+    def util_cache_guard(self, id: str, guard: Guard, generation: int):
+        with self.guard_cache_lock:
+            # Only cache what was read if nothing changed while reading it
+            if self.guard_cache_enabled and self.guard_cache_generation == generation:
+                self.cached_guards[id] = guard
+
+    def util_to_upserted_guards(
+        self, ids: List[str], guard_items: Sequence[Row]
+    ) -> List[Optional[Guard]]:
+        written = {gi.id: from_guard_item(gi) for gi in guard_items}  # type: ignore
+        for id in written:
+            self.evict_guard(id)
+        return [written.get(id) for id in ids]
+
+    def util_get_historical_guard(self, id: str, as_of_date: str) -> Guard | None:
+        with self.guard_cache_lock:
+            guard = self.historical_guards.get((id, as_of_date))
+            if guard is not None:
+                self.historical_guards.move_to_end((id, as_of_date))
+            return guard
 
+    def util_cache_historical_guard(self, id: str, as_of_date: str, guard: Guard):
+        with self.guard_cache_lock:
+            self.historical_guards[(id, as_of_date)] = guard
+            while len(self.historical_guards) > HISTORICAL_GUARDS_MAX_SIZE:
+                self.historical_guards.popitem(last=False)
+
+
+class PGGuardClient(BasePGGuardClient, GuardClient):
     @contextmanager
-    def get_db_context(self):
-        db = self.pgClient.SessionLocal()
+    def get_db_context(self, read_only: bool = False):
+        if read_only and self.read_from_replica():
+            db = self.pgClient.ReplicaSessionLocal()
+        else:
+            db = self.pgClient.SessionLocal()
         try:
             yield db
         finally:
@@ -42,48 +326,58 @@ class PGGuardClient(GuardClient):
 
     # These are only internal utilities and do not start db sessions
 
-    def util_get_guard_item(self, id: str, db: Session) -> GuardItem | None:
-        item = db.query(GuardItem).get(id)
-        return item
-
-    def util_create_guard(self, guard: Guard | CreateGuardRequest, db) -> Guard:
+    def util_write_guards(
+        self, statements: list, db: Session, conflict_cause: str
+    ) -> List[Row]:
+        """Executes the write statements in one transaction and returns the
+        rows they return."""
         try:
-            # Should remove id property from Guard
-            guard_id = guard.id if isinstance(guard, Guard) else str(uuid.uuid4())
-            guard_item = GuardItem(
-                id=guard_id,
-                name=guard.name,
-                guard=guard.model_dump(exclude_none=True, by_alias=True),
-            )
-            db.add(guard_item)
+            rows = [row for statement in statements for row in db.execute(statement)]
             db.commit()
-            return from_guard_item(guard_item)
+            self.mark_write()
+            return rows
         except IntegrityError as ie:
             if isinstance(ie.orig, UniqueViolation):
                 raise HttpError(
                     status=409,
                     message="Conflict",
-                    cause=f"A Guard with the name {guard.name} already exists!",
+                    cause=conflict_cause,
                 )
             raise ie
 
+    def util_create_guard(self, guard: Guard | CreateGuardRequest, db) -> Guard:
+        (guard_item,) = self.util_write_guards(
+            [insert_guard_statement(to_guard_row(to_guard_id(guard), guard))],
+            db,
+            f"A Guard with the name {guard.name} already exists!",
+        )
+        return from_guard_item(guard_item)
+
     # Below are used directly by Controllers and start db sessions
 
     def get_guard(self, id: str, as_of_date: Optional[str] = None) -> Guard:
-        with self.get_db_context() as db:
-            latest_guard_item = db.query(GuardItem).get(id)
-            audit_item = None
-            if as_of_date is not None:
-                audit_item = (
-                    db.query(GuardItemAudit)
-                    .filter_by(guard_id=id)
-                    .filter(GuardItemAudit.replaced_on > as_of_date)
-                    .order_by(GuardItemAudit.replaced_on.asc())
-                    .first()
-                )
-            guard_item = audit_item if audit_item is not None else latest_guard_item
-            if audit_item and guard_item:
-                guard_item.id = audit_item.guard_id
+        if as_of_date is not None:
+            historical_guard = self.util_get_historical_guard(id, as_of_date)
+            if historical_guard is not None:
+                return historical_guard
+            guard, historical = self.util_load_guard_as_of(id, as_of_date)
+            # Only versions from the audit table are final; the latest
+            # version can still be replaced
+            if historical:
+                self.util_cache_historical_guard(id, as_of_date, guard)
+            return guard
+
+        cached_guard, generation = self.util_get_cached_guard(id)
+        if cached_guard is not None:
+            return cached_guard
+
+        guard = self.util_load_guard(id)
+        self.util_cache_guard(id, guard, generation)
+        return guard
+
+    def util_load_guard(self, id: str) -> Guard:
+        with self.get_db_context(read_only=True) as db:
+            guard_item = db.query(GuardItem).get(id)
             if guard_item is None:
                 raise HttpError(
                     status=404,
@@ -92,8 +386,19 @@ class PGGuardClient(GuardClient):
                 )
             return from_guard_item(guard_item)
 
+    def util_load_guard_as_of(self, id: str, as_of_date: str) -> Tuple[Guard, bool]:
+        with self.get_db_context(read_only=True) as db:
+            guard_item = db.execute(guard_as_of_query(id, as_of_date)).first()
+            if guard_item is None:
+                raise HttpError(
+                    status=404,
+                    message="NotFound",
+                    cause="A Guard with the id {id} does not exist!".format(id=id),
+                )
+            return from_guard_item(guard_item), guard_item.historical  # type: ignore
+
     def get_guards(self, guard_name: Optional[str] = None) -> List[Guard]:
-        with self.get_db_context() as db:
+        with self.get_db_context(read_only=True) as db:
             guard_items: list[GuardItem] = []
             if guard_name:
                 guard_items = db.query(GuardItem).filter_by(name=guard_name).all()
@@ -101,49 +406,69 @@ class PGGuardClient(GuardClient):
                 guard_items = db.query(GuardItem).all()
             return [from_guard_item(gi) for gi in guard_items]
 
+    def list_guards(
+        self,
+        guard_name: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[str, str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> GuardPage:
+        query = list_guards_query(guard_name, limit, after, fields)
+        with self.get_db_context(read_only=True) as db:
+            rows = db.execute(query).all() if fields else db.scalars(query).all()
+            return to_guard_page(rows, limit, fields)
+
     def create_guard(self, guard: Guard | CreateGuardRequest) -> Guard:
         with self.get_db_context() as db:
             return self.util_create_guard(guard, db)
 
     def update_guard(self, id: str, guard: Guard) -> Guard:
         with self.get_db_context() as db:
-            guard_item = self.util_get_guard_item(id, db)
-            if guard_item is None:
+            guard_items = self.util_write_guards(
+                [update_guard_statement(id, guard)],
+                db,
+                f"A Guard with the name {guard.name} already exists!",
+            )
+            if not guard_items:
                 raise HttpError(
                     status=404,
                     message="NotFound",
                     cause="A Guard with the id {id} does not exist!".format(id=id),
                 )
-            guard_item.guard = guard.model_dump(exclude_none=True)  # type: ignore - guard_item.guard == JSONB == Column[Any], guard.model_dump() == dict[str, Any]
-            guard_item.updated_at = db.execute(  # type: ignore - .scalar() returns datetime or None; either is fine since if None the server will default
-                select(func.current_timestamp())
-            ).scalar()
-            db.commit()
-            return from_guard_item(guard_item)
+            self.evict_guard(id)
+            return from_guard_item(guard_items[0])
 
     def upsert_guard(self, id: str, guard: Guard | CreateGuardRequest) -> Guard:
         with self.get_db_context() as db:
-            guard_item = self.util_get_guard_item(id, db)
-            if guard_item is not None:
-                guard_item.guard = guard.model_dump(exclude_none=True)  # type: ignore - guard_item.guard == JSONB == Column[Any], guard.model_dump() == dict[str, Any]
-                guard_item.updated_at = db.execute(  # type: ignore - .scalar() returns datetime or None; either is fine since if None the server will default
-                    select(func.current_timestamp())
-                ).scalar()
-                db.commit()
-                return from_guard_item(guard_item)
-            else:
-                return self.util_create_guard(guard, db)
+            (guard_item,) = self.util_write_guards(
+                [upsert_guards_statement([to_guard_row(id, guard)])],
+                db,
+                f"A Guard with the name {guard.name} already exists!",
+            )
+            self.evict_guard(id)
+            return from_guard_item(guard_item)
+
+    def upsert_guards(
+        self, guards: Sequence[Guard | CreateGuardRequest], overwrite: bool = True
+    ) -> List[Optional[Guard]]:
+        ids, batches = to_upsert_batches(guards)
+        with self.get_db_context() as db:
+            guard_items = self.util_write_guards(
+                [upsert_guards_statement(batch, overwrite) for batch in batches],
+                db,
+                "Guards conflict with existing guards!",
+            )
+        return self.util_to_upserted_guards(ids, guard_items)
 
     def delete_guard(self, id: str) -> Guard:
         with self.get_db_context() as db:
-            guard_item = self.util_get_guard_item(id, db)
-            if guard_item is None:
+            guard_items = db.execute(delete_guard_statement(id)).all()
+            db.commit()
+            if not guard_items:
                 raise HttpError(
                     status=404,
                     message="NotFound",
                     cause="A Guard with the id {id} does not exist!".format(id=id),
                 )
-            db.delete(guard_item)
-            db.commit()
-            guard = from_guard_item(guard_item)
-            return guard
+            self.evict_guard(id)
+            return from_guard_item(guard_items[0])
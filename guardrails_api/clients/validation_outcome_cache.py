@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import threading
+import uuid
+from typing import Any, Optional
+
+from guardrails import AsyncGuard, Guard
+from guardrails_ai.types import Guard as IGuard
+
+from guardrails_api.utils.byte_lru_cache import ByteLRUCache
+from guardrails_api.utils.fast_json import dumps
+from guardrails_api.utils.get_int_env_var import get_int_env_var
+from guardrails_api.utils.metrics import Metrics
+
+DEFAULT_VALIDATION_CACHE_TTL = 300
+DEFAULT_VALIDATION_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Outcomes of these on_fail actions depend on an LLM being re-asked
+REASK_ON_FAIL_ACTIONS = {"reask", "fix_reask"}
+
+
+def validation_cache_is_enabled():
+    return os.environ.get("VALIDATION_CACHE_ENABLED", "false").lower() == "true"
+
+
+def get_skipped_validators() -> set[str]:
+    skipped = os.environ.get("VALIDATION_CACHE_SKIP_VALIDATORS", "")
+    return {v.strip() for v in skipped.split(",") if v.strip()}
+
+
+class ValidationOutcomeCache:
+    """A per-worker cache of serialized parse outcomes keyed by guard id,
+    guard version, llm_output, metadata and prompt_params.
+
+    Guards are only cached when every validator is deterministic for the
+    same input: validators that re-ask, that are configured with an
+    llm_callable, or that are listed in VALIDATION_CACHE_SKIP_VALIDATORS
+    bypass the cache.
+
+    Outcomes served from the cache get a new callId. No call ran for
+    them, so they aren't recorded in history or guard_calls; hits are
+    counted in validation_cache_hits_total.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:  # Double-checked locking
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def initialize(self):
+        self.enabled = validation_cache_is_enabled()
+        ttl = get_int_env_var("VALIDATION_CACHE_TTL")
+        self.ttl = DEFAULT_VALIDATION_CACHE_TTL if ttl is None else ttl
+        max_bytes = get_int_env_var("VALIDATION_CACHE_MAX_BYTES")
+        self.max_bytes = (
+            DEFAULT_VALIDATION_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        )
+        self.skipped_validators = get_skipped_validators()
+        self.outcomes = ByteLRUCache(self.max_bytes)
+        self.metrics = Metrics()
+
+    def is_cacheable(self, guard: Guard | AsyncGuard | IGuard) -> bool:
+        if not self.enabled:
+            return False
+        for validator in guard.validators or []:
+            on_fail = getattr(validator.on_fail, "value", validator.on_fail)
+            if (
+                on_fail in REASK_ON_FAIL_ACTIONS
+                or "llm_callable" in (validator.kwargs or {})
+                or validator.id in self.skipped_validators
+            ):
+                self.metrics.increment("validation_cache_skips_total")
+                return False
+        return True
+
+    def get_key(
+        self,
+        guard: Guard | AsyncGuard | IGuard,
+        guard_version: str,
+        llm_output: str,
+        metadata: Optional[dict[str, Any]] = None,
+        prompt_params: Optional[dict[str, Any]] = None,
+    ) -> str:
+        key_parts = [
+            guard.id,
+            guard_version,
+            llm_output,
+            metadata or {},
+            prompt_params or {},
+        ]
+        serialized = json.dumps(key_parts, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the encoded outcome, ready to be sent as is, with a new
+        callId. Replayed outcomes don't belong to the call that produced
+        them, and that call's history isn't this request's."""
+        value = self.outcomes.get(key)
+        if value is None:
+            self.metrics.increment("validation_cache_misses_total")
+            return None
+        self.metrics.increment("validation_cache_hits_total")
+        return b'{"callId":%b,%b' % (dumps(str(uuid.uuid4())), value[1:])
+
+    def set(self, key: str, outcome: dict[str, Any]):
+        # Stored without its callId, which get replaces with a new one
+        encoded = dumps({k: v for k, v in outcome.items() if k != "callId"})
+        evictions = self.outcomes.evictions
+        self.outcomes.set(key, encoded, self.ttl or None)
+        if self.outcomes.evictions > evictions:
+            self.metrics.increment(
+                "validation_cache_evictions_total",
+                self.outcomes.evictions - evictions,
+            )
+        self.metrics.set_gauge("validation_cache_bytes", self.outcomes.total_bytes)
+
+    def clear(self):
+        self.outcomes.clear()
+        self.metrics.set_gauge("validation_cache_bytes", 0)
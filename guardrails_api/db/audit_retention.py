@@ -0,0 +1,258 @@
+import re
+from datetime import datetime, timedelta
+from typing import BinaryIO, List, Optional, Tuple
+
+from sqlalchemy import Connection, Engine, delete, func, select, text, tuple_
+
+from guardrails_api.db.models.guard_item_audit import GuardItemAudit
+from guardrails_api.utils.fast_json import dumps
+from guardrails_api.utils.get_int_env_var import get_int_env_var
+from guardrails_api.utils.logger import logger
+
+DEFAULT_COMPACT_AUDIT_BATCH_SIZE = 1000
+AUDIT_TABLE = "guards_audit"
+LEGACY_AUDIT_PARTITION = "guards_audit_legacy"
+DEFAULT_AUDIT_PARTITION = "guards_audit_default"
+
+PARTITION_UPPER_BOUND = re.compile(r"TO \('([^']+)'\)")
+
+
+def get_audit_retention_days() -> Optional[int]:
+    retention_days = get_int_env_var("GUARD_AUDIT_RETENTION_DAYS")
+    if retention_days is not None and retention_days < 1:
+        raise ValueError(
+            f"Invalid value for environment variable GUARD_AUDIT_RETENTION_DAYS: {retention_days}! GUARD_AUDIT_RETENTION_DAYS must be at least 1!"
+        )
+    return retention_days
+
+
+def month_start(timestamp: datetime) -> datetime:
+    return timestamp.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month_start(timestamp: datetime) -> datetime:
+    return month_start(month_start(timestamp) + timedelta(days=32))
+
+
+def partition_name(start: datetime) -> str:
+    return f"{AUDIT_TABLE}_p{start:%Y%m}"
+
+
+def get_db_timestamp(connection: Connection) -> datetime:
+    # replaced_on is set by now() in the session time zone, so compare with
+    # the database's clock rather than ours
+    return connection.execute(select(func.localtimestamp())).scalar_one()
+
+
+def audit_is_partitioned(connection: Connection) -> bool:
+    relkind = connection.execute(
+        text("SELECT relkind FROM pg_class WHERE relname = :name"),
+        {"name": AUDIT_TABLE},
+    ).scalar()
+    return relkind == "p"
+
+
+def get_audit_partitions(
+    connection: Connection,
+) -> List[Tuple[str, Optional[datetime]]]:
+    """Returns each partition of guards_audit with the end of its range,
+    or None for the default partition."""
+    rows = connection.execute(
+        text(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+            "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:name AS regclass)"
+        ),
+        {"name": AUDIT_TABLE},
+    ).all()
+    partitions = []
+    for name, bound in rows:
+        match = PARTITION_UPPER_BOUND.search(bound or "")
+        upper = datetime.fromisoformat(match.group(1)) if match else None
+        partitions.append((name, upper))
+    return partitions
+
+
+def default_partition_has_rows(
+    connection: Connection, start: datetime, end: datetime
+) -> bool:
+    return (
+        connection.execute(
+            text(
+                f"SELECT 1 FROM {DEFAULT_AUDIT_PARTITION} "
+                "WHERE replaced_on >= :start AND replaced_on < :end LIMIT 1"
+            ),
+            {"start": start, "end": end},
+        ).scalar()
+        is not None
+    )
+
+
+def create_audit_partitions(connection: Connection, now: datetime, months: int = 3):
+    """Creates the monthly partitions for this and the following months
+    that don't exist yet, ahead of the versions replaced in them, so the
+    default partition stays empty.
+
+    Postgres won't create a partition for a range the default partition
+    already holds rows in, and moving them would lock guards_audit while
+    they are copied. Such months are skipped with a warning instead; their
+    versions stay in the default partition until they expire.
+    """
+    partitions = dict(get_audit_partitions(connection))
+    # The legacy partition already covers the month it was created in
+    legacy_end = partitions.get(LEGACY_AUDIT_PARTITION) or datetime.min
+    ranges = []
+    start = month_start(now)
+    for _ in range(months):
+        end = next_month_start(start)
+        if partition_name(start) not in partitions and start >= legacy_end:
+            ranges.append((start, end))
+        start = end
+
+    has_default = DEFAULT_AUDIT_PARTITION in partitions
+    for start, end in ranges:
+        name = partition_name(start)
+        if has_default and default_partition_has_rows(connection, start, end):
+            logger.warning(
+                f"Not creating audit partition {name}: {DEFAULT_AUDIT_PARTITION} "
+                "already holds versions replaced in its range."
+            )
+            continue
+        connection.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF {AUDIT_TABLE} '
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        )
+
+
+def partition_audit(engine: Engine):
+    """Converts guards_audit into a table partitioned by month of
+    replaced_on.
+
+    The existing rows become the guards_audit_legacy partition, up to the
+    start of next month, so nothing is copied. A default partition catches
+    versions for months without a partition. Runs in one transaction that
+    locks guards_audit, and with it writes to guards, while the existing
+    rows are checked against the partition bound.
+    """
+    with engine.begin() as connection:
+        if audit_is_partitioned(connection):
+            logger.info(f"{AUDIT_TABLE} is already partitioned.")
+            return
+        legacy_end = next_month_start(get_db_timestamp(connection))
+        for statement in [
+            f"LOCK TABLE {AUDIT_TABLE} IN ACCESS EXCLUSIVE MODE",
+            f"ALTER TABLE {AUDIT_TABLE} RENAME TO {LEGACY_AUDIT_PARTITION}",
+            # Index names are unique per schema; the partitioned table reuses them
+            f"ALTER INDEX IF EXISTS {AUDIT_TABLE}_pkey RENAME TO {LEGACY_AUDIT_PARTITION}_pkey",
+            f"ALTER INDEX IF EXISTS ix_{AUDIT_TABLE}_name RENAME TO ix_{LEGACY_AUDIT_PARTITION}_name",
+            f"ALTER INDEX IF EXISTS ix_{AUDIT_TABLE}_guard_id_replaced_on "
+            f"RENAME TO ix_{LEGACY_AUDIT_PARTITION}_guard_id_replaced_on",
+            f"CREATE TABLE {AUDIT_TABLE} (LIKE {LEGACY_AUDIT_PARTITION} "
+            "INCLUDING DEFAULTS) PARTITION BY RANGE (replaced_on)",
+            # Unique constraints of partitioned tables must include the partition key
+            f"ALTER TABLE {AUDIT_TABLE} ADD CONSTRAINT {AUDIT_TABLE}_pkey "
+            "PRIMARY KEY (id, replaced_on)",
+            f"CREATE INDEX ix_{AUDIT_TABLE}_name ON {AUDIT_TABLE} (name)",
+            f"CREATE INDEX ix_{AUDIT_TABLE}_guard_id_replaced_on "
+            f"ON {AUDIT_TABLE} (guard_id, replaced_on)",
+            f"ALTER TABLE {AUDIT_TABLE} ATTACH PARTITION {LEGACY_AUDIT_PARTITION} "
+            f"FOR VALUES FROM (MINVALUE) TO ('{legacy_end.isoformat()}')",
+            f"CREATE TABLE {DEFAULT_AUDIT_PARTITION} PARTITION OF {AUDIT_TABLE} DEFAULT",
+        ]:
+            connection.execute(text(statement))
+        create_audit_partitions(connection, legacy_end)
+    logger.info(f"Partitioned {AUDIT_TABLE} by month.")
+
+
+def archive_rows(archive: Optional[BinaryIO], rows):
+    if archive is not None:
+        archive.write(b"".join(dumps(row._asdict()) + b"\n" for row in rows))
+
+
+def drop_expired_partitions(
+    engine: Engine, cutoff: datetime, archive: Optional[BinaryIO] = None
+) -> int:
+    """Drops the partitions whose whole range is older than cutoff, after
+    writing their rows to the archive. Returns how many rows they held."""
+    with engine.connect() as connection:
+        expired = [
+            name
+            for name, upper in get_audit_partitions(connection)
+            if upper is not None and upper <= cutoff
+        ]
+    dropped = 0
+    for name in expired:
+        with engine.begin() as connection:
+            rows = connection.execution_options(stream_results=True).execute(
+                text(f'SELECT * FROM "{name}"')
+            )
+            for partition in rows.partitions(DEFAULT_COMPACT_AUDIT_BATCH_SIZE):
+                archive_rows(archive, partition)
+                dropped += len(partition)
+            # Dropping a partition frees its space at once, without a vacuum
+            connection.execute(text(f'DROP TABLE "{name}"'))
+        logger.info(f"Dropped audit partition {name}.")
+    return dropped
+
+
+def delete_expired_versions(
+    engine: Engine,
+    cutoff: datetime,
+    batch_size: int = DEFAULT_COMPACT_AUDIT_BATCH_SIZE,
+    archive: Optional[BinaryIO] = None,
+) -> int:
+    """Deletes versions replaced before cutoff, batch_size rows per
+    transaction so locks are held briefly. Returns how many were deleted."""
+    primary_key = tuple_(GuardItemAudit.id, GuardItemAudit.replaced_on)
+    batch = (
+        select(GuardItemAudit.id, GuardItemAudit.replaced_on)
+        .filter(GuardItemAudit.replaced_on < cutoff)
+        .order_by(GuardItemAudit.replaced_on)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    statement = (
+        delete(GuardItemAudit)
+        .where(primary_key.in_(batch))
+        .returning(*GuardItemAudit.__table__.columns)
+    )
+    deleted = 0
+    while True:
+        with engine.begin() as connection:
+            rows = connection.execute(statement).all()
+            # Archived before the commit, so a failed write keeps the rows
+            archive_rows(archive, rows)
+        deleted += len(rows)
+        if len(rows) < batch_size:
+            return deleted
+
+
+def compact_audit(
+    engine: Engine,
+    retention_days: int,
+    batch_size: int = DEFAULT_COMPACT_AUDIT_BATCH_SIZE,
+    archive: Optional[BinaryIO] = None,
+) -> int:
+    """Removes guard versions replaced more than retention_days ago and
+    returns how many were removed.
+
+    Point in time lookups for dates within the retention period are
+    unaffected. On a partitioned guards_audit, expired partitions are
+    dropped whole and the partitions for the coming months are created.
+    """
+    with engine.connect() as connection:
+        now = get_db_timestamp(connection)
+        partitioned = audit_is_partitioned(connection)
+    cutoff = now - timedelta(days=retention_days)
+
+    removed = 0
+    if partitioned:
+        removed += drop_expired_partitions(engine, cutoff, archive)
+    removed += delete_expired_versions(engine, cutoff, batch_size, archive)
+    if partitioned:
+        with engine.begin() as connection:
+            create_audit_partitions(connection, now)
+    logger.info(f"Removed {removed} guard versions replaced before {cutoff}.")
+    return removed
@@ -53,3 +53,35 @@ CREATE TRIGGER guard_audit_trigger
     FOR EACH ROW
     EXECUTE PROCEDURE guard_audit_function();
 """
+
+GUARD_CHANGE_CHANNEL = "guards_changed"
+
+NOTIFY_FUNCTION_REV_3f1c9a7d2b64 = f"""
+CREATE OR REPLACE FUNCTION guard_notify_function() RETURNS TRIGGER AS $guard_notify$
+BEGIN
+    IF (TG_OP = 'DELETE' OR TG_OP = 'UPDATE') THEN
+    PERFORM pg_notify('{GUARD_CHANGE_CHANNEL}', OLD.id);
+    END IF;
+    IF (TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.id IS DISTINCT FROM OLD.id)) THEN
+    PERFORM pg_notify('{GUARD_CHANGE_CHANNEL}', NEW.id);
+    END IF;
+    RETURN null;
+END;
+$guard_notify$
+LANGUAGE plpgsql;
+"""
+
+NOTIFY_TRIGGER_REV_3f1c9a7d2b64 = """
+DROP TRIGGER IF EXISTS guard_notify_trigger
+  ON guards;
+CREATE TRIGGER guard_notify_trigger
+    AFTER INSERT OR UPDATE OR DELETE ON guards
+    FOR EACH ROW
+    EXECUTE PROCEDURE guard_notify_function();
+"""
+
+NOTIFY_TRIGGER_REV_680f1675f359 = """
+DROP TRIGGER IF EXISTS guard_notify_trigger
+  ON guards;
+DROP FUNCTION IF EXISTS guard_notify_function();
+"""
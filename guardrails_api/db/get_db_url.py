@@ -17,3 +17,18 @@ def get_db_url():
         f"postgresql://{PGUSER}:{PGPASSWORD}@{PGHOST}:{PGPORT}/{PGDATABASE}{DB_EXTRAS}"
     )
     return url
+
+
+def get_replica_db_url() -> str | None:
+    return os.getenv("DB_REPLICA_URL") or None
+
+
+def to_async_db_url(url: str, driver: str):
+    scheme, separator, rest = url.partition("://")
+    # Swap out any sync driver, e.g. postgresql+psycopg2, for the async one
+    dialect = scheme.split("+")[0]
+    return f"{dialect}+{driver}{separator}{rest}"
+
+
+def get_async_db_url(driver: str):
+    return to_async_db_url(get_db_url(), driver)
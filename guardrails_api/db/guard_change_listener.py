@@ -0,0 +1,90 @@
+import os
+import select
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy import Engine
+
+from guardrails_api.db.extras.audit import GUARD_CHANGE_CHANNEL
+from guardrails_api.utils.logger import logger
+
+
+def guard_change_notify_is_enabled() -> bool:
+    return os.environ.get("GUARD_CHANGE_NOTIFY_ENABLED", "true").lower() == "true"
+
+
+class GuardChangeListener:
+    """Listens for guard change notifications on a dedicated connection.
+
+    The guard_notify_trigger publishes the id of every inserted, updated
+    or deleted guard.  on_listen is called once the connection is
+    listening, on_change for every changed guard id and on_disconnect
+    whenever the connection is lost, since notifications sent while
+    disconnected are never delivered.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        on_change: Callable[[str], None],
+        on_listen: Optional[Callable[[], None]] = None,
+        on_disconnect: Optional[Callable[[], None]] = None,
+        poll_interval: float = 5.0,
+        reconnect_interval: float = 5.0,
+    ):
+        self.engine = engine
+        self.on_change = on_change
+        self.on_listen = on_listen
+        self.on_disconnect = on_disconnect
+        self.poll_interval = poll_interval
+        self.reconnect_interval = reconnect_interval
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self.stop_event.clear()
+        self.thread = threading.Thread(
+            target=self.run, name="guard-change-listener", daemon=True
+        )
+        self.thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+            self.thread = None
+
+    def run(self):
+        while not self.stop_event.is_set():
+            try:
+                self.listen()
+            except Exception as e:
+                logger.error(f"Guard change listener disconnected: {str(e)}")
+            if self.on_disconnect:
+                self.on_disconnect()
+            self.stop_event.wait(self.reconnect_interval)
+
+    def listen(self):
+        # Detach so this long lived connection never goes back to the pool
+        connection = self.engine.raw_connection()
+        connection.detach()
+        try:
+            dbapi_connection = connection.driver_connection
+            dbapi_connection.autocommit = True  # type: ignore
+            with dbapi_connection.cursor() as cursor:  # type: ignore
+                cursor.execute(f"LISTEN {GUARD_CHANGE_CHANNEL};")
+            if self.on_listen:
+                self.on_listen()
+
+            while not self.stop_event.is_set():
+                readable, _, _ = select.select(
+                    [dbapi_connection], [], [], self.poll_interval
+                )
+                if not readable:
+                    continue
+                dbapi_connection.poll()  # type: ignore
+                while dbapi_connection.notifies:  # type: ignore
+                    notification = dbapi_connection.notifies.pop(0)  # type: ignore
+                    self.on_change(notification.payload)
+        finally:
+            connection.close()
@@ -0,0 +1,34 @@
+"""add guard change notify trigger
+
+Revision ID: 3f1c9a7d2b64
+Revises: 680f1675f359
+Create Date: 2026-10-18 09:12:44.208316
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from guardrails_api.db.extras.audit import (
+    NOTIFY_FUNCTION_REV_3f1c9a7d2b64,
+    NOTIFY_TRIGGER_REV_3f1c9a7d2b64,
+    NOTIFY_TRIGGER_REV_680f1675f359,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c9a7d2b64"
+down_revision: Union[str, Sequence[str], None] = "680f1675f359"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(NOTIFY_FUNCTION_REV_3f1c9a7d2b64)
+    op.execute(NOTIFY_TRIGGER_REV_3f1c9a7d2b64)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(NOTIFY_TRIGGER_REV_680f1675f359)
@@ -0,0 +1,34 @@
+"""add guards name id index
+
+Revision ID: 5b8d3e6f0a42
+Revises: 9c2e4b7a1d35
+Create Date: 2026-10-18 16:21:05.304127
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8d3e6f0a42"
+down_revision: Union[str, Sequence[str], None] = "9c2e4b7a1d35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_guards_name_id",
+        "guards",
+        ["name", "id"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_guards_name_id", table_name="guards", if_exists=True)
@@ -0,0 +1,55 @@
+"""add guard_calls table
+
+Revision ID: 9c2e4b7a1d35
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-18 14:03:27.519842
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c2e4b7a1d35"
+down_revision: Union[str, Sequence[str], None] = "3f1c9a7d2b64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "guard_calls",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("guard_id", sa.String(), nullable=False),
+        sa.Column("call", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("clock_timestamp()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_guard_calls_guard_id_created_at",
+        "guard_calls",
+        ["guard_id", "created_at"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_guard_calls_guard_id_created_at",
+        table_name="guard_calls",
+        if_exists=True,
+    )
+    op.drop_table("guard_calls", if_exists=True)
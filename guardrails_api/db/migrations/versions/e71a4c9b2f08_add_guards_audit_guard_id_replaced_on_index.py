@@ -0,0 +1,49 @@
+"""add guards_audit guard_id replaced_on index
+
+Revision ID: e71a4c9b2f08
+Revises: 5b8d3e6f0a42
+Create Date: 2026-10-18 17:42:18.662513
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e71a4c9b2f08"
+down_revision: Union[str, Sequence[str], None] = "5b8d3e6f0a42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_guards_audit_guard_id_replaced_on",
+        "guards_audit",
+        ["guard_id", "replaced_on"],
+        unique=False,
+        if_not_exists=True,
+    )
+    # Lookups on guard_id alone are served by the new index
+    op.drop_index(
+        op.f("ix_guards_audit_guard_id"), table_name="guards_audit", if_exists=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_guards_audit_guard_id"),
+        "guards_audit",
+        ["guard_id"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index(
+        "ix_guards_audit_guard_id_replaced_on",
+        table_name="guards_audit",
+        if_exists=True,
+    )
@@ -1,5 +1,6 @@
 # __init__.py
 from .guard_item_audit import GuardItemAudit
 from .guard_item import GuardItem
+from .guard_call_item import GuardCallItem
 
-__all__ = ["GuardItemAudit", "GuardItem"]
+__all__ = ["GuardItemAudit", "GuardItem", "GuardCallItem"]
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from guardrails_api.db.models.base import Base
+
+
+class GuardCallItem(Base):
+    __tablename__ = "guard_calls"
+    # The guardrails Call id
+    id = Column(String, primary_key=True)
+    guard_id = Column(String, nullable=False)
+    call = Column(JSONB, nullable=False)
+    # clock_timestamp() differs per row, so rows inserted in one batch keep
+    # the order they were recorded in
+    created_at = Column(
+        DateTime, nullable=False, server_default=text("clock_timestamp()")
+    )
+
+    __table_args__ = (
+        Index("ix_guard_calls_guard_id_created_at", "guard_id", "created_at"),
+    )
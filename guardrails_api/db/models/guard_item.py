@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, text
+from sqlalchemy import Column, Index, String, DateTime, text
 from sqlalchemy.dialects.postgresql import JSONB
 from guardrails_api.db.models.base import Base
 
@@ -16,3 +16,6 @@ class GuardItem(Base):
     updated_at = Column(
         DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP")
     )
+
+    # Keyset pagination of guard listings orders by (name, id)
+    __table_args__ = (Index("ix_guards_name_id", "name", "id"),)
@@ -1,17 +1,24 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, Index, String, DateTime
 from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, CHAR
 from guardrails_api.db.models.base import Base
 
 
 class GuardItemAudit(Base):
     __tablename__ = "guards_audit"
+    # Unique constraints of partitioned tables must include the partition
+    # key, see partition_audit
     id = Column(String, primary_key=True)
-    guard_id = Column(String, nullable=True, index=True)
+    guard_id = Column(String, nullable=True)
     name = Column(String, nullable=False, index=True)
     guard = Column(JSONB, nullable=False)
     created_by = Column(String, nullable=True)
     created_at = Column(DateTime, nullable=True)
     updated_by = Column(String, nullable=True)
     updated_at = Column(DateTime, nullable=True)
-    replaced_on = Column(TIMESTAMP, nullable=False)
+    replaced_on = Column(TIMESTAMP, primary_key=True, nullable=False)
     operation = Column(CHAR, nullable=False)
+
+    # Point in time lookups find the first version replaced after a date
+    __table_args__ = (
+        Index("ix_guards_audit_guard_id_replaced_on", "guard_id", "replaced_on"),
+    )
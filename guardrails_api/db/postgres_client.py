@@ -2,9 +2,15 @@ import os
 import threading
 from fastapi import FastAPI
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from guardrails_api.db.get_db_pool_config import get_db_pool_config
-from guardrails_api.db.get_db_url import get_db_url
+from guardrails_api.db.get_db_url import (
+    get_async_db_url,
+    get_db_url,
+    get_replica_db_url,
+    to_async_db_url,
+)
 from guardrails_api.db.migrations.upgrade import upgrade
 from guardrails_api.db.models.base import Base
 
@@ -15,6 +21,18 @@ def postgres_is_enabled() -> bool:
     ) is not None
 
 
+def get_async_driver() -> str | None:
+    return os.environ.get("PG_ASYNC_DRIVER", None) or None
+
+
+def postgres_async_is_enabled() -> bool:
+    return postgres_is_enabled() and get_async_driver() is not None
+
+
+def postgres_replica_is_enabled() -> bool:
+    return postgres_is_enabled() and get_replica_db_url() is not None
+
+
 # Global variables for database session
 postgres_client = None
 SessionLocal = None
@@ -47,22 +65,13 @@ class PostgresClient:
 
     def initialize(self, app: FastAPI):
         print("\n==> PostgresClient.initialize was called")
-        url = get_db_url()
-        pool_config = get_db_pool_config()
-        pool_config_kwargs = {k: v for k, v in pool_config.items() if v is not None}
-
-        # TODO: Make this a default and allow users to pass in their own SQL Alchemy engine
-        engine = create_engine(url, **pool_config_kwargs)
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
         self.app = app
-        self.engine = engine
-        self.SessionLocal = SessionLocal
+        self.create_engines()
 
         lock_id = self.generate_lock_id("guardrails-api")
 
         # Use advisory lock to ensure only one worker runs initialization
-        with engine.begin() as connection:
+        with self.engine.begin() as connection:
             lock_acquired = connection.execute(
                 text(f"SELECT pg_try_advisory_lock({lock_id});")
             ).scalar()
@@ -71,9 +80,53 @@ class PostgresClient:
                 # Release the lock after initialization is complete
                 connection.execute(text(f"SELECT pg_advisory_unlock({lock_id});"))
 
+    def create_engines(self):
+        """Creates the engines and session factories without migrating, e.g.
+        for CLI commands that work on an existing database."""
+        url = get_db_url()
+        pool_config = get_db_pool_config()
+        pool_config_kwargs = {k: v for k, v in pool_config.items() if v is not None}
+
+        # TODO: Make this a default and allow users to pass in their own SQL Alchemy engine
+        engine = create_engine(url, **pool_config_kwargs)
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        self.engine = engine
+        self.SessionLocal = SessionLocal
+
+        # The sync engine is still needed for migrations and the guard
+        # change listener, so the async engine is created alongside it.
+        async_driver = get_async_driver()
+        if async_driver:
+            async_engine = create_async_engine(
+                get_async_db_url(async_driver), **pool_config_kwargs
+            )
+            self.async_engine = async_engine
+            self.AsyncSessionLocal = async_sessionmaker(
+                async_engine, autoflush=False, expire_on_commit=False
+            )
+
+        # Guard reads can be served by a read replica with its own pool;
+        # migrations, writes and the change listener stay on the primary.
+        replica_url = get_replica_db_url()
+        if replica_url:
+            replica_engine = create_engine(replica_url, **pool_config_kwargs)
+            self.replica_engine = replica_engine
+            self.ReplicaSessionLocal = sessionmaker(
+                autocommit=False, autoflush=False, bind=replica_engine
+            )
+            if async_driver:
+                async_replica_engine = create_async_engine(
+                    to_async_db_url(replica_url, async_driver), **pool_config_kwargs
+                )
+                self.async_replica_engine = async_replica_engine
+                self.AsyncReplicaSessionLocal = async_sessionmaker(
+                    async_replica_engine, autoflush=False, expire_on_commit=False
+                )
+
     def run_initialization(self):
         # Perform the actual initialization tasks
-        from guardrails_api.db.models import GuardItem, GuardItemAudit  # noqa
+        from guardrails_api.db.models import GuardItem, GuardItemAudit, GuardCallItem  # noqa
 
         Base.metadata.create_all(bind=self.engine)
 
@@ -12,7 +12,13 @@ def attach_validation_summaries(
     validator_logs: list[ValidatorLogs] = [],
 ) -> ValidationOutcome:
     if not validator_logs:
-        validator_logs = guard.history.last.validator_logs if guard.history.last else []
+        # Guards are shared across requests, so prefer the call that produced
+        # this outcome over whichever call happened to finish last.
+        call = next(
+            (c for c in guard.history if c.id == validation_outcome.call_id),
+            guard.history.last,
+        )
+        validator_logs = call.validator_logs if call else []
     if not validation_outcome.validation_summaries:
         validation_outcome.validation_summaries = (
             ValidationSummary.from_validator_logs_only_fails(validator_logs)
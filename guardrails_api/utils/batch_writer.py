@@ -0,0 +1,95 @@
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, Generic, List, Optional, TypeVar
+
+from guardrails_api.utils.logger import logger
+from guardrails_api.utils.metrics import Metrics
+
+T = TypeVar("T")
+
+
+class BatchWriter(Generic[T]):
+    """Writes queued items in batches off of the response path.
+
+    add() only enqueues the item and a background task on the running
+    event loop passes up to batch_size queued items at a time to write.
+    Items are dropped while queue_size items are waiting, unless
+    queue_size is 0. Queue depth, drops, writes and failed writes are
+    reported as <metric_prefix>_queue_depth, _dropped_total,
+    _written_total and _write_errors_total.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[T]], Awaitable[None]],
+        queue_size: int,
+        batch_size: int,
+        metric_prefix: str,
+    ):
+        self.write = write
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.metric_prefix = metric_prefix
+        self.pending: Deque[T] = deque()
+        self.writer: Optional[asyncio.Task] = None
+        self.writer_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.wakeup: Optional[asyncio.Event] = None
+        self.closed = False
+        self.metrics = Metrics()
+
+    def add(self, item: T):
+        if self.queue_size and len(self.pending) >= self.queue_size:
+            self.metrics.increment(f"{self.metric_prefix}_dropped_total")
+            return
+        self.pending.append(item)
+        self.metrics.set_gauge(f"{self.metric_prefix}_queue_depth", len(self.pending))
+        self.start_writer()
+        self.wakeup.set()  # type: ignore
+
+    def start_writer(self):
+        loop = asyncio.get_running_loop()
+        # A writer started on another event loop, e.g. by a previous
+        # TestClient request, will never run again
+        if self.writer_loop is loop and self.writer and not self.writer.done():
+            return
+        self.closed = False
+        self.writer_loop = loop
+        self.wakeup = asyncio.Event()
+        self.writer = loop.create_task(self.run_writer())
+
+    async def run_writer(self):
+        while True:
+            while self.pending:
+                await self.write_batch()
+            if self.closed:
+                return
+            await self.wakeup.wait()  # type: ignore
+            self.wakeup.clear()  # type: ignore
+
+    async def write_batch(self):
+        batch_size = min(self.batch_size, len(self.pending))
+        batch = [self.pending.popleft() for _ in range(batch_size)]
+        self.metrics.set_gauge(f"{self.metric_prefix}_queue_depth", len(self.pending))
+        try:
+            await self.write(batch)
+            self.metrics.increment(f"{self.metric_prefix}_written_total", len(batch))
+        except Exception as e:
+            name = self.metric_prefix.replace("_", " ")
+            logger.error(f"Failed to write {name}: {e}")
+            self.metrics.increment(
+                f"{self.metric_prefix}_write_errors_total", len(batch)
+            )
+
+    async def flush(self):
+        """Writes every queued item and stops the writer."""
+        self.closed = True
+        writer_is_running = (
+            self.writer is not None
+            and not self.writer.done()
+            and self.writer_loop is asyncio.get_running_loop()
+        )
+        if writer_is_running:
+            self.wakeup.set()  # type: ignore
+            await self.writer  # type: ignore
+        while self.pending:
+            await self.write_batch()
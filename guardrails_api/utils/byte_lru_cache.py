@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class ByteLRUCache:
+    """A thread safe LRU cache bounded by the total size of its keys and
+    values in bytes, with optional per entry TTLs."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[str, Tuple[bytes, Optional[float]]] = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.entries_lock = threading.Lock()
+
+    @staticmethod
+    def get_size(key: str, value: bytes) -> int:
+        return len(key) + len(value)
+
+    # These are only internal utilities and expect entries_lock to be held
+
+    def util_remove(self, key: str):
+        value, _ = self.entries.pop(key)
+        self.total_bytes -= self.get_size(key, value)
+
+    def util_evict(self):
+        while self.total_bytes > self.max_bytes and self.entries:
+            self.util_remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.entries_lock:
+            entry = self.entries.get(key)
+            if (
+                entry is not None
+                and entry[1] is not None
+                and entry[1] <= time.monotonic()
+            ):
+                self.util_remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> bool:
+        """Stores the value, evicting the least recently used entries to
+        make room. Returns False if the value alone exceeds max_bytes."""
+        if self.get_size(key, value) > self.max_bytes:
+            return False
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self.entries_lock:
+            if key in self.entries:
+                self.util_remove(key)
+            self.entries[key] = (value, expires_at)
+            self.total_bytes += self.get_size(key, value)
+            self.util_evict()
+        return True
+
+    def delete(self, key: str):
+        with self.entries_lock:
+            if key in self.entries:
+                self.util_remove(key)
+
+    def clear(self):
+        with self.entries_lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def stats(self) -> Dict[str, int]:
+        with self.entries_lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,110 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, TypeVar
+
+from starlette.requests import Request
+
+from guardrails_api.classes.http_error import HttpError
+from guardrails_api.utils.metrics import Metrics
+
+T = TypeVar("T")
+
+# Non-standard status popularized by nginx; the client never sees it
+CLIENT_CLOSED_REQUEST_STATUS = 499
+
+STREAM_END = object()
+
+
+async def wait_for_disconnect(request: Request):
+    # The request body has already been read by the time a handler runs, so
+    # the only message left to receive is the disconnect
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+def record_disconnect(name: str):
+    metrics = Metrics()
+    metrics.increment("client_disconnects_total")
+    metrics.increment(f"{name}_client_disconnects_total")
+
+
+def discard_result(task: asyncio.Future):
+    # Retrieve the exception of work nobody is waiting for anymore
+    if not task.cancelled():
+        task.exception()
+
+
+async def cancel_on_disconnect(request: Request, work: Awaitable[T], name: str) -> T:
+    """Awaits the work, cancelling it if the client disconnects first.
+
+    Cancellation propagates into whatever the work is awaiting, e.g. an
+    upstream litellm request or an async validator.
+    """
+    work_task = asyncio.ensure_future(work)
+    disconnect_task = asyncio.ensure_future(wait_for_disconnect(request))
+    try:
+        await asyncio.wait(
+            {work_task, disconnect_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        disconnect_task.cancel()
+        if not work_task.done():
+            work_task.cancel()
+            work_task.add_done_callback(discard_result)
+    if work_task.done() and not work_task.cancelled():
+        return work_task.result()
+    record_disconnect(name)
+    raise HttpError(
+        status=CLIENT_CLOSED_REQUEST_STATUS,
+        message="Client Closed Request",
+        cause="The client disconnected before the response was ready.",
+    )
+
+
+async def cancel_stream_on_disconnect(
+    request: Request, stream: AsyncIterator[T], name: str
+) -> AsyncIterator[T]:
+    """Forwards the stream until it ends or the client disconnects.
+
+    The stream is consumed by a single producer task so context variables
+    set while iterating it stay visible between items. On disconnect the
+    producer is cancelled, which stops guard iteration and closes the
+    upstream LLM stream.
+    """
+    queue: asyncio.Queue[tuple[Any, BaseException | None]] = asyncio.Queue(maxsize=1)
+
+    async def produce():
+        try:
+            async for item in stream:
+                await queue.put((item, None))
+        except Exception as e:
+            await queue.put((STREAM_END, e))
+        else:
+            await queue.put((STREAM_END, None))
+
+    producer = asyncio.ensure_future(produce())
+    disconnect_task = asyncio.ensure_future(wait_for_disconnect(request))
+    next_item = None
+    try:
+        while True:
+            next_item = asyncio.ensure_future(queue.get())
+            await asyncio.wait(
+                {next_item, disconnect_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not next_item.done():
+                record_disconnect(name)
+                return
+            item, error = next_item.result()
+            if error is not None:
+                raise error
+            if item is STREAM_END:
+                return
+            yield item
+    finally:
+        if next_item is not None:
+            next_item.cancel()
+        disconnect_task.cancel()
+        if not producer.done():
+            producer.cancel()
+            producer.add_done_callback(discard_result)
@@ -0,0 +1,28 @@
+import base64
+from typing import Tuple
+
+from guardrails_api.classes.http_error import HttpError
+from guardrails_api.utils.fast_json import dumps, loads
+
+
+def encode_cursor(*values: str) -> str:
+    """Encodes the sort key of the last row of a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(dumps(list(values))).decode()
+
+
+def decode_cursor(cursor: str, length: int) -> Tuple[str, ...]:
+    try:
+        values = loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        values = None
+    if (
+        not isinstance(values, list)
+        or len(values) != length
+        or not all(isinstance(v, str) for v in values)
+    ):
+        raise HttpError(
+            status=400,
+            message="BadRequest",
+            cause=f"Invalid cursor {cursor}!",
+        )
+    return tuple(values)
@@ -0,0 +1,45 @@
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def default(o: Any) -> Any:
+    # Covers what jsonable_encoder does beyond orjson's native types
+    if isinstance(o, BaseModel):
+        return o.model_dump(mode="json", by_alias=True)
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dumps(content: Any, by_alias: bool = True, exclude_none: bool = False) -> bytes:
+    """Encodes content as JSON bytes.
+
+    Pydantic models are encoded by pydantic-core straight from the model,
+    without dumping them to a dict first; everything else by orjson.
+    by_alias and exclude_none only apply to models.
+    """
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(
+            content, by_alias=by_alias, exclude_none=exclude_none
+        )
+    return orjson.dumps(content, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def loads(content: bytes | str) -> Any:
+    return orjson.loads(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """A JSONResponse encoded with dumps instead of the stdlib encoder.
+
+    Use it for routes without a response model; FastAPI already encodes
+    routes with one straight to JSON bytes with pydantic-core.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,167 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, TypeVar
+
+from guardrails_api.classes.http_error import HttpError
+from guardrails_api.utils.get_int_env_var import get_int_env_var
+from guardrails_api.utils.metrics import Metrics
+
+T = TypeVar("T")
+
+INLINE_EXECUTION_MODE = "inline"
+THREAD_EXECUTION_MODE = "thread"
+PROCESS_EXECUTION_MODE = "process"
+EXECUTION_MODES = (
+    INLINE_EXECUTION_MODE,
+    THREAD_EXECUTION_MODE,
+    PROCESS_EXECUTION_MODE,
+)
+
+# Matches ThreadPoolExecutor's own default
+DEFAULT_GUARD_EXECUTOR_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+_EXHAUSTED = object()
+
+
+def get_guard_execution_mode() -> str:
+    mode = os.environ.get("GUARD_EXECUTION_MODE", INLINE_EXECUTION_MODE).lower()
+    if mode not in EXECUTION_MODES:
+        raise ValueError(
+            f"Invalid value for environment variable GUARD_EXECUTION_MODE: {mode}! GUARD_EXECUTION_MODE must be one of {', '.join(EXECUTION_MODES)}!"
+        )
+    return mode
+
+
+def is_coroutine_function(fn: Callable) -> bool:
+    return inspect.iscoroutinefunction(fn) or inspect.iscoroutinefunction(
+        getattr(fn, "__call__", None)
+    )
+
+
+class GuardExecutor:
+    """Runs synchronous Guard work off the event loop.
+
+    In "thread" mode sync guard calls, and each step of a sync guard
+    stream, run in a bounded thread pool with the caller's contextvars.
+    In "inline" mode (the default) they run on the event loop as before.
+    In "process" mode the thread pool runs whatever GuardProcessPool
+    does not take. Coroutine functions, i.e. AsyncGuard methods, always
+    run on the loop.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:  # Double-checked locking
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def initialize(self):
+        self.mode = get_guard_execution_mode()
+        max_workers = get_int_env_var("GUARD_EXECUTOR_MAX_WORKERS")
+        self.max_workers = max_workers or DEFAULT_GUARD_EXECUTOR_MAX_WORKERS
+        # 0 leaves the queue of waiting calls unbounded
+        self.max_queue_size = get_int_env_var("GUARD_EXECUTOR_MAX_QUEUE_SIZE") or 0
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.counts_lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.metrics = Metrics()
+        self.util_record_counts()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode in (THREAD_EXECUTION_MODE, PROCESS_EXECUTION_MODE)
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        with self.counts_lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="guard-executor",
+                )
+            return self.executor
+
+    def shutdown(self, wait: bool = True):
+        with self.counts_lock:
+            executor = self.executor
+            self.executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    # These are only internal utilities and expect counts_lock to be held
+
+    def util_record_counts(self):
+        self.metrics.set_gauge("guard_executor_queue_depth", self.queued)
+        self.metrics.set_gauge("guard_executor_active", self.active)
+
+    def util_submit(self, fn: Callable[[], T], context: contextvars.Context):
+        executor = self.get_executor()
+        with self.counts_lock:
+            if self.max_queue_size > 0 and self.queued >= self.max_queue_size:
+                self.metrics.increment("guard_executor_rejected_total")
+                raise HttpError(
+                    status=503,
+                    message="ServiceUnavailable",
+                    cause="Too many guard executions are queued, try again later.",
+                )
+            self.queued += 1
+            self.util_record_counts()
+
+        def task() -> T:
+            with self.counts_lock:
+                self.queued -= 1
+                self.active += 1
+                self.util_record_counts()
+            try:
+                return context.run(fn)
+            finally:
+                with self.counts_lock:
+                    self.active -= 1
+                    self.util_record_counts()
+                self.metrics.increment("guard_executor_completed_total")
+
+        def on_done(future: Future):
+            # Calls cancelled before they started never ran task()
+            if future.cancelled():
+                with self.counts_lock:
+                    self.queued -= 1
+                    self.util_record_counts()
+
+        future = executor.submit(task)
+        future.add_done_callback(on_done)
+        return asyncio.wrap_future(future)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        call = functools.partial(fn, *args, **kwargs)
+        if self.enabled and not is_coroutine_function(fn):
+            result = await self.util_submit(call, contextvars.copy_context())
+        else:
+            result = call()
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def iterate(self, iterator: Iterator[T]) -> AsyncIterator[T]:
+        if not self.enabled:
+            for item in iterator:
+                yield item
+            return
+
+        # Every step shares one context so values set while producing an
+        # earlier chunk are visible to the later ones.
+        context = contextvars.copy_context()
+        step = functools.partial(next, iterator, _EXHAUSTED)
+        while True:
+            item = await self.util_submit(step, context)
+            if item is _EXHAUSTED:
+                return
+            yield item  # type: ignore
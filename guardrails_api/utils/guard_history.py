@@ -0,0 +1,49 @@
+import copy
+from typing import Optional, TypeVar
+
+from guardrails import AsyncGuard, Guard
+from guardrails.classes.generic.stack import Stack
+
+from guardrails_api.utils.get_int_env_var import get_int_env_var
+
+DEFAULT_GUARD_HISTORY_MAX_LENGTH = 10
+
+G = TypeVar("G", Guard, AsyncGuard)
+
+
+def get_guard_history_max_length() -> int:
+    max_length = get_int_env_var("GUARD_HISTORY_MAX_LENGTH")
+    if max_length is None:
+        return DEFAULT_GUARD_HISTORY_MAX_LENGTH
+    # Guards read the outcome of a call back off of history.last, so a
+    # guard always has to keep at least the latest call
+    if max_length < 1:
+        raise ValueError(
+            f"Invalid value for environment variable GUARD_HISTORY_MAX_LENGTH: {max_length}! GUARD_HISTORY_MAX_LENGTH must be at least 1!"
+        )
+    return max_length
+
+
+def bound_guard_history(guard: G, max_length: Optional[int] = None) -> G:
+    """Caps the guard's history to a ring buffer of the latest calls.
+
+    Guards are shared by every request a worker serves, so an uncapped
+    history would grow for the life of the worker.
+    """
+    max_length = max_length or get_guard_history_max_length()
+    guard._history_max_length = max_length
+    guard.history = Stack(*guard.history[-max_length:], max_length=max_length)
+    return guard
+
+
+def copy_guard(guard: G) -> G:
+    """Returns a copy of a shared guard for a single request.
+
+    The copy is shallow, so it reuses the validators the guard was
+    hydrated with, but it gets its own empty history and num_reasks. The
+    request can then read its call back off of history.last without
+    seeing the calls of concurrent requests on the same guard.
+    """
+    request_guard = copy.copy(guard)
+    request_guard.history = Stack(max_length=guard._history_max_length)
+    return request_guard
@@ -0,0 +1,93 @@
+from collections import Counter
+from typing import Any, AsyncIterable, Dict, List, Optional
+
+from guardrails import AsyncGuard, Guard
+from guardrails_ai.types import Guard as IGuard
+from pydantic import ValidationError
+
+from guardrails_api.utils.fast_json import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+WRITTEN = "written"
+CONFLICT = "conflict"
+INVALID = "invalid"
+
+
+def dump_guard_line(item: Guard | AsyncGuard | IGuard | dict) -> bytes:
+    """Encodes a guard, or a projection of one, as an NDJSON line."""
+    if isinstance(item, dict):
+        return dumps(item) + b"\n"
+    # Serialize with the IGuard schema like the guard routes; Guard
+    # subclasses add fields such as history that aren't part of the API
+    return IGuard.__pydantic_serializer__.to_json(item, by_alias=True) + b"\n"
+
+
+async def aiter_lines(chunks: AsyncIterable[bytes]):
+    """Splits a byte stream, e.g. a request body, into lines."""
+    pending = b""
+    async for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+class GuardImport:
+    """Collects guards from NDJSON lines for a bulk import and reports
+    what happened to each line.
+
+    Lines that aren't valid guards are reported as invalid and skipped, so
+    one bad line doesn't hold up the rest of the import.
+    """
+
+    def __init__(self):
+        self.line_count = 0
+        self.guards: List[IGuard] = []
+        self.guard_lines: List[int] = []
+        self.results: List[Dict[str, Any]] = []
+
+    def add_line(self, line: bytes | str):
+        self.line_count += 1
+        if not line.strip():
+            return
+        try:
+            guard = IGuard.model_validate_json(line)
+        except ValidationError as e:
+            self.results.append(
+                {
+                    "line": self.line_count,
+                    "status": INVALID,
+                    "errors": e.errors(
+                        include_url=False, include_context=False, include_input=False
+                    ),
+                }
+            )
+            return
+        self.guards.append(guard)
+        self.guard_lines.append(self.line_count)
+
+    def add_written(self, written: List[Optional[Any]]):
+        """Records the result of upsert_guards; guards it returned None for
+        already existed and weren't overwritten."""
+        for line, guard, written_guard in zip(self.guard_lines, self.guards, written):
+            self.results.append(
+                {
+                    "line": line,
+                    "id": guard.id,
+                    "status": WRITTEN if written_guard is not None else CONFLICT,
+                }
+            )
+        self.results.sort(key=lambda result: result["line"])
+
+    def counts(self) -> Dict[str, int]:
+        counts = Counter(result["status"] for result in self.results)
+        return {status: counts[status] for status in (WRITTEN, CONFLICT, INVALID)}
+
+    def dump_result(self, result: Dict[str, Any]) -> str:
+        return (dumps(result) + b"\n").decode()
+
+    def dump_results(self) -> bytes:
+        return b"".join(dumps(result) + b"\n" for result in self.results)
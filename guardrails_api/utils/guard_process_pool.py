@@ -0,0 +1,149 @@
+import asyncio
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple
+
+from guardrails import AsyncGuard, Guard
+from guardrails.classes import ValidationOutcome
+from guardrails.classes.history import Call
+
+from guardrails_api.classes.http_error import HttpError
+from guardrails_api.utils.get_int_env_var import get_int_env_var
+from guardrails_api.utils.guard_executor import (
+    PROCESS_EXECUTION_MODE,
+    get_guard_execution_mode,
+)
+from guardrails_api.utils.guard_history import bound_guard_history
+from guardrails_api.utils.metrics import Metrics
+
+# Hydrated guards kept warm in each worker process, keyed by guard id
+worker_guards: Dict[str, Tuple[str, Guard]] = {}
+
+
+def initialize_worker(config_file_path: Optional[str] = None):
+    # Load config.py so custom validators it registers can be hydrated
+    if config_file_path:
+        from guardrails_api.app import register_config
+
+        register_config(config_file_path)
+
+
+def parse_in_worker(
+    guard_id: str,
+    version: str,
+    guard_dict: Optional[dict],
+    llm_output: str,
+    parse_kwargs: Dict[str, Any],
+) -> Optional[Tuple[ValidationOutcome, Call]]:
+    """Runs Guard.parse in a worker process.
+
+    Returns None when this worker has no guard for the version and no
+    guard_dict was sent, so the caller can resend it with the definition.
+    """
+    entry = worker_guards.get(guard_id)
+    if entry is None or entry[0] != version:
+        if guard_dict is None:
+            return None
+        entry = (version, bound_guard_history(Guard.from_dict(guard_dict)))  # type: ignore
+        worker_guards[guard_id] = entry
+    guard = entry[1]
+    outcome = guard.parse(llm_output=llm_output, **parse_kwargs)
+    call = next(
+        (c for c in guard.history if c.id == outcome.call_id), guard.history.last
+    )
+    return outcome, call  # type: ignore
+
+
+class GuardProcessPool:
+    """Runs Guard.parse in a pool of long lived worker processes.
+
+    Only the guard id, version, llm output and parse kwargs are sent per
+    call; the full guard definition is sent only to workers that have not
+    hydrated that version yet. Enabled with GUARD_EXECUTION_MODE=process.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:  # Double-checked locking
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def initialize(self):
+        self.enabled = get_guard_execution_mode() == PROCESS_EXECUTION_MODE
+        max_workers = get_int_env_var("GUARD_PROCESS_POOL_SIZE")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.pool_lock = threading.Lock()
+        self.pending = 0
+        self.metrics = Metrics()
+
+    def get_pool(self) -> ProcessPoolExecutor:
+        with self.pool_lock:
+            if self.pool is None:
+                config_module = sys.modules.get("config")
+                self.pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    # fork is unsafe once the server has started threads
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=initialize_worker,
+                    initargs=(getattr(config_module, "__file__", None),),
+                )
+            return self.pool
+
+    def shutdown(self, wait: bool = True):
+        with self.pool_lock:
+            pool = self.pool
+            self.pool = None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    async def util_submit(self, *args) -> Optional[Tuple[ValidationOutcome, Call]]:
+        pool = self.get_pool()
+        loop = asyncio.get_running_loop()
+        with self.pool_lock:
+            self.pending += 1
+            self.metrics.set_gauge("guard_process_pool_pending", self.pending)
+        try:
+            return await loop.run_in_executor(pool, parse_in_worker, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM); start a fresh pool on the next call
+            with self.pool_lock:
+                if self.pool is pool:
+                    self.pool = None
+            raise HttpError(
+                status=503,
+                message="ServiceUnavailable",
+                cause="A guard worker process exited unexpectedly, try again.",
+            )
+        finally:
+            with self.pool_lock:
+                self.pending -= 1
+                self.metrics.set_gauge("guard_process_pool_pending", self.pending)
+
+    async def parse(
+        self,
+        guard: Guard | AsyncGuard,
+        version: str,
+        llm_output: str,
+        **parse_kwargs,
+    ) -> Tuple[ValidationOutcome, Call]:
+        guard_id: str = guard.id  # type: ignore
+        self.metrics.increment("guard_process_pool_calls_total")
+        response = await self.util_submit(
+            guard_id, version, None, llm_output, parse_kwargs
+        )
+        if response is None:
+            self.metrics.increment("guard_process_pool_hydrations_total")
+            guard_dict = guard.model_dump(exclude_none=True, exclude={"history"})
+            response = await self.util_submit(
+                guard_id, version, guard_dict, llm_output, parse_kwargs
+            )
+        return response  # type: ignore
@@ -0,0 +1,12 @@
+import inspect
+from typing import Awaitable, TypeVar
+
+T = TypeVar("T")
+
+
+async def maybe_await(value: T | Awaitable[T]) -> T:
+    """Awaits the value if it is awaitable so callers can treat sync and
+    async guard clients the same way."""
+    if inspect.isawaitable(value):
+        return await value
+    return value  # type: ignore
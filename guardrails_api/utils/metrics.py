@@ -0,0 +1,44 @@
+import threading
+from collections import defaultdict
+from typing import Dict
+
+
+class Metrics:
+    """Process wide counters and gauges reported by GET /metrics.
+
+    Values are per worker; aggregate across workers in your scraper.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:  # Double-checked locking
+                    cls._instance = super().__new__(cls)
+                    cls._instance.initialize()
+        return cls._instance
+
+    def initialize(self):
+        self.counters: Dict[str, float] = defaultdict(float)
+        self.gauges: Dict[str, float] = {}
+        self.values_lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1):
+        with self.values_lock:
+            self.counters[name] += value
+
+    def set_gauge(self, name: str, value: float):
+        with self.values_lock:
+            self.gauges[name] = value
+
+    def get(self, name: str) -> float:
+        with self.values_lock:
+            if name in self.gauges:
+                return self.gauges[name]
+            return self.counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self.values_lock:
+            return {"counters": dict(self.counters), "gauges": dict(self.gauges)}
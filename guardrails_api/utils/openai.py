@@ -1,9 +1,10 @@
 import contextvars
-import json
-from typing import Any, AsyncGenerator, Iterator
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Optional
 
 from guardrails import AsyncGuard, Guard
 from guardrails.classes import ValidationOutcome
+from guardrails.classes.history import Call
 
 from guardrails.classes.validation.validation_summary import ValidationSummary
 from litellm import Choices, CustomStreamWrapper, ModelResponse, StreamingChoices
@@ -11,6 +12,8 @@ import litellm
 
 from guardrails_api.classes.guarded_chat_completion import GuardedChatCompletion
 from guardrails_api.classes.http_error import HttpError
+from guardrails_api.utils.fast_json import dumps
+from guardrails_api.utils.guard_history import copy_guard
 
 ctx_chat_completion = contextvars.ContextVar("x_guardrails_api_ctx_chat_completion")
 ctx_chat_completion_stream = contextvars.ContextVar(
@@ -18,10 +21,31 @@ ctx_chat_completion_stream = contextvars.ContextVar(
 )
 
 
-async def guarded_chat_completion(
-    guard: Guard | AsyncGuard, payload: Any
+def find_call(guard: AsyncGuard, call_id: Optional[str]) -> Optional[Call]:
+    # Look the call up by the id on its outcome rather than trusting
+    # history.last to be the call of this request
+    return next((call for call in guard.history if call.id == call_id), None)
+
+
+def to_guarded_chat_completion(
+    chat_completion: ModelResponse, validation_outcome: ValidationOutcome
 ) -> GuardedChatCompletion:
+    # Reuse what litellm already validated instead of dumping the response
+    # and validating it into a GuardedChatCompletion again
+    fields = {
+        name: getattr(chat_completion, name)
+        for name in chat_completion.model_fields_set
+    }
+    return GuardedChatCompletion.model_construct(
+        **fields, guardrails=validation_outcome
+    )
 
+
+async def guarded_chat_completion(
+    guard: Guard | AsyncGuard,
+    payload: Any,
+    on_call: Optional[Callable[[Call], None]] = None,
+) -> GuardedChatCompletion:
     async def llm_wrapper(*args, messages, **kwargs) -> str:
         # We know this is not a streaming respons, hence the type ignores
         chat_completion: ModelResponse = await litellm.acompletion(
@@ -48,12 +72,16 @@ async def guarded_chat_completion(
         if isinstance(guard, Guard) and not isinstance(guard, AsyncGuard):
             _guard = AsyncGuard.from_dict(guard.to_dict())  # type: ignore
         else:
-            _guard = guard
+            _guard = copy_guard(guard)
 
         validation_outcome: ValidationOutcome = await _guard(
             num_reasks=0, llm_api=llm_wrapper, **payload
         )  # type: ignore
 
+        call = find_call(_guard, validation_outcome.call_id)
+        if on_call and call:
+            on_call(call)
+
         chat_completion = ctx_chat_completion.get()
         if not chat_completion:
             raise HttpError(
@@ -61,12 +89,7 @@ async def guarded_chat_completion(
                 message="The model did not return any message content, function call arguments, or tool call arguments.",
             )
 
-        completion = chat_completion.model_dump(exclude_none=True)
-        completion["guardrails"] = validation_outcome.model_dump(exclude_none=True)
-
-        guarded_completion = GuardedChatCompletion.model_validate(completion)
-
-        return guarded_completion
+        return to_guarded_chat_completion(chat_completion, validation_outcome)
 
     ctx = contextvars.copy_context()
 
@@ -74,47 +97,67 @@ async def guarded_chat_completion(
 
 
 async def guarded_chat_completion_stream(
-    guard: Guard | AsyncGuard, payload: Any
+    guard: Guard | AsyncGuard,
+    payload: Any,
+    on_call: Optional[Callable[[Call], None]] = None,
 ) -> AsyncGenerator[str, None]:
-    # Async Streaming for custom llm callables it broken in guardrails-ai<=0.9.1
-    # We just force it to be synchronous for now
-    _guard: Guard
-    if isinstance(guard, AsyncGuard):
-        _guard: Guard = Guard.from_dict(guard.to_dict())  # type: ignore
+    # Force Guard to be Async so chunks are forwarded as litellm yields them
+    # instead of blocking the event loop on a synchronous stream
+    _guard: AsyncGuard
+    if isinstance(guard, Guard) and not isinstance(guard, AsyncGuard):
+        _guard = AsyncGuard.from_dict(guard.to_dict())  # type: ignore
     else:
-        _guard = guard
-
-    def llm_wrapper(*args, messages, **kwargs) -> Iterator[str]:
+        # The guard is shared with concurrent streams, which would otherwise
+        # read each other's validator logs and calls off of its history
+        _guard = copy_guard(guard)
+
+    async def text_stream(
+        chat_completion_stream: CustomStreamWrapper,
+    ) -> AsyncIterator[str]:
+        try:
+            async for chunk in chat_completion_stream:
+                ctx_chat_completion_stream.set(chunk)
+                choice: StreamingChoices = chunk.choices[0]
+
+                output = ""
+                delta = choice.delta
+                if delta.content is not None:
+                    output = delta.content
+                elif delta.function_call and delta.function_call.arguments is not None:
+                    output = delta.function_call.arguments
+                elif (
+                    delta.tool_calls
+                    and delta.tool_calls[-1].function.arguments is not None
+                ):
+                    output = delta.tool_calls[-1].function.arguments
+                yield output
+        finally:
+            # Abort the upstream request when the guard stops iterating early,
+            # e.g. because the client disconnected
+            if hasattr(chat_completion_stream, "aclose"):
+                await chat_completion_stream.aclose()
+
+    async def llm_wrapper(*args, messages, **kwargs) -> SimpleNamespace:
         # We know this _is_ a streaming response, hence the type ignores
-        chat_completion_stream: CustomStreamWrapper = litellm.completion(
+        chat_completion_stream: CustomStreamWrapper = await litellm.acompletion(
             *args, messages=messages, **kwargs
         )  # type: ignore
-        for chunk in chat_completion_stream:
-            ctx_chat_completion_stream.set(chunk)
-            choice: StreamingChoices = chunk.choices[0]
-
-            output = ""
-            delta = choice.delta
-            if delta.content is not None:
-                output = delta.content
-            elif delta.function_call and delta.function_call.arguments is not None:
-                output = delta.function_call.arguments
-            elif (
-                delta.tool_calls and delta.tool_calls[-1].function.arguments is not None
-            ):
-                output = delta.tool_calls[-1].function.arguments
-            yield output
+        # AsyncGuard reads async streams off of the completion_stream attribute
+        return SimpleNamespace(completion_stream=text_stream(chat_completion_stream))
 
     async def run_guard():
-        guard_stream: Iterator[ValidationOutcome] = _guard(
+        guard_stream: AsyncIterator[ValidationOutcome] = await _guard(
             num_reasks=0, llm_api=llm_wrapper, **payload
         )  # type: ignore
         validator_logs = []
-        for result in guard_stream:
+        call_id = None
+        async for result in guard_stream:
             chunk = ctx_chat_completion_stream.get()
             ser_chunk = chunk.model_dump()
 
-            v_logs = _guard.history.last.validator_logs if _guard.history.last else []
+            call_id = result.call_id
+            call = find_call(_guard, call_id)
+            v_logs = call.validator_logs if call else []
             new_v_logs = [log for log in v_logs if log not in validator_logs]
             validator_logs.extend(new_v_logs)
             # TODO: Replace with guardrails_api.utils.attach_validation_summaries.attach_validation_summaries once we figure out why we can't just drop it in without duplications
@@ -123,7 +166,10 @@ async def guarded_chat_completion_stream(
                     ValidationSummary.from_validator_logs_only_fails(new_v_logs)
                 )
             ser_chunk["guardrails"] = result.model_dump()
-            yield f"data: {json.dumps(ser_chunk)}\n\n"
+            yield f"data: {dumps(ser_chunk).decode()}\n\n"
+        call = find_call(_guard, call_id)
+        if on_call and call:
+            on_call(call)
         yield "\n"
 
     ctx = contextvars.copy_context()
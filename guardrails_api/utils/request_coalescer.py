@@ -0,0 +1,104 @@
+import asyncio
+import hashlib
+import importlib
+import json
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from guardrails import AsyncGuard, Guard
+from guardrails_ai.types import Guard as IGuard
+
+from guardrails_api.utils.metrics import Metrics
+
+T = TypeVar("T")
+
+CoalesceKeyFunction = Callable[
+    [Guard | AsyncGuard | IGuard, str, Dict[str, Any]], Optional[str]
+]
+
+BYPASS_COALESCING_HEADER = "x-guardrails-bypass-coalescing"
+
+
+def validate_coalescing_is_enabled():
+    return os.environ.get("VALIDATE_COALESCING_ENABLED", "false").lower() == "true"
+
+
+def default_coalesce_key(
+    guard: Guard | AsyncGuard | IGuard,
+    guard_version: str,
+    validate_request: Dict[str, Any],
+) -> Optional[str]:
+    """Requests coalesce when they target the same guard version with an
+    identical request body."""
+    key_parts = [guard.id, guard_version, validate_request]
+    serialized = json.dumps(key_parts, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def get_coalesce_key_function() -> CoalesceKeyFunction:
+    # e.g. VALIDATE_COALESCE_KEY_FUNCTION=my_module:my_key_function
+    path = os.environ.get("VALIDATE_COALESCE_KEY_FUNCTION")
+    if not path:
+        return default_coalesce_key
+    module_name, _, function_name = path.partition(":")
+    if not function_name:
+        raise ValueError(
+            f"Invalid value for environment variable VALIDATE_COALESCE_KEY_FUNCTION: {path}! VALIDATE_COALESCE_KEY_FUNCTION must be in the form module:function!"
+        )
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+class RequestCoalescer:
+    """Single flight execution for identical concurrent requests.
+
+    The first request for a key runs the work; requests with the same key
+    that arrive before it finishes await the same result instead of
+    repeating it. Key functions return None to opt a request out.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:  # Double-checked locking
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def initialize(self):
+        self.enabled = validate_coalescing_is_enabled()
+        self.key_function = get_coalesce_key_function()
+        self.in_flight: Dict[str, asyncio.Future] = {}
+        self.metrics = Metrics()
+
+    def get_key(
+        self,
+        guard: Guard | AsyncGuard | IGuard,
+        guard_version: str,
+        validate_request: Dict[str, Any],
+    ) -> Optional[str]:
+        if not self.enabled:
+            return None
+        return self.key_function(guard, guard_version, validate_request)
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self.in_flight[key] = task
+
+            def on_done(done: asyncio.Future):
+                if self.in_flight.get(key) is done:
+                    del self.in_flight[key]
+                # Retrieve the exception in case every waiter went away
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(on_done)
+            self.metrics.increment("validate_coalescing_leaders_total")
+        else:
+            self.metrics.increment("validate_coalesced_total")
+        # Shielded so one waiter disconnecting doesn't cancel the others' work
+        return await asyncio.shield(task)
@@ -43,21 +43,15 @@ class TestToIGuard(unittest.TestCase):
         result = to_IGuard(iguard)
         self.assertIs(result, iguard)
 
-    @patch("guardrails_api.api.guards.IGuard")
-    def test_guard_instance_converted_via_model_validate(self, mock_iguard_class):
-        """Guard instances are converted via model_dump -> IGuard.model_validate."""
-        mock_guard = Mock(spec=Guard)
-        mock_guard.model_dump.return_value = {"name": "test", "id": "test-id"}
-        expected = Mock()
-        mock_iguard_class.model_validate.return_value = expected
-
-        result = to_IGuard(mock_guard)
-
-        mock_guard.model_dump.assert_called_once_with(exclude_none=True)
-        mock_iguard_class.model_validate.assert_called_once_with(
-            {"name": "test", "id": "test-id"}
-        )
-        self.assertIs(result, expected)
+    def test_guard_instance_returned_without_round_trip(self):
+        """Guard instances are IGuards and are returned without model_dump."""
+        guard = Guard(name="test")
+
+        with patch.object(Guard, "model_dump") as mock_model_dump:
+            result = to_IGuard(guard)
+
+        self.assertIs(result, guard)
+        mock_model_dump.assert_not_called()
 
 
 class TestGuardsAPI(unittest.TestCase):
@@ -115,6 +109,142 @@ class TestGuardsAPI(unittest.TestCase):
 
         mock_gc.get_guards.assert_called_once_with(guard_name="my guard")
 
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_get_guards_page_returns_next_cursor(self, mock_get_gc):
+        """A limit pages through guards and returns a cursor for the next page"""
+        mock_gc = Mock()
+        mock_gc.list_guards.return_value = (
+            [IGuard(name="guard1", id="guard-1")],
+            ("guard1", "guard-1"),
+        )
+        mock_get_gc.return_value = mock_gc
+
+        response = self.client.get("/guards?limit=1")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([g["name"] for g in data["guards"]], ["guard1"])
+        self.assertNotIn("history", data["guards"][0])
+        mock_gc.list_guards.assert_called_once_with(
+            guard_name=None, limit=1, after=None, fields=None
+        )
+
+        mock_gc.list_guards.return_value = ([], None)
+        response = self.client.get(f"/guards?limit=1&cursor={data['nextCursor']}")
+
+        self.assertIsNone(response.json()["nextCursor"])
+        mock_gc.list_guards.assert_called_with(
+            guard_name=None, limit=1, after=("guard1", "guard-1"), fields=None
+        )
+
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_get_guards_projects_fields(self, mock_get_gc):
+        mock_gc = Mock()
+        mock_gc.list_guards.return_value = (
+            [{"id": "guard-1", "name": "guard1"}],
+            None,
+        )
+        mock_get_gc.return_value = mock_gc
+
+        response = self.client.get("/guards?fields=id,name")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {"guards": [{"id": "guard-1", "name": "guard1"}], "nextCursor": None},
+        )
+        mock_gc.list_guards.assert_called_once_with(
+            guard_name=None, limit=1000, after=None, fields=["id", "name"]
+        )
+
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_get_guards_rejects_unknown_fields(self, mock_get_gc):
+        mock_get_gc.return_value = Mock()
+
+        response = self.client.get("/guards?fields=id,guard")
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_get_guards_rejects_invalid_cursor(self, mock_get_gc):
+        mock_get_gc.return_value = Mock()
+
+        response = self.client.get("/guards?cursor=not-a-cursor")
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_get_guards_streams_every_page(self, mock_get_gc):
+        """stream=true writes NDJSON, reading pages until there are no more"""
+        mock_gc = Mock()
+        mock_gc.list_guards.side_effect = [
+            ([{"name": "guard1"}], ("guard1", "guard-1")),
+            ([{"name": "guard2"}], None),
+        ]
+        mock_get_gc.return_value = mock_gc
+
+        response = self.client.get("/guards?stream=true&limit=1&fields=name")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        self.assertEqual(response.text, '{"name":"guard1"}\n{"name":"guard2"}\n')
+        self.assertEqual(mock_gc.list_guards.call_count, 2)
+        mock_gc.list_guards.assert_called_with(
+            guard_name=None, limit=1, after=("guard1", "guard-1"), fields=["name"]
+        )
+
+    def test_get_guards_documents_pages_in_openapi(self):
+        """The OpenAPI schema describes both the list and the page shape"""
+        schema = self.app.openapi()
+        content = schema["paths"]["/guards"]["get"]["responses"]["200"]["content"]
+
+        self.assertEqual(
+            content["application/json"]["schema"]["anyOf"][1],
+            {"$ref": "#/components/schemas/GuardsPage"},
+        )
+        self.assertIn("application/x-ndjson", content)
+        page = schema["components"]["schemas"]["GuardsPage"]
+        self.assertEqual(page["required"], ["guards", "nextCursor"])
+        self.assertIn("GuardFields", schema["components"]["schemas"])
+
+    # --- POST /guards:bulk ---
+
+    @patch("guardrails_api.api.guards.postgres_is_enabled")
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_bulk_import_501_without_postgres(self, mock_get_gc, mock_pg):
+        mock_pg.return_value = False
+        mock_get_gc.return_value = Mock()
+
+        response = self.client.post("/guards:bulk", content=b"")
+
+        self.assertEqual(response.status_code, 501)
+
+    @patch("guardrails_api.api.guards.guard_cache")
+    @patch("guardrails_api.api.guards.postgres_is_enabled")
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_bulk_import_reports_each_line(self, mock_get_gc, mock_pg, mock_cache):
+        """Valid lines are upserted together; every line gets a result"""
+        mock_pg.return_value = True
+        mock_gc = Mock()
+        mock_gc.upsert_guards.return_value = [IGuard(name="a", id="a"), None]
+        mock_get_gc.return_value = mock_gc
+
+        response = self.client.post(
+            "/guards:bulk?overwrite=false",
+            content=b'{"id": "a", "name": "a"}\nnot json\n{"id": "b", "name": "b"}\n',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        results = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(
+            [(r["line"], r["status"]) for r in results],
+            [(1, "written"), (2, "invalid"), (3, "conflict")],
+        )
+        guards, overwrite = mock_gc.upsert_guards.call_args.args
+        self.assertEqual([g.id for g in guards], ["a", "b"])
+        self.assertFalse(overwrite)
+        mock_cache.invalidate.assert_called_once_with("a")
+
     # --- POST /guards ---
 
     @patch("guardrails_api.api.guards.postgres_is_enabled")
@@ -233,6 +363,23 @@ class TestGuardsAPI(unittest.TestCase):
         call_id_arg = mock_gc.upsert_guard.call_args[0][0]
         self.assertEqual(call_id_arg, "test-guard")
 
+    @patch("guardrails_api.api.guards.guard_cache")
+    @patch("guardrails_api.api.guards.postgres_is_enabled")
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_update_guard_invalidates_hydrated_guard(
+        self, mock_get_gc, mock_pg, mock_guard_cache
+    ):
+        mock_pg.return_value = True
+        mock_gc = Mock()
+        mock_gc.upsert_guard.return_value = IGuard(name="test_guard", id="test-guard")
+        mock_get_gc.return_value = mock_gc
+
+        self.client.put(
+            "/guards/test-guard", json={"name": "test_guard", "id": "test-guard"}
+        )
+
+        mock_guard_cache.invalidate.assert_called_once_with("test-guard")
+
     @patch("guardrails_api.api.guards.postgres_is_enabled")
     @patch("guardrails_api.api.guards.get_guard_client")
     def test_update_guard_url_decodes_id(self, mock_get_gc, mock_pg):
@@ -286,6 +433,21 @@ class TestGuardsAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         mock_gc.delete_guard.assert_called_once_with("test-guard")
 
+    @patch("guardrails_api.api.guards.guard_cache")
+    @patch("guardrails_api.api.guards.postgres_is_enabled")
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_delete_guard_invalidates_hydrated_guard(
+        self, mock_get_gc, mock_pg, mock_guard_cache
+    ):
+        mock_pg.return_value = True
+        mock_gc = Mock()
+        mock_gc.delete_guard.return_value = IGuard(name="test_guard", id="test-guard")
+        mock_get_gc.return_value = mock_gc
+
+        self.client.delete("/guards/test-guard")
+
+        mock_guard_cache.invalidate.assert_called_once_with("test-guard")
+
     @patch("guardrails_api.api.guards.postgres_is_enabled")
     @patch("guardrails_api.api.guards.get_guard_client")
     def test_delete_guard_url_decodes_id(self, mock_get_gc, mock_pg):
@@ -317,10 +479,10 @@ class TestGuardsAPI(unittest.TestCase):
 
     # --- GET /guards/{id}/history/{call_id} ---
 
-    @patch("guardrails_api.api.guards.cache_client")
-    def test_guard_history_returns_200_with_cached_value(self, mock_cache):
-        # Cache returns a serialized list; FastAPI validates it as list[Call]
-        mock_cache.get = AsyncMock(return_value=json.dumps([{}]))
+    @patch("guardrails_api.api.guards.guard_history_store")
+    def test_guard_history_returns_200_with_cached_value(self, mock_history_store):
+        # FastAPI validates the recorded calls as list[Call]
+        mock_history_store.get_history = AsyncMock(return_value=[{}])
 
         response = self.client.get("/guards/test-guard/history/call-123")
 
@@ -328,14 +490,67 @@ class TestGuardsAPI(unittest.TestCase):
         self.assertIsInstance(response.json(), list)
         self.assertEqual(len(response.json()), 1)
 
-    @patch("guardrails_api.api.guards.cache_client")
-    def test_guard_history_returns_empty_list_when_not_cached(self, mock_cache):
-        mock_cache.get = AsyncMock(return_value=None)
+    @patch("guardrails_api.api.guards.guard_history_store")
+    def test_guard_history_returns_empty_list_when_not_cached(self, mock_history_store):
+        mock_history_store.get_history = AsyncMock(return_value=[])
 
         response = self.client.get("/guards/test-guard/history/call-123")
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), [])
+        mock_history_store.get_history.assert_awaited_once_with(
+            "test-guard", "call-123"
+        )
+
+    # --- GET /guards/{id}/calls ---
+
+    @patch("guardrails_api.api.guards.guard_call_store")
+    def test_guard_calls_501_when_disabled(self, mock_call_store):
+        mock_call_store.enabled = False
+
+        response = self.client.get("/guards/test-guard/calls")
+
+        self.assertEqual(response.status_code, 501)
+        self.assertIn("GUARD_CALLS_ENABLED", response.json()["detail"])
+
+    @patch("guardrails_api.api.guards.guard_call_store")
+    def test_guard_calls_returns_page(self, mock_call_store):
+        mock_call_store.enabled = True
+        page = {"calls": [{"id": "call-1"}], "nextCursor": "abc"}
+        mock_call_store.get_calls = AsyncMock(return_value=page)
+
+        response = self.client.get(
+            "/guards/test%20guard/calls",
+            params={"start": "2026-10-18T00:00:00", "limit": 10, "cursor": "xyz"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), page)
+        args, kwargs = mock_call_store.get_calls.call_args
+        self.assertEqual(args, ("test guard",))
+        self.assertEqual(kwargs["start"].isoformat(), "2026-10-18T00:00:00")
+        self.assertIsNone(kwargs["end"])
+        self.assertEqual(kwargs["limit"], 10)
+        self.assertEqual(kwargs["cursor"], "xyz")
+
+    @patch("guardrails_api.api.guards.guard_call_store")
+    def test_guard_calls_rejects_out_of_range_limit(self, mock_call_store):
+        mock_call_store.enabled = True
+
+        response = self.client.get("/guards/test-guard/calls", params={"limit": 0})
+
+        self.assertEqual(response.status_code, 422)
+
+    @patch("guardrails_api.api.guards.guard_call_store")
+    def test_guard_call_returns_call(self, mock_call_store):
+        mock_call_store.enabled = True
+        mock_call_store.get_call = AsyncMock(return_value={"id": "call-1"})
+
+        response = self.client.get("/guards/test-guard/calls/call-1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"id": "call-1"})
+        mock_call_store.get_call.assert_awaited_once_with("test-guard", "call-1")
 
     # --- Router structure ---
 
@@ -366,6 +581,8 @@ class TestGuardsAPI(unittest.TestCase):
             "/guards/{id}/openai/v1/chat/completions",
             "/guards/{id}/validate",
             "/guards/{id}/history/{call_id}",
+            "/guards/{id}/calls",
+            "/guards/{id}/calls/{call_id}",
         }
         self.assertTrue(expected.issubset(routes))
 
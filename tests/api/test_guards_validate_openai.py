@@ -5,11 +5,26 @@ import os
 from unittest.mock import patch, Mock, AsyncMock
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
-from guardrails import AsyncGuard
+import asyncio
+import json
+import threading
+import httpx
+from guardrails import AsyncGuard, Guard
+from guardrails.classes import ValidationOutcome
+from guardrails.classes.generic.stack import Stack
+from guardrails.classes.history import Call
+from guardrails.classes.history.call_inputs import CallInputs
 from guardrails.errors import ValidationError
 from guardrails_ai.types import Guard as IGuard
-from guardrails_api.api.guards import router
+from guardrails_api.api.guards import (
+    router,
+    guard_cache,
+    guard_executor,
+    request_coalescer,
+    validation_outcome_cache,
+)
 from guardrails_api.classes.guarded_chat_completion import GuardedChatCompletion
+from guardrails_api.clients.hydrated_guard_cache import get_guard_version
 
 HISTORY_OFF = {"GUARD_HISTORY_ENABLED": "false"}
 PGHOST = {"PGHOST": "localhost"}
@@ -37,6 +52,20 @@ class TestValidateEndpoint(unittest.TestCase):
         self.app = FastAPI()
         self.app.include_router(router)
         self.client = TestClient(self.app)
+        guard_cache.clear()
+        # Hydrated guards are mocks here; history bounding is tested separately
+        patcher = patch(
+            "guardrails_api.clients.hydrated_guard_cache.bound_guard_history",
+            side_effect=lambda guard: guard,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # and requests run on the mock itself instead of a copy of it
+        patcher = patch(
+            "guardrails_api.api.guards.copy_guard", side_effect=lambda guard: guard
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
         self._id = "my-guard"
         # Real IGuard so isinstance(guard_struct, IGuard) is True in the endpoint,
         # which triggers the AsyncGuard.from_dict path.
@@ -53,6 +82,7 @@ class TestValidateEndpoint(unittest.TestCase):
     def test_llm_output_routes_to_parse(self, mock_from_dict, mock_get_gc, mock_attach):
         """When llm_output is provided, guard.parse is called (not guard.__call__)."""
         mock_guard = Mock(spec=AsyncGuard)
+        mock_guard.history = Stack()
         mock_guard.parse = AsyncMock(return_value=Mock())
         mock_from_dict.return_value = mock_guard
         mock_get_gc.return_value = _guard_client(self.guard_struct)
@@ -103,6 +133,7 @@ class TestValidateEndpoint(unittest.TestCase):
     ):
         """Response body reflects the outcome returned by attach_validation_summaries."""
         mock_guard = Mock(spec=AsyncGuard)
+        mock_guard.history = Stack()
         mock_guard.parse = AsyncMock(return_value=Mock())
         mock_from_dict.return_value = mock_guard
         mock_get_gc.return_value = _guard_client(self.guard_struct)
@@ -320,6 +351,521 @@ class TestValidateEndpoint(unittest.TestCase):
             self.guard_struct.model_dump(exclude_none=True)
         )
 
+    # ------------------------------------------------------------------ #
+    # Guard execution
+    # ------------------------------------------------------------------ #
+
+    @patch.dict(os.environ, BASE_ENV)
+    @patch("guardrails_api.api.guards.attach_validation_summaries")
+    @patch("guardrails_api.api.guards.guard_executor")
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_sync_guard_runs_through_guard_executor(
+        self, mock_get_gc, mock_guard_executor, mock_attach
+    ):
+        """Sync guards from the guard client are executed by the guard executor."""
+        sync_guard = Mock(spec=Guard)
+        sync_guard.history = Stack()
+        sync_guard.id = self._id
+        mock_get_gc.return_value = _guard_client(sync_guard)
+        mock_guard_executor.run = AsyncMock(return_value=Mock())
+        mock_attach.return_value = _OUTCOME
+
+        response = self.client.post(
+            f"/guards/{self._id}/validate",
+            json={"llm_output": "Hello!"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        mock_guard_executor.run.assert_awaited_once()
+        self.assertIs(mock_guard_executor.run.call_args.args[0], sync_guard.parse)
+        self.assertEqual(
+            mock_guard_executor.run.call_args.kwargs["llm_output"], "Hello!"
+        )
+
+    @patch.dict(os.environ, {**BASE_ENV, "GUARD_EXECUTION_MODE": "thread"})
+    @patch("guardrails_api.api.guards.attach_validation_summaries")
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_thread_mode_runs_sync_guard_off_the_event_loop(
+        self, mock_get_gc, mock_attach
+    ):
+        """In thread mode sync guards execute on a guard executor thread."""
+        guard_executor.initialize()
+        self.addCleanup(guard_executor.initialize)
+        self.addCleanup(guard_executor.shutdown)
+        threads = []
+        sync_guard = Mock(spec=Guard)
+        sync_guard.history = Stack()
+        sync_guard.id = self._id
+        sync_guard.side_effect = lambda *a, **kw: threads.append(
+            threading.current_thread().name
+        )
+        mock_get_gc.return_value = _guard_client(sync_guard)
+        mock_attach.return_value = _OUTCOME
+
+        response = self.client.post(f"/guards/{self._id}/validate", json={})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("guard-executor"))
+
+    @patch.dict(os.environ, {**PGHOST, "GUARD_HISTORY_ENABLED": "true"})
+    @patch("guardrails_api.api.guards.guard_history_store")
+    @patch("guardrails_api.api.guards.attach_validation_summaries")
+    @patch("guardrails_api.api.guards.guard_process_pool")
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_process_mode_parses_in_guard_process_pool(
+        self, mock_get_gc, mock_guard_process_pool, mock_attach, mock_history_store
+    ):
+        """In process mode parse calls are shipped to the guard process pool."""
+        sync_guard = Mock(spec=Guard)
+        sync_guard.id = self._id
+        mock_get_gc.return_value = _guard_client(sync_guard)
+        outcome = Mock(call_id="call-1")
+        call = Mock(validator_logs=["log"])
+        call.model_dump.return_value = {"id": "call-1"}
+        mock_guard_process_pool.enabled = True
+        mock_guard_process_pool.parse = AsyncMock(return_value=(outcome, call))
+        mock_attach.return_value = _OUTCOME
+
+        response = self.client.post(
+            f"/guards/{self._id}/validate",
+            json={"llm_output": "Hello!", "metadata": {"k": "v"}},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        sync_guard.parse.assert_not_called()
+        kwargs = mock_guard_process_pool.parse.call_args.kwargs
+        self.assertEqual(kwargs["llm_output"], "Hello!")
+        self.assertEqual(kwargs["metadata"], {"k": "v"})
+        mock_attach.assert_called_once_with(outcome, sync_guard, ["log"])
+        mock_history_store.record.assert_called_once_with(self._id, call)
+
+    # ------------------------------------------------------------------ #
+    # Validation outcome cache
+    # ------------------------------------------------------------------ #
+
+    def _enable_outcome_cache(self):
+        with patch.dict(os.environ, {"VALIDATION_CACHE_ENABLED": "true"}):
+            validation_outcome_cache.initialize()
+        self.addCleanup(validation_outcome_cache.initialize)
+
+    @patch.dict(os.environ, BASE_ENV)
+    @patch("guardrails_api.api.guards.record_call")
+    @patch("guardrails_api.api.guards.get_guard_client")
+    @patch("guardrails_api.api.guards.AsyncGuard.from_dict")
+    def test_repeated_parse_served_from_outcome_cache(
+        self, mock_from_dict, mock_get_gc, mock_record_call
+    ):
+        """An identical parse request is answered from the outcome cache."""
+        self._enable_outcome_cache()
+        mock_guard = Mock(spec=AsyncGuard)
+        mock_guard.id = self._id
+        mock_guard.history = Stack()
+
+        async def parse(**kwargs):
+            mock_guard.history.push(Call())
+            return _outcome("Hello!")
+
+        mock_guard.parse = AsyncMock(side_effect=parse)
+        mock_from_dict.return_value = mock_guard
+        mock_get_gc.return_value = _guard_client(self.guard_struct)
+        request = {"llm_output": "Hello!", "metadata": {"k": "v"}}
+
+        first = self.client.post(f"/guards/{self._id}/validate", json=request)
+        second = self.client.post(f"/guards/{self._id}/validate", json=request)
+        self.client.post(
+            f"/guards/{self._id}/validate",
+            json={**request, "metadata": {"k": "other"}},
+        )
+
+        self.assertEqual(second.status_code, 200)
+        first_outcome, second_outcome = first.json(), second.json()
+        # The replayed outcome isn't the first request's call
+        self.assertNotEqual(second_outcome.pop("callId"), first_outcome.pop("callId"))
+        self.assertEqual(second_outcome, first_outcome)
+        self.assertEqual(mock_guard.parse.await_count, 2)
+        # No call ran for the hit, so only the two parses are recorded
+        self.assertEqual(mock_record_call.call_count, 2)
+
+    @patch.dict(os.environ, BASE_ENV)
+    @patch("guardrails_api.api.guards.get_guard_client")
+    @patch("guardrails_api.api.guards.AsyncGuard.from_dict")
+    def test_reask_guard_bypasses_outcome_cache(self, mock_from_dict, mock_get_gc):
+        """Guards with reask validators are validated on every request."""
+        self._enable_outcome_cache()
+        guard_struct = IGuard.model_validate(
+            {
+                "id": self._id,
+                "name": "my-guard",
+                "validators": [{"id": "a/b", "onFail": "reask"}],
+            }
+        )
+        mock_guard = Mock(spec=AsyncGuard)
+        mock_guard.id = self._id
+        mock_guard.history = Stack()
+        mock_guard.parse = AsyncMock(return_value=_outcome("Hello!"))
+        mock_from_dict.return_value = mock_guard
+        mock_get_gc.return_value = _guard_client(guard_struct)
+
+        for _ in range(2):
+            self.client.post(
+                f"/guards/{self._id}/validate", json={"llm_output": "Hello!"}
+            )
+
+        self.assertEqual(mock_guard.parse.await_count, 2)
+
+    # ------------------------------------------------------------------ #
+    # Request coalescing
+    # ------------------------------------------------------------------ #
+
+    def _enable_coalescing(self):
+        with patch.dict(os.environ, {"VALIDATE_COALESCING_ENABLED": "true"}):
+            request_coalescer.initialize()
+        self.addCleanup(request_coalescer.initialize)
+
+    @patch.dict(os.environ, BASE_ENV)
+    @patch("guardrails_api.api.guards.attach_validation_summaries")
+    @patch("guardrails_api.api.guards.get_guard_client")
+    @patch("guardrails_api.api.guards.AsyncGuard.from_dict")
+    def test_parse_runs_through_request_coalescer(
+        self, mock_from_dict, mock_get_gc, mock_attach
+    ):
+        """Parse calls are keyed by the guard version and request body and run
+        single flight, hashing the guard definition once."""
+        self._enable_coalescing()
+        mock_guard = Mock(spec=AsyncGuard)
+        mock_guard.history = Stack()
+        mock_guard.parse = AsyncMock(return_value=Mock())
+        mock_from_dict.return_value = mock_guard
+        mock_get_gc.return_value = _guard_client(self.guard_struct)
+        mock_attach.return_value = _OUTCOME
+        request_coalescer.key_function = Mock(return_value="key")
+
+        with (
+            patch.object(
+                request_coalescer, "run", wraps=request_coalescer.run
+            ) as mock_run,
+            patch(
+                "guardrails_api.api.guards.get_guard_version",
+                wraps=get_guard_version,
+            ) as mock_get_guard_version,
+        ):
+            response = self.client.post(
+                f"/guards/{self._id}/validate",
+                json={"llm_output": "Hello!"},
+                headers={"x-openai-api-key": "header-key"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_run.call_args.args[0], "key")
+        mock_get_guard_version.assert_called_once_with(self.guard_struct)
+        request_coalescer.key_function.assert_called_once_with(
+            self.guard_struct,
+            get_guard_version(self.guard_struct),
+            {"llm_output": "Hello!", "api_key": "header-key"},
+        )
+        self.assertEqual(mock_guard.parse.await_count, 1)
+
+    @patch.dict(os.environ, BASE_ENV)
+    @patch("guardrails_api.api.guards.attach_validation_summaries")
+    @patch("guardrails_api.api.guards.get_guard_client")
+    @patch("guardrails_api.api.guards.AsyncGuard.from_dict")
+    def test_bypass_header_skips_request_coalescer(
+        self, mock_from_dict, mock_get_gc, mock_attach
+    ):
+        """The bypass header runs the parse without coalescing."""
+        self._enable_coalescing()
+        mock_guard = Mock(spec=AsyncGuard)
+        mock_guard.history = Stack()
+        mock_guard.parse = AsyncMock(return_value=Mock())
+        mock_from_dict.return_value = mock_guard
+        mock_get_gc.return_value = _guard_client(self.guard_struct)
+        mock_attach.return_value = _OUTCOME
+        request_coalescer.key_function = Mock(return_value="key")
+
+        response = self.client.post(
+            f"/guards/{self._id}/validate",
+            json={"llm_output": "Hello!"},
+            headers={"x-guardrails-bypass-coalescing": "true"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        request_coalescer.key_function.assert_not_called()
+        self.assertEqual(mock_guard.parse.await_count, 1)
+
+
+def _outcome(llm_output: str) -> ValidationOutcome:
+    return ValidationOutcome(
+        callId=f"call-{llm_output}",
+        validationPassed=True,
+        validatedOutput=llm_output,
+        rawLlmOutput=llm_output,
+    )
+
+
+async def _post_concurrently(app: FastAPI, url: str, bodies: list[dict]) -> list:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        return await asyncio.gather(*[c.post(url, json=body) for body in bodies])
+
+
+class TestValidateSharedGuard(unittest.TestCase):
+    """Concurrent requests on one cached, really hydrated AsyncGuard."""
+
+    def setUp(self):
+        self.app = FastAPI()
+        self.app.include_router(router)
+        guard_cache.clear()
+        self.addCleanup(guard_cache.clear)
+        self._id = "my-guard"
+        self.guard_struct = IGuard(name="my-guard", id=self._id)
+
+    @patch.dict(os.environ, BASE_ENV)
+    @patch("guardrails_api.api.guards.record_call")
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_concurrent_streams_record_their_own_calls(
+        self, mock_get_gc, mock_record_call
+    ):
+        mock_get_gc.return_value = _guard_client(self.guard_struct)
+
+        async def fake_call(guard, *args, prompt_params, **kwargs):
+            call = Call(inputs=CallInputs(promptParams=prompt_params))
+            guard.history.push(call)
+
+            async def chunks():
+                # Both streams are in flight before either one finishes
+                for _ in range(3):
+                    await asyncio.sleep(0.01)
+                    yield ValidationOutcome(
+                        callId=call.id,
+                        validationPassed=True,
+                        validatedOutput=prompt_params["output"],
+                        rawLlmOutput=prompt_params["output"],
+                    )
+
+            return chunks()
+
+        with patch.object(AsyncGuard, "__call__", fake_call):
+            responses = asyncio.run(
+                _post_concurrently(
+                    self.app,
+                    f"/guards/{self._id}/validate",
+                    [
+                        {"stream": True, "prompt_params": {"output": output}}
+                        for output in ["a", "b"]
+                    ],
+                )
+            )
+
+        self.assertEqual([r.status_code for r in responses], [200, 200])
+        recorded = [c.args[1] for c in mock_record_call.call_args_list]
+        self.assertEqual(
+            sorted(call.inputs.prompt_params["output"] for call in recorded),
+            ["a", "b"],
+        )
+        self.assertNotEqual(recorded[0].id, recorded[1].id)
+        # Calls ran on per request copies of the cached guard
+        cached_guard = guard_cache.hydrate(
+            self.guard_struct, get_guard_version(self.guard_struct)
+        )
+        self.assertEqual(len(cached_guard.history), 0)
+
+    @patch.dict(os.environ, {**PGHOST, "GUARD_HISTORY_ENABLED": "true"})
+    @patch("guardrails_api.api.guards.record_call")
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_coalesced_parse_records_call_once(self, mock_get_gc, mock_record_call):
+        with patch.dict(os.environ, {"VALIDATE_COALESCING_ENABLED": "true"}):
+            request_coalescer.initialize()
+        self.addCleanup(request_coalescer.initialize)
+        mock_get_gc.return_value = _guard_client(self.guard_struct)
+        parse_count = 0
+
+        async def fake_parse(guard, llm_output, **kwargs):
+            nonlocal parse_count
+            parse_count += 1
+            call = Call(inputs=CallInputs())
+            guard.history.push(call)
+            # Keeps the leader in flight while the other requests arrive
+            await asyncio.sleep(0.05)
+            return ValidationOutcome(
+                callId=call.id,
+                validationPassed=True,
+                validatedOutput=llm_output,
+                rawLlmOutput=llm_output,
+            )
+
+        with patch.object(AsyncGuard, "parse", fake_parse):
+            responses = asyncio.run(
+                _post_concurrently(
+                    self.app,
+                    f"/guards/{self._id}/validate",
+                    [{"llm_output": "Hello!"}] * 5,
+                )
+            )
+
+        self.assertEqual([r.status_code for r in responses], [200] * 5)
+        self.assertEqual(len({r.json()["callId"] for r in responses}), 1)
+        self.assertEqual(parse_count, 1)
+        mock_record_call.assert_called_once()
+
+
+class TestValidateBatchEndpoint(unittest.TestCase):
+    """Tests for POST /guards/{id}/validate/batch."""
+
+    def setUp(self):
+        self.app = FastAPI()
+        self.app.include_router(router)
+        self.client = TestClient(self.app)
+        guard_cache.clear()
+        self._id = "my-guard"
+        self.guard_struct = IGuard(name="my-guard", id=self._id)
+        self.mock_guard = Mock(spec=AsyncGuard)
+        self.mock_guard.id = self._id
+        self.mock_guard.history = Stack()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def parse(llm_output, **kwargs):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            # Later items finish first so completion order differs from input
+            await asyncio.sleep(0.01 * (3 - int(llm_output)))
+            self.in_flight -= 1
+            if llm_output == "2":
+                raise ValidationError("bad output")
+            return _outcome(llm_output)
+
+        self.mock_guard.parse = AsyncMock(side_effect=parse)
+
+    @patch.dict(os.environ, BASE_ENV)
+    @patch("guardrails_api.api.guards.get_guard_client")
+    @patch("guardrails_api.api.guards.AsyncGuard.from_dict")
+    def test_returns_outcomes_in_order(self, mock_from_dict, mock_get_gc):
+        """Outcomes are returned in request order with errors in place."""
+        mock_from_dict.return_value = self.mock_guard
+        mock_gc = _guard_client(self.guard_struct)
+        mock_get_gc.return_value = mock_gc
+
+        response = self.client.post(
+            f"/guards/{self._id}/validate/batch",
+            json={
+                "items": [{"llm_output": "0"}, {"llm_output": "1"}, {"llm_output": "2"}]
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([r.get("validatedOutput") for r in body[:2]], ["0", "1"])
+        self.assertEqual(body[2], {"error": {"message": "bad output"}})
+        mock_gc.get_guard.assert_called_once_with(self._id)
+        mock_from_dict.assert_called_once()
+
+    @patch.dict(os.environ, {**BASE_ENV, "VALIDATE_BATCH_MAX_CONCURRENCY": "2"})
+    @patch("guardrails_api.api.guards.get_guard_client")
+    @patch("guardrails_api.api.guards.AsyncGuard.from_dict")
+    def test_limits_concurrency(self, mock_from_dict, mock_get_gc):
+        """No more than VALIDATE_BATCH_MAX_CONCURRENCY items run at once."""
+        mock_from_dict.return_value = self.mock_guard
+        mock_get_gc.return_value = _guard_client(self.guard_struct)
+
+        self.client.post(
+            f"/guards/{self._id}/validate/batch",
+            json={"items": [{"llm_output": str(i % 2)} for i in range(6)]},
+        )
+
+        self.assertEqual(self.mock_guard.parse.call_count, 6)
+        self.assertEqual(self.max_in_flight, 2)
+
+    @patch.dict(os.environ, BASE_ENV)
+    @patch("guardrails_api.api.guards.get_guard_client")
+    @patch("guardrails_api.api.guards.AsyncGuard.from_dict")
+    def test_item_kwargs_passed_to_parse(self, mock_from_dict, mock_get_gc):
+        """Each item's parse arguments and the api key reach guard.parse."""
+        mock_from_dict.return_value = self.mock_guard
+        mock_get_gc.return_value = _guard_client(self.guard_struct)
+
+        self.client.post(
+            f"/guards/{self._id}/validate/batch",
+            json={
+                "items": [
+                    {
+                        "llm_output": "1",
+                        "num_reasks": 0,
+                        "metadata": {"k": "v"},
+                    }
+                ]
+            },
+            headers={"x-openai-api-key": "header-key"},
+        )
+
+        kwargs = self.mock_guard.parse.call_args.kwargs
+        self.assertEqual(kwargs["llm_output"], "1")
+        self.assertEqual(kwargs["num_reasks"], 0)
+        self.assertEqual(kwargs["metadata"], {"k": "v"})
+        self.assertEqual(kwargs["api_key"], "header-key")
+
+    @patch.dict(os.environ, BASE_ENV)
+    @patch("guardrails_api.api.guards.get_guard_client")
+    @patch("guardrails_api.api.guards.AsyncGuard.from_dict")
+    def test_stream_returns_ndjson_in_completion_order(
+        self, mock_from_dict, mock_get_gc
+    ):
+        """stream=True yields one indexed NDJSON line per item as it completes."""
+        mock_from_dict.return_value = self.mock_guard
+        mock_get_gc.return_value = _guard_client(self.guard_struct)
+
+        response = self.client.post(
+            f"/guards/{self._id}/validate/batch",
+            json={
+                "items": [{"llm_output": "0"}, {"llm_output": "1"}],
+                "stream": True,
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(
+            response.headers["content-type"].startswith("application/x-ndjson")
+        )
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([line["index"] for line in lines], [1, 0])
+        self.assertEqual(lines[0]["validatedOutput"], "1")
+
+    @patch.dict(os.environ, BASE_ENV)
+    @patch("guardrails_api.api.guards.get_guard_client")
+    @patch("guardrails_api.api.guards.AsyncGuard.from_dict")
+    def test_repeated_items_served_from_outcome_cache(
+        self, mock_from_dict, mock_get_gc
+    ):
+        """Items already validated are answered from the outcome cache."""
+        with patch.dict(os.environ, {"VALIDATION_CACHE_ENABLED": "true"}):
+            validation_outcome_cache.initialize()
+        self.addCleanup(validation_outcome_cache.initialize)
+        mock_from_dict.return_value = self.mock_guard
+        mock_get_gc.return_value = _guard_client(self.guard_struct)
+        request = {"items": [{"llm_output": "0"}, {"llm_output": "1"}]}
+
+        first = self.client.post(f"/guards/{self._id}/validate/batch", json=request)
+        response = self.client.post(f"/guards/{self._id}/validate/batch", json=request)
+
+        self.assertEqual([r["validatedOutput"] for r in response.json()], ["0", "1"])
+        self.assertEqual(self.mock_guard.parse.await_count, 2)
+        # Replayed items get call ids of their own
+        call_ids = [r["callId"] for r in first.json() + response.json()]
+        self.assertEqual(len(set(call_ids)), 4)
+
+    @patch.dict(os.environ, BASE_ENV)
+    @patch("guardrails_api.api.guards.get_guard_client")
+    def test_guard_not_found_returns_404(self, mock_get_gc):
+        """Returns 404 when the guard does not exist."""
+        mock_get_gc.return_value = _guard_client(None)
+
+        response = self.client.post(
+            f"/guards/{self._id}/validate/batch",
+            json={"items": [{"llm_output": "0"}]},
+        )
+
+        self.assertEqual(response.status_code, 404)
+
 
 class TestOpenAIV1ChatCompletionsEndpoint(unittest.TestCase):
     """Tests for POST /guards/{id}/openai/v1/chat/completions."""
@@ -328,6 +874,14 @@ class TestOpenAIV1ChatCompletionsEndpoint(unittest.TestCase):
         self.app = FastAPI()
         self.app.include_router(router)
         self.client = TestClient(self.app)
+        guard_cache.clear()
+        # Hydrated guards are mocks here; history bounding is tested separately
+        patcher = patch(
+            "guardrails_api.clients.hydrated_guard_cache.bound_guard_history",
+            side_effect=lambda guard: guard,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
         self._id = "my-guard"
         self.guard_struct = IGuard(name="my-guard", id=self._id)
 
@@ -1,7 +1,7 @@
 """Unit tests for guardrails_api.api.root module."""
 
 import unittest
-from unittest.mock import patch, Mock, MagicMock
+from unittest.mock import patch, Mock, MagicMock, AsyncMock
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
 from guardrails_api.api.root import router, HealthCheckResponse
@@ -57,6 +57,37 @@ class TestRootAPI(unittest.TestCase):
         self.assertEqual(data["status"], 200)
         self.assertEqual(data["message"], "Ok")
 
+    @patch("guardrails_api.api.root.logger")
+    @patch("guardrails_api.api.root.PostgresClient")
+    @patch("guardrails_api.api.root.postgres_async_is_enabled")
+    @patch("guardrails_api.api.root.postgres_is_enabled")
+    def test_health_check_with_async_postgres(
+        self,
+        mock_postgres_enabled,
+        mock_postgres_async_enabled,
+        mock_pg_client_class,
+        mock_logger,
+    ):
+        """Test health check awaits the async session when async postgres is enabled."""
+        mock_postgres_enabled.return_value = True
+        mock_postgres_async_enabled.return_value = True
+
+        mock_session = Mock()
+        mock_session.execute = AsyncMock()
+        mock_session.execute.return_value.all.return_value = [(5,)]
+
+        mock_pg_client = MagicMock()
+        mock_pg_client.AsyncSessionLocal.return_value.__aenter__.return_value = (
+            mock_session
+        )
+        mock_pg_client_class.return_value = mock_pg_client
+
+        response = self.client.get("/health-check")
+
+        self.assertEqual(response.status_code, 200)
+        mock_session.execute.assert_awaited_once()
+        mock_pg_client.SessionLocal.assert_not_called()
+
     @patch("guardrails_api.api.root.logger")
     @patch("guardrails_api.api.root.PostgresClient")
     @patch("guardrails_api.api.root.postgres_is_enabled")
@@ -75,6 +106,25 @@ class TestRootAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 500)
         mock_logger.error.assert_called()
 
+    @patch("guardrails_api.api.root.Metrics")
+    def test_metrics_endpoint(self, mock_metrics_class):
+        """Test that the metrics endpoint returns the metrics snapshot."""
+        mock_metrics_class.return_value.snapshot.return_value = {
+            "counters": {"guard_executor_completed_total": 2},
+            "gauges": {"guard_executor_queue_depth": 0},
+        }
+
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "counters": {"guard_executor_completed_total": 2},
+                "gauges": {"guard_executor_queue_depth": 0},
+            },
+        )
+
 
 class TestHealthCheckResponse(unittest.TestCase):
     """Test cases for HealthCheckResponse model."""
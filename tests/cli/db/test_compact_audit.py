@@ -0,0 +1,103 @@
+from typer.testing import CliRunner
+
+from guardrails_api.cli.db.db import db_command
+
+
+class TestCompactAudit:
+    def test_uses_older_than_days(self, mocker):
+        mocker.patch(
+            "guardrails_api.cli.db.compact_audit.os.path.isfile", return_value=False
+        )
+        mock_pg_client = mocker.patch(
+            "guardrails_api.cli.db.compact_audit.PostgresClient"
+        ).return_value
+        mock_compact = mocker.patch(
+            "guardrails_api.cli.db.compact_audit.compact_audit_db", return_value=4
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(db_command, ["compact-audit", "--older-than-days", "30"])
+
+        assert result.exit_code == 0
+        mock_pg_client.create_engines.assert_called_once()
+        mock_compact.assert_called_once_with(
+            mock_pg_client.engine, 30, batch_size=1000, archive=None
+        )
+        assert "Removed 4 guard versions." in result.output
+
+    def test_defaults_to_retention_env_var(self, mocker):
+        mocker.patch(
+            "guardrails_api.cli.db.compact_audit.os.path.isfile", return_value=False
+        )
+        mocker.patch.dict("os.environ", {"GUARD_AUDIT_RETENTION_DAYS": "90"})
+        mocker.patch("guardrails_api.cli.db.compact_audit.PostgresClient")
+        mock_compact = mocker.patch(
+            "guardrails_api.cli.db.compact_audit.compact_audit_db", return_value=0
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(db_command, ["compact-audit", "--batch-size", "50"])
+
+        assert result.exit_code == 0
+        args, kwargs = mock_compact.call_args
+        assert args[1] == 90
+        assert kwargs["batch_size"] == 50
+
+    def test_requires_a_retention_period(self, mocker):
+        mocker.patch(
+            "guardrails_api.cli.db.compact_audit.os.path.isfile", return_value=False
+        )
+        mocker.patch.dict("os.environ", {}, clear=True)
+        mock_compact = mocker.patch(
+            "guardrails_api.cli.db.compact_audit.compact_audit_db"
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(db_command, ["compact-audit"])
+
+        assert result.exit_code == 2
+        mock_compact.assert_not_called()
+
+    def test_writes_archive(self, mocker, tmp_path):
+        mocker.patch(
+            "guardrails_api.cli.db.compact_audit.os.path.isfile", return_value=False
+        )
+        mocker.patch("guardrails_api.cli.db.compact_audit.PostgresClient")
+
+        def compact(engine, retention_days, batch_size, archive):
+            archive.write(b'{"id":"a"}\n')
+            return 1
+
+        mocker.patch(
+            "guardrails_api.cli.db.compact_audit.compact_audit_db",
+            side_effect=compact,
+        )
+        archive_file = tmp_path / "audit.ndjson"
+
+        runner = CliRunner()
+        result = runner.invoke(
+            db_command,
+            ["compact-audit", "--older-than-days", "1", "--archive", str(archive_file)],
+        )
+
+        assert result.exit_code == 0
+        assert archive_file.read_bytes() == b'{"id":"a"}\n'
+
+
+class TestPartitionAudit:
+    def test_partitions_audit_table(self, mocker):
+        mocker.patch(
+            "guardrails_api.cli.db.partition_audit.os.path.isfile", return_value=False
+        )
+        mock_pg_client = mocker.patch(
+            "guardrails_api.cli.db.partition_audit.PostgresClient"
+        ).return_value
+        mock_partition = mocker.patch(
+            "guardrails_api.cli.db.partition_audit.partition_audit_db"
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(db_command, ["partition-audit"])
+
+        assert result.exit_code == 0
+        mock_partition.assert_called_once_with(mock_pg_client.engine)
@@ -0,0 +1,31 @@
+from guardrails_ai.types import Guard as IGuard
+from typer.testing import CliRunner
+
+from guardrails_api.cli.guards.guards import guards_command
+
+
+class TestExportGuards:
+    def test_writes_every_page_as_ndjson(self, mocker, tmp_path):
+        mocker.patch("guardrails_api.cli.guards.export_guards.PostgresClient")
+        mocker.patch(
+            "guardrails_api.cli.guards.export_guards.os.path.isfile",
+            return_value=False,
+        )
+        mock_client = mocker.patch(
+            "guardrails_api.cli.guards.export_guards.PGGuardClient"
+        ).return_value
+        mock_client.list_guards.side_effect = [
+            ([IGuard(id="a", name="a")], ("a", "a")),
+            ([IGuard(id="b", name="b")], None),
+        ]
+        guards_file = tmp_path / "guards.ndjson"
+
+        runner = CliRunner()
+        result = runner.invoke(
+            guards_command, ["export", str(guards_file), "--batch-size", "1"]
+        )
+
+        assert result.exit_code == 0
+        lines = guards_file.read_bytes().splitlines()
+        assert [IGuard.model_validate_json(line).id for line in lines] == ["a", "b"]
+        mock_client.list_guards.assert_called_with(limit=1, after=("a", "a"))
@@ -0,0 +1,70 @@
+from typer.testing import CliRunner
+
+from guardrails_api.cli.guards.guards import guards_command
+
+
+class TestImportGuards:
+    def test_imports_guards_from_stdin(self, mocker):
+        mocker.patch("guardrails_api.cli.guards.import_guards.PostgresClient")
+        mocker.patch(
+            "guardrails_api.cli.guards.import_guards.os.path.isfile",
+            return_value=False,
+        )
+        mock_client = mocker.patch(
+            "guardrails_api.cli.guards.import_guards.PGGuardClient"
+        ).return_value
+        mock_client.upsert_guards.side_effect = lambda guards, overwrite: guards
+
+        runner = CliRunner()
+        result = runner.invoke(
+            guards_command,
+            ["import"],
+            input='{"id": "a", "name": "a"}\n{"id": "b", "name": "b"}\n',
+        )
+
+        assert result.exit_code == 0
+        guards, overwrite = mock_client.upsert_guards.call_args.args
+        assert [g.id for g in guards] == ["a", "b"]
+        assert overwrite is True
+        assert "2 written, 0 conflict, 0 invalid" in result.output
+
+    def test_reports_conflicts_without_overwrite(self, mocker):
+        mocker.patch("guardrails_api.cli.guards.import_guards.PostgresClient")
+        mocker.patch(
+            "guardrails_api.cli.guards.import_guards.os.path.isfile",
+            return_value=False,
+        )
+        mock_client = mocker.patch(
+            "guardrails_api.cli.guards.import_guards.PGGuardClient"
+        ).return_value
+        mock_client.upsert_guards.return_value = [None]
+
+        runner = CliRunner()
+        result = runner.invoke(
+            guards_command,
+            ["import", "--no-overwrite"],
+            input='{"id": "a", "name": "a"}\n',
+        )
+
+        assert result.exit_code == 0
+        assert mock_client.upsert_guards.call_args.args[1] is False
+        assert '"status":"conflict"' in result.output
+
+    def test_exits_with_1_on_invalid_lines(self, mocker, tmp_path):
+        mocker.patch("guardrails_api.cli.guards.import_guards.PostgresClient")
+        mocker.patch(
+            "guardrails_api.cli.guards.import_guards.os.path.isfile",
+            return_value=False,
+        )
+        mock_client = mocker.patch(
+            "guardrails_api.cli.guards.import_guards.PGGuardClient"
+        ).return_value
+        mock_client.upsert_guards.return_value = []
+        guards_file = tmp_path / "guards.ndjson"
+        guards_file.write_text("not json\n")
+
+        runner = CliRunner()
+        result = runner.invoke(guards_command, ["import", str(guards_file)])
+
+        assert result.exit_code == 1
+        assert '"status":"invalid"' in result.output
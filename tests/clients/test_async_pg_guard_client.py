@@ -0,0 +1,258 @@
+"""Unit tests for guardrails_api.clients.async_pg_guard_client module."""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+from sqlalchemy.exc import IntegrityError
+from guardrails_api.classes.http_error import HttpError
+from guardrails_ai.types import CreateGuardRequest, Guard as IGuard
+from guardrails_api.clients.async_pg_guard_client import (
+    AsyncPGGuardClient,
+    is_unique_violation,
+)
+from guardrails_api.clients.pg_guard_client import BasePGGuardClient, PGGuardClient
+
+
+def _mock_session():
+    session = Mock()
+    session.get = AsyncMock(return_value=None)
+    session.scalars = AsyncMock(return_value=Mock())
+    session.execute = AsyncMock(return_value=Mock())
+    session.commit = AsyncMock()
+    session.delete = AsyncMock()
+    session.close = AsyncMock()
+    return session
+
+
+class TestIsUniqueViolation(unittest.TestCase):
+    """Test cases for the is_unique_violation function."""
+
+    def test_detects_sqlstate(self):
+        orig = Mock(sqlstate="23505")
+        error = IntegrityError(statement=None, params=None, orig=orig)
+        self.assertTrue(is_unique_violation(error))
+
+    def test_detects_pgcode(self):
+        orig = Mock(spec=["pgcode"], pgcode="23505")
+        error = IntegrityError(statement=None, params=None, orig=orig)
+        self.assertTrue(is_unique_violation(error))
+
+    def test_other_errors(self):
+        error = IntegrityError(statement=None, params=None, orig=Exception("other"))
+        self.assertFalse(is_unique_violation(error))
+
+
+class TestAsyncPGGuardClient(unittest.TestCase):
+    """Test cases for the AsyncPGGuardClient class."""
+
+    def setUp(self):
+        patcher = patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+        self.mock_pg_client = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.session = _mock_session()
+        self.mock_pg_client.return_value.AsyncSessionLocal.return_value = self.session
+
+    def test_shares_only_the_caches_with_pg_guard_client(self):
+        """Test that the async client doesn't inherit PGGuardClient's sync methods."""
+        client = AsyncPGGuardClient()
+
+        self.assertIsInstance(client, BasePGGuardClient)
+        self.assertNotIsInstance(client, PGGuardClient)
+        self.assertFalse(hasattr(client, "get_db_context"))
+
+    def test_get_async_db_context_closes_session(self):
+        """Test that the async session is closed on exit."""
+        client = AsyncPGGuardClient()
+
+        async def use_context():
+            async with client.get_async_db_context() as db:
+                self.assertIs(db, self.session)
+
+        asyncio.run(use_context())
+
+        self.session.close.assert_awaited_once()
+
+    @patch.dict(
+        "os.environ",
+        {
+            "DB_URL": "postgresql://primary/db",
+            "DB_REPLICA_URL": "postgresql://replica/db",
+        },
+    )
+    def test_reads_from_replica_except_after_writes(self):
+        """Test that reads use the replica unless guards were just written."""
+        replica_session = _mock_session()
+        self.mock_pg_client.return_value.AsyncReplicaSessionLocal.return_value = (
+            replica_session
+        )
+        self.session.execute.return_value = [Mock()]
+        client = AsyncPGGuardClient()
+
+        async def use_contexts():
+            async with client.get_async_db_context(read_only=True) as db:
+                self.assertIs(db, replica_session)
+            await client.util_write_guards([Mock()], self.session, "conflict")
+            async with client.get_async_db_context(read_only=True) as db:
+                self.assertIs(db, self.session)
+
+        asyncio.run(use_contexts())
+
+    @patch("guardrails_api.clients.async_pg_guard_client.from_guard_item")
+    def test_get_guard_returns_latest_guard(self, mock_from_guard_item):
+        """Test get_guard loads the latest guard item by id."""
+        mock_guard_item = Mock()
+        self.session.get.return_value = mock_guard_item
+        mock_result = Mock()
+        mock_from_guard_item.return_value = mock_result
+
+        client = AsyncPGGuardClient()
+        result = asyncio.run(client.get_guard("some-id"))
+
+        mock_from_guard_item.assert_called_once_with(mock_guard_item)
+        self.assertIs(result, mock_result)
+
+    def test_get_guard_raises_404_when_not_found(self):
+        """Test get_guard raises HttpError 404 when the guard does not exist."""
+        client = AsyncPGGuardClient()
+
+        with self.assertRaises(HttpError) as ctx:
+            asyncio.run(client.get_guard("missing-id"))
+
+        self.assertEqual(ctx.exception.status, 404)
+
+    def test_get_guard_uses_cache_when_enabled(self):
+        """Test get_guard shares PGGuardClient's notification backed cache."""
+        client = AsyncPGGuardClient()
+        mock_guard = Mock()
+        client.util_load_guard = AsyncMock(return_value=mock_guard)
+        client.enable_guard_cache()
+
+        asyncio.run(client.get_guard("some-id"))
+        result = asyncio.run(client.get_guard("some-id"))
+
+        self.assertIs(result, mock_guard)
+        client.util_load_guard.assert_awaited_once_with("some-id")
+
+    @patch("guardrails_api.clients.async_pg_guard_client.from_guard_item")
+    def test_get_guard_as_of_date_uses_one_query(self, mock_from_guard_item):
+        """Test get_guard resolves point in time lookups with one query and
+        caches historical versions."""
+        mock_row = Mock(id="guard-id", historical=True)
+        self.session.execute.return_value.first.return_value = mock_row
+
+        client = AsyncPGGuardClient()
+        first = asyncio.run(client.get_guard("guard-id", as_of_date="2024-01-01"))
+        second = asyncio.run(client.get_guard("guard-id", as_of_date="2024-01-01"))
+
+        self.session.execute.assert_awaited_once()
+        self.session.get.assert_not_awaited()
+        mock_from_guard_item.assert_called_once_with(mock_row)
+        self.assertIs(first, second)
+
+    @patch("guardrails_api.clients.async_pg_guard_client.from_guard_item")
+    def test_get_guards_returns_all_guards(self, mock_from_guard_item):
+        """Test get_guards converts every guard item."""
+        self.session.scalars.return_value.all.return_value = [Mock(), Mock()]
+        mock_from_guard_item.side_effect = ["guard-1", "guard-2"]
+
+        client = AsyncPGGuardClient()
+        result = asyncio.run(client.get_guards())
+
+        self.assertEqual(result, ["guard-1", "guard-2"])
+
+    def test_list_guards_projects_rows(self):
+        """Test list_guards executes projections and returns dicts."""
+        row = Mock()
+        row.name, row.id = "guard", "guard-id"
+        self.session.execute.return_value.all.return_value = [row]
+
+        client = AsyncPGGuardClient()
+        result = asyncio.run(client.list_guards(limit=5, fields=["id"]))
+
+        self.assertEqual(result, ([{"id": "guard-id"}], None))
+        self.session.execute.assert_awaited_once()
+
+    @patch("guardrails_api.clients.async_pg_guard_client.from_guard_item")
+    def test_create_guard_inserts_and_commits(self, mock_from_guard_item):
+        """Test create_guard inserts the guard and commits."""
+        mock_row = Mock()
+        self.session.execute.return_value = [mock_row]
+
+        client = AsyncPGGuardClient()
+        asyncio.run(client.create_guard(CreateGuardRequest(name="test_guard")))
+
+        self.session.execute.assert_awaited_once()
+        self.session.commit.assert_awaited_once()
+        mock_from_guard_item.assert_called_once_with(mock_row)
+
+    def test_create_guard_raises_409_on_unique_violation(self):
+        """Test create_guard raises HttpError 409 on a unique violation."""
+        self.session.execute.side_effect = IntegrityError(
+            statement=None, params=None, orig=Mock(sqlstate="23505")
+        )
+
+        client = AsyncPGGuardClient()
+        with self.assertRaises(HttpError) as ctx:
+            asyncio.run(client.create_guard(CreateGuardRequest(name="duplicate")))
+
+        self.assertEqual(ctx.exception.status, 409)
+
+    @patch("guardrails_api.clients.async_pg_guard_client.from_guard_item")
+    def test_upsert_guard_writes_one_statement(self, mock_from_guard_item):
+        """Test upsert_guard writes with a single statement and evicts the guard."""
+        mock_row = Mock()
+        self.session.execute.return_value = [mock_row]
+
+        client = AsyncPGGuardClient()
+        client.evict_guard = Mock()
+        asyncio.run(client.upsert_guard("some-id", IGuard(id="some-id", name="g")))
+
+        self.session.execute.assert_awaited_once()
+        self.session.get.assert_not_awaited()
+        self.session.commit.assert_awaited_once()
+        client.evict_guard.assert_called_once_with("some-id")
+        mock_from_guard_item.assert_called_once_with(mock_row)
+
+    @patch("guardrails_api.clients.pg_guard_client.from_guard_item")
+    def test_upsert_guards_returns_guards_in_order(self, mock_from_guard_item):
+        """Test upsert_guards commits once and keeps the order of the guards."""
+        self.session.execute.return_value = [Mock(id="b"), Mock(id="a")]
+        mock_from_guard_item.side_effect = lambda row: f"guard-{row.id}"
+
+        client = AsyncPGGuardClient()
+        result = asyncio.run(
+            client.upsert_guards([IGuard(id="a", name="a"), IGuard(id="b", name="b")])
+        )
+
+        self.assertEqual(result, ["guard-a", "guard-b"])
+        self.session.execute.assert_awaited_once()
+        self.session.commit.assert_awaited_once()
+
+    def test_update_guard_raises_404_when_not_found(self):
+        """Test update_guard raises HttpError 404 when the guard does not exist."""
+        self.session.execute.return_value = []
+        client = AsyncPGGuardClient()
+
+        with self.assertRaises(HttpError) as ctx:
+            asyncio.run(
+                client.update_guard("missing-id", IGuard(id="missing-id", name="g"))
+            )
+
+        self.assertEqual(ctx.exception.status, 404)
+
+    @patch("guardrails_api.clients.async_pg_guard_client.from_guard_item")
+    def test_delete_guard_deletes_and_commits(self, mock_from_guard_item):
+        """Test delete_guard deletes the row and returns the deleted guard."""
+        mock_row = Mock()
+        self.session.execute.return_value.all.return_value = [mock_row]
+
+        client = AsyncPGGuardClient()
+        asyncio.run(client.delete_guard("some-id"))
+
+        self.session.execute.assert_awaited_once()
+        self.session.commit.assert_awaited_once()
+        mock_from_guard_item.assert_called_once_with(mock_row)
+
+
+if __name__ == "__main__":
+    unittest.main()
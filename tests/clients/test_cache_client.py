@@ -1,9 +1,68 @@
 """Unit tests for guardrails_api.clients.cache_client module."""
 
+import os
 import unittest
 import asyncio
 from unittest.mock import patch, Mock, AsyncMock
-from guardrails_api.clients.cache_client import CacheClient
+from guardrails_api.clients.cache_client import (
+    CacheClient,
+    get_cache_backend,
+    get_redis_cache_config,
+)
+from guardrails_api.clients.cache_serializer import CacheSerializer
+from guardrails_api.clients.memory_cache import MemoryCache
+
+
+REDIS_BACKEND = patch.dict(os.environ, {"CACHE_BACKEND": "redis"})
+REDIS_INSTALLED = patch.dict("sys.modules", {"redis": Mock()})
+
+
+class TestGetCacheBackend(unittest.TestCase):
+    """Test cases for the get_cache_backend function."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_defaults_to_memory(self):
+        self.assertEqual(get_cache_backend(), "memory")
+
+    @patch.dict(os.environ, {"CACHE_BACKEND": "Redis"})
+    def test_reads_env_var_case_insensitive(self):
+        self.assertEqual(get_cache_backend(), "redis")
+
+    @patch.dict(os.environ, {"CACHE_BACKEND": "memcached"})
+    def test_rejects_unknown_backends(self):
+        with self.assertRaises(ValueError):
+            get_cache_backend()
+
+
+class TestGetRedisCacheConfig(unittest.TestCase):
+    """Test cases for the get_redis_cache_config function."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_defaults(self):
+        config = get_redis_cache_config()
+        self.assertEqual(config["cache"], "aiocache.RedisCache")
+        self.assertEqual(config["endpoint"], "localhost")
+        self.assertEqual(config["port"], 6379)
+        self.assertEqual(config["db"], 0)
+        self.assertIsNone(config["password"])
+        self.assertFalse(config["ssl"])
+        self.assertEqual(config["pool_max_size"], 10)
+
+    @patch.dict(
+        os.environ,
+        {
+            "CACHE_URL": "rediss://:p%40ss@valkey.internal:6380/2",
+            "CACHE_POOL_MAX_SIZE": "50",
+        },
+    )
+    def test_parses_cache_url(self):
+        config = get_redis_cache_config()
+        self.assertEqual(config["endpoint"], "valkey.internal")
+        self.assertEqual(config["port"], 6380)
+        self.assertEqual(config["db"], 2)
+        self.assertEqual(config["password"], "p@ss")
+        self.assertTrue(config["ssl"])
+        self.assertEqual(config["pool_max_size"], 50)
 
 
 class TestCacheClient(unittest.TestCase):
@@ -37,6 +96,8 @@ class TestCacheClient(unittest.TestCase):
         # All instances should be the same
         self.assertEqual(len(set(id(inst) for inst in instances)), 1)
 
+    @REDIS_BACKEND
+    @REDIS_INSTALLED
     @patch("guardrails_api.clients.cache_client.caches")
     def test_initialize_sets_config(self, mock_caches):
         """Test that initialize sets up cache configuration."""
@@ -49,9 +110,75 @@ class TestCacheClient(unittest.TestCase):
         mock_caches.set_config.assert_called_once()
         config = mock_caches.set_config.call_args[0][0]
         self.assertIn("default", config)
-        self.assertEqual(config["default"]["cache"], "aiocache.SimpleMemoryCache")
+        self.assertEqual(config["default"]["cache"], "aiocache.RedisCache")
         self.assertEqual(config["default"]["ttl"], 300)
+        self.assertIs(config["default"]["serializer"]["class"], CacheSerializer)
 
+    @patch.dict(os.environ, {}, clear=True)
+    def test_initialize_defaults_to_bounded_memory_cache(self):
+        """Test that the memory backend is a byte bounded MemoryCache."""
+        client = CacheClient()
+        client.initialize()
+
+        self.assertIsInstance(client.cache, MemoryCache)
+        self.assertEqual(client.stats()["max_bytes"], 128 * 1024 * 1024)
+        self.assertIsNone(client.cache.serializer.compressor)
+
+    @patch.dict(os.environ, {"CACHE_COMPRESSION": "zstd"})
+    def test_initialize_with_zstd_compression(self):
+        """Test that CACHE_COMPRESSION=zstd compresses cached values."""
+        client = CacheClient()
+        client.initialize()
+
+        self.assertIsNotNone(client.cache.serializer.compressor)
+
+    @patch.dict(os.environ, {"CACHE_MAX_BYTES": "1024", "CACHE_NAMESPACE": "staging"})
+    def test_initialize_memory_cache_from_env(self):
+        """Test that CACHE_MAX_BYTES and CACHE_NAMESPACE configure the memory cache."""
+        client = CacheClient()
+        client.initialize()
+
+        self.assertEqual(client.stats()["max_bytes"], 1024)
+        self.assertEqual(client.cache.namespace, "staging")
+
+    @patch.dict(os.environ, {"CACHE_NAMESPACE": "staging"})
+    @REDIS_BACKEND
+    @REDIS_INSTALLED
+    @patch("guardrails_api.clients.cache_client.caches")
+    def test_initialize_uses_namespace(self, mock_caches):
+        """Test that CACHE_NAMESPACE prefixes every Redis key."""
+        client = CacheClient()
+        client.initialize()
+
+        config = mock_caches.set_config.call_args[0][0]
+        self.assertEqual(config["default"]["namespace"], "staging")
+        self.assertEqual(client.stats(), {})
+
+    @REDIS_BACKEND
+    @REDIS_INSTALLED
+    @patch("guardrails_api.clients.cache_client.caches")
+    def test_initialize_with_redis_backend(self, mock_caches):
+        """Test that CACHE_BACKEND=redis configures a pooled RedisCache."""
+        client = CacheClient()
+        client.initialize()
+
+        config = mock_caches.set_config.call_args[0][0]
+        self.assertEqual(config["default"]["cache"], "aiocache.RedisCache")
+        self.assertEqual(config["default"]["pool_max_size"], 10)
+        self.assertEqual(client.backend, "redis")
+
+    @REDIS_BACKEND
+    @patch.dict("sys.modules", {"redis": None})
+    @patch("guardrails_api.clients.cache_client.caches")
+    def test_initialize_with_redis_backend_requires_redis(self, mock_caches):
+        """Test that a missing redis package is reported on startup."""
+        client = CacheClient()
+
+        with self.assertRaises(ImportError):
+            client.initialize()
+
+    @REDIS_BACKEND
+    @REDIS_INSTALLED
     @patch("guardrails_api.clients.cache_client.caches")
     def test_initialize_gets_cache(self, mock_caches):
         """Test that initialize retrieves default cache."""
@@ -64,6 +191,8 @@ class TestCacheClient(unittest.TestCase):
         mock_caches.get.assert_called_once_with("default")
         self.assertEqual(client.cache, mock_cache)
 
+    @REDIS_BACKEND
+    @REDIS_INSTALLED
     @patch("guardrails_api.clients.cache_client.caches")
     def test_get_calls_cache_get(self, mock_caches):
         """Test that get method calls cache.get."""
@@ -79,6 +208,8 @@ class TestCacheClient(unittest.TestCase):
         mock_cache.get.assert_called_once_with("test_key")
         self.assertEqual(result, "value")
 
+    @REDIS_BACKEND
+    @REDIS_INSTALLED
     @patch("guardrails_api.clients.cache_client.caches")
     def test_set_calls_cache_set(self, mock_caches):
         """Test that set method calls cache.set with correct parameters."""
@@ -93,6 +224,41 @@ class TestCacheClient(unittest.TestCase):
 
         mock_cache.set.assert_called_once_with("test_key", "test_value", ttl=600)
 
+    @REDIS_BACKEND
+    @REDIS_INSTALLED
+    @patch("guardrails_api.clients.cache_client.caches")
+    def test_multi_get_calls_cache_multi_get(self, mock_caches):
+        """Test that multi_get method calls cache.multi_get."""
+        mock_cache = Mock()
+        mock_cache.multi_get = AsyncMock(return_value=["value", None])
+        mock_caches.get.return_value = mock_cache
+
+        client = CacheClient()
+        client.initialize()
+
+        result = asyncio.run(client.multi_get(["key_1", "key_2"]))
+
+        mock_cache.multi_get.assert_called_once_with(["key_1", "key_2"])
+        self.assertEqual(result, ["value", None])
+
+    @REDIS_BACKEND
+    @REDIS_INSTALLED
+    @patch("guardrails_api.clients.cache_client.caches")
+    def test_multi_set_calls_cache_multi_set(self, mock_caches):
+        """Test that multi_set method calls cache.multi_set with the ttl."""
+        mock_cache = Mock()
+        mock_cache.multi_set = AsyncMock()
+        mock_caches.get.return_value = mock_cache
+
+        client = CacheClient()
+        client.initialize()
+
+        asyncio.run(client.multi_set([("key", "value")], 600))
+
+        mock_cache.multi_set.assert_called_once_with([("key", "value")], ttl=600)
+
+    @REDIS_BACKEND
+    @REDIS_INSTALLED
     @patch("guardrails_api.clients.cache_client.caches")
     def test_delete_calls_cache_delete(self, mock_caches):
         """Test that delete method calls cache.delete."""
@@ -107,6 +273,8 @@ class TestCacheClient(unittest.TestCase):
 
         mock_cache.delete.assert_called_once_with("test_key")
 
+    @REDIS_BACKEND
+    @REDIS_INSTALLED
     @patch("guardrails_api.clients.cache_client.caches")
     def test_clear_calls_cache_clear(self, mock_caches):
         """Test that clear method calls cache.clear."""
@@ -119,7 +287,51 @@ class TestCacheClient(unittest.TestCase):
 
         asyncio.run(client.clear())
 
-        mock_cache.clear.assert_called_once()
+        mock_cache.clear.assert_called_once_with(namespace=mock_cache.namespace)
+
+    @REDIS_BACKEND
+    @REDIS_INSTALLED
+    @patch("guardrails_api.clients.cache_client.caches")
+    def test_append_to_list_pushes_and_trims_in_one_transaction(self, mock_caches):
+        """Test that append_to_list runs RPUSH, LTRIM and EXPIRE atomically."""
+        mock_cache = Mock()
+        mock_cache.build_key.side_effect = lambda key: f"ns:{key}"
+        pipeline = Mock()
+        pipeline.execute = AsyncMock()
+        mock_cache.client.pipeline.return_value.__aenter__ = AsyncMock(
+            return_value=pipeline
+        )
+        mock_cache.client.pipeline.return_value.__aexit__ = AsyncMock(return_value=None)
+        mock_caches.get.return_value = mock_cache
+
+        client = CacheClient()
+        client.initialize()
+
+        asyncio.run(client.append_to_list("key", ["a", "b"], 10, 600))
+
+        mock_cache.client.pipeline.assert_called_once_with(transaction=True)
+        pipeline.rpush.assert_called_once_with("ns:key", "a", "b")
+        pipeline.ltrim.assert_called_once_with("ns:key", -10, -1)
+        pipeline.expire.assert_called_once_with("ns:key", 600)
+        pipeline.execute.assert_awaited_once()
+
+    @REDIS_BACKEND
+    @REDIS_INSTALLED
+    @patch("guardrails_api.clients.cache_client.caches")
+    def test_get_list_reads_the_redis_list(self, mock_caches):
+        """Test that get_list decodes the values of the Redis list."""
+        mock_cache = Mock()
+        mock_cache.build_key.side_effect = lambda key: f"ns:{key}"
+        mock_cache.client.lrange = AsyncMock(return_value=[b"a", b"b"])
+        mock_caches.get.return_value = mock_cache
+
+        client = CacheClient()
+        client.initialize()
+
+        result = asyncio.run(client.get_list("key"))
+
+        mock_cache.client.lrange.assert_called_once_with("ns:key", 0, -1)
+        self.assertEqual(result, ["a", "b"])
 
 
 if __name__ == "__main__":
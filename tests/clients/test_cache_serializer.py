@@ -0,0 +1,84 @@
+"""Unit tests for guardrails_api.clients.cache_serializer module."""
+
+import os
+import unittest
+from unittest.mock import patch
+from guardrails_api.clients.cache_serializer import (
+    RAW_HEADER,
+    ZSTD_HEADER,
+    CacheSerializer,
+    get_cache_compression,
+)
+
+
+CALL = {"id": "call-1", "iterations": [{"outputs": {"rawOutput": "x" * 1000}}]}
+
+
+class TestGetCacheCompression(unittest.TestCase):
+    """Test cases for the get_cache_compression function."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_defaults_to_none(self):
+        """Test that values aren't compressed by default."""
+        self.assertEqual(get_cache_compression(), "none")
+
+    @patch.dict(os.environ, {"CACHE_COMPRESSION": "gzip"})
+    def test_rejects_unknown_compression(self):
+        """Test that an unknown compression raises a ValueError."""
+        with self.assertRaises(ValueError) as cm:
+            get_cache_compression()
+
+        self.assertIn("CACHE_COMPRESSION", str(cm.exception))
+
+
+class TestCacheSerializer(unittest.TestCase):
+    """Test cases for the CacheSerializer class."""
+
+    def test_round_trips_msgpack_values(self):
+        """Test that values come back as they were stored."""
+        serializer = CacheSerializer()
+
+        value = serializer.dumps(CALL)
+
+        self.assertTrue(value.startswith(RAW_HEADER))
+        self.assertEqual(serializer.loads(value), CALL)
+        self.assertIsNone(serializer.loads(None))
+
+    def test_zstd_compresses_large_values(self):
+        """Test that large values are compressed and still round trip."""
+        serializer = CacheSerializer(compression="zstd")
+
+        value = serializer.dumps(CALL)
+
+        self.assertTrue(value.startswith(ZSTD_HEADER))
+        self.assertLess(len(value), len(CacheSerializer().dumps(CALL)))
+        self.assertEqual(serializer.loads(value), CALL)
+
+    def test_zstd_skips_small_values(self):
+        """Test that values too small to benefit aren't compressed."""
+        serializer = CacheSerializer(compression="zstd")
+
+        value = serializer.dumps(["call-1", "call-2"])
+
+        self.assertTrue(value.startswith(RAW_HEADER))
+        self.assertEqual(serializer.loads(value), ["call-1", "call-2"])
+
+    def test_reads_values_written_with_another_compression(self):
+        """Test that changing CACHE_COMPRESSION keeps existing values readable."""
+        compressed = CacheSerializer(compression="zstd").dumps(CALL)
+        raw = CacheSerializer().dumps(CALL)
+
+        self.assertEqual(CacheSerializer().loads(compressed), CALL)
+        self.assertEqual(CacheSerializer(compression="zstd").loads(raw), CALL)
+
+    @patch.dict("sys.modules", {"zstandard": None})
+    def test_zstd_requires_zstandard(self):
+        """Test that a missing zstandard package raises an install hint."""
+        with self.assertRaises(ImportError) as cm:
+            CacheSerializer(compression="zstd")
+
+        self.assertIn("guardrails-api[zstd]", str(cm.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,243 @@
+"""Unit tests for guardrails_api.clients.guard_call_store module."""
+
+import asyncio
+import os
+import unittest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from guardrails.classes.history import Call
+from sqlalchemy.dialects import postgresql
+from guardrails_api.classes.http_error import HttpError
+from guardrails_api.clients.guard_call_store import (
+    GuardCallStore,
+    decode_cursor,
+    encode_cursor,
+    guard_calls_is_enabled,
+)
+from guardrails_api.db.models.guard_call_item import GuardCallItem
+from guardrails_api.utils.metrics import Metrics
+
+
+def _call(id: str) -> Call:
+    call = Call()
+    call._id = id
+    return call
+
+
+def _item(id: str, second: int) -> GuardCallItem:
+    return GuardCallItem(
+        id=id,
+        guard_id="guard-id",
+        call={"id": id},
+        created_at=datetime(2026, 10, 18, 12, 0, second),
+    )
+
+
+class TestGuardCallsIsEnabled(unittest.TestCase):
+    """Test cases for the guard_calls_is_enabled function."""
+
+    @patch.dict(os.environ, {"PGHOST": "localhost"}, clear=True)
+    def test_disabled_by_default(self):
+        """Test that calls aren't stored unless enabled."""
+        self.assertFalse(guard_calls_is_enabled())
+
+    @patch.dict(os.environ, {"GUARD_CALLS_ENABLED": "true"}, clear=True)
+    def test_requires_postgres(self):
+        """Test that calls aren't stored without Postgres."""
+        self.assertFalse(guard_calls_is_enabled())
+
+    @patch.dict(os.environ, {"GUARD_CALLS_ENABLED": "True", "PGHOST": "localhost"})
+    def test_enabled_with_postgres(self):
+        """Test that GUARD_CALLS_ENABLED=true enables the store with Postgres."""
+        self.assertTrue(guard_calls_is_enabled())
+
+
+class TestCursor(unittest.TestCase):
+    """Test cases for the cursor helpers."""
+
+    def test_round_trips_position(self):
+        """Test that a cursor decodes to the position it was encoded from."""
+        created_at = datetime(2026, 10, 18, 12, 30, 15, 123456)
+
+        cursor = encode_cursor(created_at, "call 1")
+
+        self.assertEqual(decode_cursor(cursor), (created_at, "call 1"))
+
+    def test_invalid_cursor_is_a_bad_request(self):
+        """Test that a malformed cursor raises a 400."""
+        with self.assertRaises(HttpError) as cm:
+            decode_cursor("not-a-cursor")
+
+        self.assertEqual(cm.exception.status, 400)
+
+
+class TestGuardCallStore(unittest.TestCase):
+    """Test cases for the GuardCallStore class."""
+
+    def setUp(self):
+        self.store = GuardCallStore()
+        self.store.initialize()
+        self.store.insert = AsyncMock()
+        self.store.scalars = AsyncMock(return_value=[])
+        # The store is a singleton shared with the guards router
+        self.addCleanup(self.store.initialize)
+
+    def _record_and_flush(self, *call_ids: str):
+        async def run():
+            for id in call_ids:
+                self.store.record("guard-id", _call(id))
+            await self.store.flush()
+
+        asyncio.run(run())
+
+    def test_record_inserts_in_the_background(self):
+        """Test that record only enqueues and the writer inserts the call."""
+
+        async def run():
+            self.store.record("guard-id", _call("call-1"))
+            self.store.insert.assert_not_awaited()
+            # Give the background writer a turn
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+
+        rows = self.store.insert.call_args.args[0]
+        self.assertEqual(rows[0]["id"], "call-1")
+        self.assertEqual(rows[0]["guard_id"], "guard-id")
+        self.assertEqual(rows[0]["call"]["id"], "call-1")
+
+    @patch.dict(os.environ, {"GUARD_CALLS_BATCH_SIZE": "2"})
+    def test_inserts_in_batches(self):
+        """Test that queued calls are inserted GUARD_CALLS_BATCH_SIZE at a time."""
+        self.store.initialize()
+        self.store.insert = AsyncMock()
+
+        self._record_and_flush("call-1", "call-2", "call-3")
+
+        batches = [c.args[0] for c in self.store.insert.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+
+    @patch.dict(os.environ, {"GUARD_CALLS_QUEUE_SIZE": "1"})
+    def test_drops_calls_when_queue_is_full(self):
+        """Test that calls are dropped and counted while the queue is full."""
+        self.store.initialize()
+        self.store.insert = AsyncMock()
+        metrics = Metrics()
+        dropped = metrics.get("guard_calls_dropped_total")
+
+        self._record_and_flush("call-1", "call-2")
+
+        self.assertEqual(metrics.get("guard_calls_dropped_total"), dropped + 1)
+        self.assertEqual(len(self.store.insert.call_args.args[0]), 1)
+
+    @patch.dict(os.environ, {"GUARD_CALLS_QUEUE_SIZE": "0"})
+    def test_queue_size_zero_is_unbounded(self):
+        """Test that GUARD_CALLS_QUEUE_SIZE=0 doesn't drop calls."""
+        self.store.initialize()
+        self.store.insert = AsyncMock()
+
+        self._record_and_flush("call-1", "call-2")
+
+        rows = self.store.insert.call_args.args[0]
+        self.assertEqual([row["id"] for row in rows], ["call-1", "call-2"])
+
+    def test_write_errors_are_counted(self):
+        """Test that a failing insert doesn't stop the writer."""
+        self.store.insert.side_effect = Exception("down")
+        metrics = Metrics()
+        errors = metrics.get("guard_calls_write_errors_total")
+
+        self._record_and_flush("call-1")
+
+        self.assertEqual(metrics.get("guard_calls_write_errors_total"), errors + 1)
+
+    def test_get_calls_pages_newest_first(self):
+        """Test that a full page returns a cursor to the next page."""
+        self.store.scalars.return_value = [
+            _item("call-3", 3),
+            _item("call-2", 2),
+            _item("call-1", 1),
+        ]
+
+        page = asyncio.run(self.store.get_calls("guard-id", limit=2))
+
+        self.assertEqual([c["id"] for c in page["calls"]], ["call-3", "call-2"])
+        self.assertEqual(page["calls"][0]["guardId"], "guard-id")
+        self.assertEqual(page["calls"][0]["call"], {"id": "call-3"})
+        self.assertEqual(
+            decode_cursor(page["nextCursor"]),
+            (datetime(2026, 10, 18, 12, 0, 2), "call-2"),
+        )
+        # One extra row is read to know whether there is a next page
+        query = self.store.scalars.call_args.args[0]
+        self.assertEqual(query._limit_clause.value, 3)
+
+    def test_get_calls_last_page_has_no_cursor(self):
+        """Test that the last page doesn't return a cursor."""
+        self.store.scalars.return_value = [_item("call-1", 1)]
+
+        page = asyncio.run(self.store.get_calls("guard-id", limit=2))
+
+        self.assertIsNone(page["nextCursor"])
+
+    def test_get_calls_filters_by_time_range_and_cursor(self):
+        """Test that the query filters on the guard, time range and cursor."""
+        cursor = encode_cursor(datetime(2026, 10, 18, 12, 0, 2), "call-2")
+
+        asyncio.run(
+            self.store.get_calls(
+                "guard-id",
+                start=datetime(2026, 10, 18),
+                end=datetime(2026, 10, 19),
+                cursor=cursor,
+            )
+        )
+
+        query = self.store.scalars.call_args.args[0]
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        self.assertIn("guard_calls.guard_id =", sql)
+        self.assertIn("guard_calls.created_at >=", sql)
+        self.assertIn("guard_calls.created_at <", sql)
+        self.assertIn("(guard_calls.created_at, guard_calls.id) <", sql)
+        self.assertIn("ORDER BY guard_calls.created_at DESC, guard_calls.id DESC", sql)
+
+    def test_get_call_returns_404_for_unknown_call(self):
+        """Test that an unknown call raises a 404."""
+        with self.assertRaises(HttpError) as cm:
+            asyncio.run(self.store.get_call("guard-id", "nope"))
+
+        self.assertEqual(cm.exception.status, 404)
+
+    def test_get_call_returns_the_call(self):
+        """Test that a stored call is returned."""
+        self.store.scalars.return_value = [_item("call-1", 1)]
+
+        call = asyncio.run(self.store.get_call("guard-id", "call-1"))
+
+        self.assertEqual(call["id"], "call-1")
+        self.assertEqual(call["createdAt"], "2026-10-18T12:00:01")
+
+
+class TestGuardCallStoreInsert(unittest.TestCase):
+    """Test cases for GuardCallStore.util_insert."""
+
+    def test_skips_calls_that_are_already_stored(self):
+        store = GuardCallStore()
+        store.initialize()
+        self.addCleanup(store.initialize)
+        db = MagicMock()
+        store.pg_client = MagicMock()
+        store.pg_client.SessionLocal.return_value.__enter__.return_value = db
+
+        store.util_insert([{"id": "call-1", "guard_id": "guard-id", "call": {}}])
+
+        statement = db.execute.call_args.args[0]
+        self.assertIn(
+            "ON CONFLICT DO NOTHING",
+            str(statement.compile(dialect=postgresql.dialect())),
+        )
+        db.commit.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
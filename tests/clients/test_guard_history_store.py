@@ -0,0 +1,174 @@
+"""Unit tests for guardrails_api.clients.guard_history_store module."""
+
+import asyncio
+import os
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+from guardrails.classes.history import Call
+from guardrails_api.clients.guard_history_store import GuardHistoryStore
+from guardrails_api.utils.metrics import Metrics
+
+
+def _mock_cache_client():
+    """Create a cache client backed by a dict."""
+    values = {}
+    cache_client = Mock()
+    cache_client.values = values
+
+    async def get(key):
+        return values.get(key)
+
+    async def set(key, value, ttl):
+        values[key] = value
+
+    async def multi_get(keys):
+        return [values.get(key) for key in keys]
+
+    async def multi_set(pairs, ttl):
+        values.update(pairs)
+
+    async def get_list(key):
+        return values.get(key, [])
+
+    async def append_to_list(key, items, max_length, ttl):
+        values[key] = (values.get(key, []) + items)[-max_length:]
+
+    cache_client.get = AsyncMock(side_effect=get)
+    cache_client.set = AsyncMock(side_effect=set)
+    cache_client.multi_get = AsyncMock(side_effect=multi_get)
+    cache_client.multi_set = AsyncMock(side_effect=multi_set)
+    cache_client.get_list = AsyncMock(side_effect=get_list)
+    cache_client.append_to_list = AsyncMock(side_effect=append_to_list)
+    return cache_client
+
+
+def _call(id: str) -> Call:
+    call = Call()
+    call._id = id
+    return call
+
+
+class TestGuardHistoryStore(unittest.TestCase):
+    """Test cases for the GuardHistoryStore class."""
+
+    def setUp(self):
+        self.store = GuardHistoryStore()
+        self.store.initialize()
+        self.store.cache_client = _mock_cache_client()
+        # The store is a singleton shared with the guards router
+        self.addCleanup(self.store.initialize)
+
+    def _record_and_flush(self, *call_ids: str):
+        async def run():
+            for id in call_ids:
+                self.store.record("guard-id", _call(id))
+            await self.store.flush()
+
+        asyncio.run(run())
+
+    def test_record_stores_only_the_call(self):
+        """Test that a call is stored on its own instead of the whole history."""
+        self._record_and_flush("call-1", "call-2")
+
+        values = self.store.cache_client.values
+        self.assertEqual(values["guard-id-call-2"]["id"], "call-2")
+        self.assertEqual(values["guard-id-history"], ["call-1", "call-2"])
+
+    def test_record_does_not_write_inline(self):
+        """Test that record only enqueues and the writer stores in the background."""
+
+        async def run():
+            self.store.record("guard-id", _call("call-1"))
+            self.store.cache_client.multi_set.assert_not_called()
+            # Give the background writer a turn
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+
+        self.store.cache_client.multi_set.assert_awaited_once()
+        self.assertEqual(len(self.store.batch_writer.pending), 0)
+
+    @patch.dict(os.environ, {"GUARD_HISTORY_BATCH_SIZE": "2"})
+    def test_writes_in_batches(self):
+        """Test that queued calls are stored in batches of GUARD_HISTORY_BATCH_SIZE."""
+        self.store.initialize()
+        self.store.cache_client = _mock_cache_client()
+
+        self._record_and_flush("call-1", "call-2", "call-3")
+
+        batches = [c.args[0] for c in self.store.cache_client.multi_set.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+
+    @patch.dict(os.environ, {"GUARD_HISTORY_QUEUE_SIZE": "1"})
+    def test_drops_calls_when_queue_is_full(self):
+        """Test that calls are dropped and counted while the queue is full."""
+        self.store.initialize()
+        self.store.cache_client = _mock_cache_client()
+        metrics = Metrics()
+        dropped = metrics.get("guard_history_dropped_total")
+
+        self._record_and_flush("call-1", "call-2")
+
+        self.assertEqual(metrics.get("guard_history_dropped_total"), dropped + 1)
+        self.assertNotIn("guard-id-call-2", self.store.cache_client.values)
+
+    @patch.dict(os.environ, {"GUARD_HISTORY_QUEUE_SIZE": "0"})
+    def test_queue_size_zero_is_unbounded(self):
+        """Test that GUARD_HISTORY_QUEUE_SIZE=0 doesn't drop calls."""
+        self.store.initialize()
+        self.store.cache_client = _mock_cache_client()
+
+        self._record_and_flush("call-1", "call-2")
+
+        values = self.store.cache_client.values
+        self.assertEqual(values["guard-id-history"], ["call-1", "call-2"])
+
+    def test_index_is_appended_to_atomically(self):
+        """Test that the index isn't read back and rewritten by the writer."""
+        self._record_and_flush("call-1", "call-2")
+
+        self.store.cache_client.append_to_list.assert_awaited_once_with(
+            "guard-id-history", ["call-1", "call-2"], self.store.max_length, 300
+        )
+        self.store.cache_client.get_list.assert_not_called()
+        self.store.cache_client.set.assert_not_called()
+
+    def test_write_errors_are_counted(self):
+        """Test that a failing cache doesn't stop the writer."""
+        self.store.cache_client.multi_set.side_effect = Exception("down")
+        metrics = Metrics()
+        errors = metrics.get("guard_history_write_errors_total")
+
+        self._record_and_flush("call-1")
+
+        self.assertEqual(metrics.get("guard_history_write_errors_total"), errors + 1)
+
+    def test_get_history_rebuilds_calls_up_to_call_id(self):
+        """Test that the history of a call lists the guard's calls up to it."""
+        self._record_and_flush("call-1", "call-2", "call-3")
+
+        history = asyncio.run(self.store.get_history("guard-id", "call-2"))
+
+        self.assertEqual([c["id"] for c in history], ["call-1", "call-2"])
+
+    @patch.dict(os.environ, {"GUARD_HISTORY_MAX_LENGTH": "2"})
+    def test_index_is_bounded(self):
+        """Test that the index only keeps GUARD_HISTORY_MAX_LENGTH call ids."""
+        self.store.initialize()
+        self.store.cache_client = _mock_cache_client()
+
+        self._record_and_flush("call-1", "call-2", "call-3")
+        history = asyncio.run(self.store.get_history("guard-id", "call-1"))
+
+        values = self.store.cache_client.values
+        self.assertEqual(values["guard-id-history"], ["call-2", "call-3"])
+        # Calls that fell out of the index are still returned on their own
+        self.assertEqual([c["id"] for c in history], ["call-1"])
+
+    def test_get_history_returns_empty_list_for_unknown_call(self):
+        """Test that an unknown call has no history."""
+        self.assertEqual(asyncio.run(self.store.get_history("guard-id", "nope")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
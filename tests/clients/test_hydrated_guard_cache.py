@@ -0,0 +1,145 @@
+"""Unit tests for guardrails_api.clients.hydrated_guard_cache module."""
+
+import unittest
+from unittest.mock import patch, Mock
+from guardrails.classes.generic.stack import Stack
+from guardrails_ai.types import Guard as IGuard
+from guardrails_api.clients.hydrated_guard_cache import (
+    HydratedGuardCache,
+    get_guard_version,
+)
+
+
+class TestGetGuardVersion(unittest.TestCase):
+    """Test cases for the get_guard_version function."""
+
+    def test_same_definition_same_version(self):
+        """Test that identical guard definitions hash to the same version."""
+        guard1 = IGuard(name="test", id="test-id")
+        guard2 = IGuard(name="test", id="test-id")
+        self.assertEqual(get_guard_version(guard1), get_guard_version(guard2))
+
+    def test_changed_definition_changes_version(self):
+        """Test that a changed guard definition produces a new version."""
+        guard1 = IGuard(name="test", id="test-id")
+        guard2 = IGuard(name="test", id="test-id", description="changed")
+        self.assertNotEqual(get_guard_version(guard1), get_guard_version(guard2))
+
+
+class TestHydratedGuardCache(unittest.TestCase):
+    """Test cases for the HydratedGuardCache class."""
+
+    def setUp(self):
+        """Reset singleton instance before each test."""
+        HydratedGuardCache._instance = None
+
+    def test_is_singleton(self):
+        """Test that HydratedGuardCache implements singleton pattern."""
+        self.assertIs(HydratedGuardCache(), HydratedGuardCache())
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_initialize_uses_default_max_size(self):
+        """Test that initialize falls back to the default max size."""
+        cache = HydratedGuardCache()
+        cache.initialize()
+        self.assertEqual(cache.max_size, 128)
+
+    @patch.dict("os.environ", {"GUARD_CACHE_MAX_SIZE": "5"})
+    def test_initialize_reads_max_size_from_env(self):
+        """Test that GUARD_CACHE_MAX_SIZE configures the max size."""
+        cache = HydratedGuardCache()
+        cache.initialize()
+        self.assertEqual(cache.max_size, 5)
+
+    @patch("guardrails_api.clients.hydrated_guard_cache.AsyncGuard.from_dict")
+    def test_hydrate_reuses_cached_guard(self, mock_from_dict):
+        """Test that hydrate only builds the AsyncGuard once per version."""
+        mock_from_dict.return_value = Mock(history=Stack())
+        cache = HydratedGuardCache()
+        cache.initialize()
+        guard_struct = IGuard(name="test", id="test-id")
+
+        first = cache.hydrate(guard_struct, "v1")
+        second = cache.hydrate(guard_struct, "v1")
+
+        self.assertIs(first, second)
+        mock_from_dict.assert_called_once_with(
+            guard_struct.model_dump(exclude_none=True)
+        )
+
+    @patch("guardrails_api.clients.hydrated_guard_cache.AsyncGuard.from_dict")
+    def test_hydrate_rebuilds_on_new_version(self, mock_from_dict):
+        """Test that a changed guard definition is rehydrated."""
+        mock_from_dict.side_effect = [Mock(history=Stack()), Mock(history=Stack())]
+        cache = HydratedGuardCache()
+        cache.initialize()
+
+        first = cache.hydrate(IGuard(name="test", id="test-id"), "v1")
+        second = cache.hydrate(
+            IGuard(name="test", id="test-id", description="new"), "v2"
+        )
+
+        self.assertIsNot(first, second)
+        self.assertEqual(mock_from_dict.call_count, 2)
+        self.assertEqual(len(cache.guards), 1)
+
+    @patch.dict("os.environ", {"GUARD_HISTORY_MAX_LENGTH": "2"})
+    def test_hydrate_bounds_guard_history(self):
+        """Test that hydrated guards keep at most GUARD_HISTORY_MAX_LENGTH calls."""
+        cache = HydratedGuardCache()
+        cache.initialize()
+
+        guard = cache.hydrate(IGuard(name="test", id="test-id"), "v1")
+        for call in ["call-1", "call-2", "call-3"]:
+            guard.history.push(call)
+
+        self.assertEqual(list(guard.history), ["call-2", "call-3"])
+
+    def test_set_evicts_least_recently_used(self):
+        """Test that the least recently used guard is evicted at capacity."""
+        cache = HydratedGuardCache()
+        cache.initialize()
+        cache.max_size = 2
+        cache.set("a", "v1", Mock())
+        cache.set("b", "v1", Mock())
+        cache.get("a", "v1")
+        cache.set("c", "v1", Mock())
+
+        self.assertIsNotNone(cache.get("a", "v1"))
+        self.assertIsNone(cache.get("b", "v1"))
+        self.assertIsNotNone(cache.get("c", "v1"))
+
+    def test_set_is_noop_when_disabled(self):
+        """Test that a max size of 0 disables caching."""
+        cache = HydratedGuardCache()
+        cache.initialize()
+        cache.max_size = 0
+        cache.set("a", "v1", Mock())
+
+        self.assertIsNone(cache.get("a", "v1"))
+
+    def test_invalidate_removes_guard(self):
+        """Test that invalidate evicts the guard regardless of version."""
+        cache = HydratedGuardCache()
+        cache.initialize()
+        cache.set("a", "v1", Mock())
+
+        cache.invalidate("a")
+        cache.invalidate("missing")
+
+        self.assertIsNone(cache.get("a", "v1"))
+
+    def test_clear_removes_all_guards(self):
+        """Test that clear empties the cache."""
+        cache = HydratedGuardCache()
+        cache.initialize()
+        cache.set("a", "v1", Mock())
+        cache.set("b", "v1", Mock())
+
+        cache.clear()
+
+        self.assertEqual(len(cache.guards), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
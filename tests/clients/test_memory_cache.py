@@ -0,0 +1,91 @@
+"""Unit tests for guardrails_api.clients.memory_cache module."""
+
+import asyncio
+import unittest
+from guardrails_api.clients.memory_cache import MemoryCache
+from guardrails_api.utils.metrics import Metrics
+
+
+class TestMemoryCache(unittest.TestCase):
+    """Test cases for the MemoryCache class."""
+
+    def test_round_trips_values(self):
+        """Test that values come back as they were stored."""
+        cache = MemoryCache(1024)
+
+        async def run():
+            await cache.set("key", {"calls": [1, 2]}, 300)
+            return await cache.get("key"), await cache.get("missing")
+
+        self.assertEqual(asyncio.run(run()), ({"calls": [1, 2]}, None))
+
+    def test_multi_get_and_multi_set(self):
+        """Test that batched reads and writes line up with their keys."""
+        cache = MemoryCache(1024)
+
+        async def run():
+            await cache.multi_set([("a", "1"), ("b", "2")], 300)
+            return await cache.multi_get(["a", "missing", "b"])
+
+        self.assertEqual(asyncio.run(run()), ["1", None, "2"])
+
+    def test_append_keeps_the_last_values(self):
+        """Test that append extends the list and trims it to max_length."""
+        cache = MemoryCache(1024)
+
+        async def run():
+            await cache.append("key", ["a", "b"], 3, 300)
+            await cache.append("key", ["c", "d"], 3, 300)
+            return await cache.get("key")
+
+        self.assertEqual(asyncio.run(run()), ["b", "c", "d"])
+
+    def test_keys_are_namespaced(self):
+        """Test that keys are prefixed with the namespace."""
+        cache = MemoryCache(1024, "staging")
+
+        asyncio.run(cache.set("key", "value", 300))
+
+        self.assertIn("staging:key", cache.entries.entries)
+
+    def test_evicts_least_recently_used_entries_past_max_bytes(self):
+        """Test that the byte budget evicts old entries and reports metrics."""
+        cache = MemoryCache(30)
+        metrics = Metrics()
+        evictions = metrics.get("cache_evictions_total")
+
+        async def run():
+            await cache.set("a", "x" * 10, 300)
+            await cache.set("b", "x" * 10, 300)
+            # Touch a so b is the least recently used entry
+            await cache.get("a")
+            await cache.set("c", "x" * 10, 300)
+
+        asyncio.run(run())
+
+        stats = cache.stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertLessEqual(stats["bytes"], 30)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertIsNone(asyncio.run(cache.get("b")))
+        self.assertEqual(metrics.get("cache_evictions_total"), evictions + 1)
+        self.assertEqual(metrics.get("cache_entries"), 2)
+        self.assertEqual(metrics.get("cache_bytes"), stats["bytes"])
+
+    def test_delete_and_clear(self):
+        """Test that delete and clear release their bytes."""
+        cache = MemoryCache(1024)
+
+        async def run():
+            await cache.multi_set([("a", "1"), ("b", "2")], 300)
+            await cache.delete("a")
+            deleted = cache.stats()["entries"]
+            await cache.clear()
+            return deleted
+
+        self.assertEqual(asyncio.run(run()), 1)
+        self.assertEqual(cache.stats()["bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -105,6 +105,35 @@ class TestMemoryGuardClient(unittest.TestCase):
         # Both clients should see the same guard
         self.assertEqual(client2.get_guard("shared-guard"), mock_guard)
 
+    def add_guards(self, *ids):
+        for id in ids:
+            guard = Mock()
+            guard.id = id
+            guard.name = f"name-{id}"
+            self.client.guards[id] = guard
+
+    def test_list_guards_pages_in_name_order(self):
+        """Test list_guards pages through guards ordered by (name, id)."""
+        self.add_guards("c", "a", "b")
+
+        first_page, after = self.client.list_guards(limit=2)
+        second_page, last_after = self.client.list_guards(limit=2, after=after)
+
+        self.assertEqual([g.id for g in first_page], ["a", "b"])
+        self.assertEqual(after, ("name-b", "b"))
+        self.assertEqual([g.id for g in second_page], ["c"])
+        self.assertIsNone(last_after)
+
+    def test_list_guards_projects_fields(self):
+        """Test list_guards returns only the requested fields."""
+        self.add_guards("a")
+        del self.client.guards["a"].updated_at
+
+        guards, after = self.client.list_guards(fields=["id", "updated_at"])
+
+        self.assertEqual(guards, [{"id": "a", "updated_at": None}])
+        self.assertIsNone(after)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,19 +1,25 @@
 """Unit tests for guardrails_api.clients.pg_guard_client module."""
 
 import unittest
-from unittest.mock import Mock, patch, ANY
+from datetime import datetime
+from unittest.mock import Mock, patch
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError
 from psycopg2.errors import UniqueViolation
 from guardrails_api.classes.http_error import HttpError
-from guardrails_api.clients.pg_guard_client import PGGuardClient, from_guard_item
-
-
-class _ComparableMock(Mock):
-    """Mock subclass that supports rich comparison operators (e.g. for SQLAlchemy columns)."""
-
-    def __gt__(self, other):  # noqa: ARG002
-        return Mock()
+from sqlalchemy.dialects import postgresql
+from guardrails_api.clients.pg_guard_client import (
+    PGGuardClient,
+    delete_guard_statement,
+    from_guard_item,
+    guard_as_of_query,
+    list_guards_query,
+    to_guard_row,
+    to_upsert_batches,
+    update_guard_statement,
+    upsert_guards_statement,
+)
+from guardrails_ai.types import CreateGuardRequest, Guard as IGuard
 
 
 class TestFromGuardItem(unittest.TestCase):
@@ -40,6 +46,79 @@ class TestFromGuardItem(unittest.TestCase):
         with self.assertRaises(ValidationError):
             from_guard_item(guard_item)
 
+    def test_from_guard_item_reuses_guard_for_unchanged_row(self):
+        """Test that an unchanged row isn't encoded or validated again."""
+        updated_at = datetime(2024, 1, 1)
+        guard_item = Mock(
+            guard={"name": "cached"}, id="cached-id", updated_at=updated_at
+        )
+
+        first = from_guard_item(guard_item)
+        with (
+            patch("guardrails_api.clients.pg_guard_client.dumps") as mock_dumps,
+            patch(
+                "guardrails_api.clients.pg_guard_client.Guard.model_validate_json"
+            ) as mock_validate,
+        ):
+            second = from_guard_item(
+                Mock(guard={"name": "cached"}, id="cached-id", updated_at=updated_at)
+            )
+
+        self.assertIs(second, first)
+        mock_dumps.assert_not_called()
+        mock_validate.assert_not_called()
+        # The row's JSONB isn't modified
+        self.assertEqual(guard_item.guard, {"name": "cached"})
+
+    def test_from_guard_item_validates_changed_row(self):
+        """Test that a row with a new updated_at is validated again."""
+        first = from_guard_item(
+            Mock(
+                guard={"name": "before"},
+                id="changed-id",
+                updated_at=datetime(2024, 1, 1),
+            )
+        )
+        second = from_guard_item(
+            Mock(
+                guard={"name": "after"},
+                id="changed-id",
+                updated_at=datetime(2024, 1, 2),
+            )
+        )
+
+        self.assertIsNot(second, first)
+        self.assertEqual(second.name, "after")
+
+    def test_from_guard_item_skips_cache_without_updated_at(self):
+        """Test that rows without updated_at are always validated."""
+        first = from_guard_item(
+            Mock(guard={"name": "old"}, id="old-id", updated_at=None)
+        )
+        second = from_guard_item(
+            Mock(guard={"name": "old"}, id="old-id", updated_at=None)
+        )
+
+        self.assertIsNot(second, first)
+
+    @patch("guardrails_api.clients.pg_guard_client.VALIDATED_GUARDS_MAX_SIZE", 1)
+    def test_from_guard_item_evicts_least_recently_used_guards(self):
+        """Test that validated guards are bounded."""
+        updated_at = datetime(2024, 1, 1)
+        first = from_guard_item(
+            Mock(guard={"name": "a"}, id="evicted-a", updated_at=updated_at)
+        )
+        from_guard_item(
+            Mock(guard={"name": "b"}, id="evicted-b", updated_at=updated_at)
+        )
+
+        self.assertIsNot(
+            from_guard_item(
+                Mock(guard={"name": "a"}, id="evicted-a", updated_at=updated_at)
+            ),
+            first,
+        )
+
 
 class TestPGGuardClientInit(unittest.TestCase):
     """Test cases for PGGuardClient initialization."""
@@ -101,98 +180,169 @@ class TestGetDbContext(unittest.TestCase):
         mock_session.close.assert_called_once()
 
 
-class TestUtilGetGuardItem(unittest.TestCase):
-    """Test cases for PGGuardClient.util_get_guard_item."""
+@patch.dict("os.environ", {"DB_URL": "postgresql://primary/db"})
+@patch.dict("os.environ", {"DB_REPLICA_URL": "postgresql://replica/db"})
+class TestReplicaReads(unittest.TestCase):
+    """Test cases for routing PGGuardClient reads to the read replica."""
 
-    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
-    def test_returns_guard_item_from_db(self, mock_pg_client):
-        """Test that util_get_guard_item queries by id and returns the result."""
-        mock_guard_item = Mock()
-        mock_db = Mock()
-        mock_db.query.return_value.get.return_value = mock_guard_item
+    def setUp(self):
+        patcher = patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+        self.mock_pg_client = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.primary_session = Mock()
+        self.replica_session = Mock()
+        self.mock_pg_client.SessionLocal.return_value = self.primary_session
+        self.mock_pg_client.ReplicaSessionLocal.return_value = self.replica_session
+
+    def test_reads_from_replica(self):
+        client = PGGuardClient()
+        with client.get_db_context(read_only=True) as db:
+            self.assertIs(db, self.replica_session)
 
+    def test_writes_go_to_primary(self):
+        client = PGGuardClient()
+        with client.get_db_context() as db:
+            self.assertIs(db, self.primary_session)
+
+    @patch.dict("os.environ", {"DB_REPLICA_URL": ""})
+    def test_reads_from_primary_without_replica(self):
+        client = PGGuardClient()
+        with client.get_db_context(read_only=True) as db:
+            self.assertIs(db, self.primary_session)
+
+    @patch("guardrails_api.clients.pg_guard_client.time.monotonic")
+    def test_reads_own_writes_from_primary(self, mock_monotonic):
+        """Reads shortly after a write go to the primary, which has it."""
+        mock_monotonic.return_value = 100.0
+        self.primary_session.execute.return_value = [Mock()]
         client = PGGuardClient()
-        result = client.util_get_guard_item("some-id", mock_db)
 
-        self.assertEqual(result, mock_guard_item)
+        client.util_write_guards([Mock()], self.primary_session, "conflict")
 
-    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
-    def test_returns_none_when_not_found(self, mock_pg_client):
-        """Test that util_get_guard_item returns None when no item found."""
-        mock_db = Mock()
-        mock_db.query.return_value.get.return_value = None
+        mock_monotonic.return_value = 104.0
+        with client.get_db_context(read_only=True) as db:
+            self.assertIs(db, self.primary_session)
+        mock_monotonic.return_value = 105.0
+        with client.get_db_context(read_only=True) as db:
+            self.assertIs(db, self.replica_session)
 
+    @patch.dict("os.environ", {"DB_REPLICA_READ_YOUR_WRITES_SECONDS": "30"})
+    @patch("guardrails_api.clients.pg_guard_client.time.monotonic")
+    def test_reads_changes_from_other_workers_from_primary(self, mock_monotonic):
+        """A change reported by the GuardChangeListener also opens the window."""
+        mock_monotonic.return_value = 100.0
         client = PGGuardClient()
-        result = client.util_get_guard_item("missing-id", mock_db)
 
-        self.assertIsNone(result)
+        client.evict_guard("some-id")
 
-    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
-    def test_queries_guard_item_model(self, mock_pg_client):
-        """Test that util_get_guard_item queries the GuardItem model."""
-        from guardrails_api.db.models.guard_item import GuardItem
+        mock_monotonic.return_value = 129.0
+        self.assertFalse(client.read_from_replica())
+        mock_monotonic.return_value = 130.0
+        self.assertTrue(client.read_from_replica())
 
-        mock_db = Mock()
-        mock_db.query.return_value.get.return_value = None
+    def test_get_guard_reads_from_replica(self):
+        guard_item = Mock(id="some-id", guard={"name": "some-guard"})
+        self.replica_session.query.return_value.get.return_value = guard_item
 
         client = PGGuardClient()
-        client.util_get_guard_item("some-id", mock_db)
+        guard = client.get_guard("some-id")
+
+        self.assertEqual(guard.name, "some-guard")
+        self.primary_session.query.assert_not_called()
 
-        mock_db.query.assert_called_once_with(GuardItem)
-        mock_db.query.return_value.get.assert_called_once_with("some-id")
+
+class TestWriteStatements(unittest.TestCase):
+    """Test cases for the guard write statements."""
+
+    def compile(self, statement) -> str:
+        return str(statement.compile(dialect=postgresql.dialect()))
+
+    def test_upsert_is_one_insert_on_conflict_returning(self):
+        rows = [
+            to_guard_row("id-1", IGuard(id="id-1", name="one")),
+            to_guard_row("id-2", IGuard(id="id-2", name="two")),
+        ]
+        sql = self.compile(upsert_guards_statement(rows))
+
+        self.assertTrue(sql.startswith("INSERT INTO guards"))
+        self.assertIn("ON CONFLICT (id) DO UPDATE SET", sql)
+        self.assertIn("updated_at = CURRENT_TIMESTAMP", sql)
+        self.assertIn("RETURNING guards.id, guards.guard", sql)
+        self.assertEqual(sql.count("INSERT"), 1)
+
+    def test_upsert_without_overwrite_does_nothing_on_conflict(self):
+        rows = [to_guard_row("id-1", IGuard(id="id-1", name="one"))]
+        sql = self.compile(upsert_guards_statement(rows, overwrite=False))
+
+        self.assertIn("ON CONFLICT (id) DO NOTHING", sql)
+        self.assertIn("RETURNING guards.id, guards.guard", sql)
+
+    def test_update_and_delete_return_the_row(self):
+        guard = IGuard(id="id-1", name="one")
+
+        update_sql = self.compile(update_guard_statement("id-1", guard))
+        delete_sql = self.compile(delete_guard_statement("id-1"))
+
+        self.assertIn("updated_at=CURRENT_TIMESTAMP", update_sql)
+        self.assertIn("RETURNING guards.id, guards.guard", update_sql)
+        self.assertIn("RETURNING guards.id, guards.guard", delete_sql)
+
+    @patch("guardrails_api.clients.pg_guard_client.UPSERT_GUARDS_BATCH_SIZE", 2)
+    def test_upsert_batches_keep_last_guard_per_id(self):
+        guards = [
+            IGuard(id="a", name="first"),
+            IGuard(id="b", name="b"),
+            IGuard(id="a", name="last"),
+            IGuard(id="c", name="c"),
+        ]
+
+        ids, batches = to_upsert_batches(guards)
+
+        self.assertEqual(ids, ["a", "b", "a", "c"])
+        self.assertEqual(
+            [[row["name"] for row in batch] for batch in batches],
+            [["last", "b"], ["c"]],
+        )
 
 
 class TestUtilCreateGuard(unittest.TestCase):
     """Test cases for PGGuardClient.util_create_guard."""
 
     @patch("guardrails_api.clients.pg_guard_client.from_guard_item")
-    @patch("guardrails_api.clients.pg_guard_client.GuardItem")
     @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
-    def test_creates_and_commits_guard(
-        self, mock_pg_client, mock_guard_item_class, mock_from_guard_item
-    ):
-        """Test util_create_guard adds guard item and commits."""
+    def test_creates_and_commits_guard(self, mock_pg_client, mock_from_guard_item):
+        """Test util_create_guard inserts the guard and commits."""
         mock_db = Mock()
-        mock_guard = Mock()
-        mock_guard.name = "test_guard"
-        mock_guard.model_dump.return_value = {"name": "test_guard"}
-
-        mock_guard_item = Mock()
-        mock_guard_item_class.return_value = mock_guard_item
+        mock_row = Mock()
+        mock_db.execute.return_value = [mock_row]
         mock_result = Mock()
         mock_from_guard_item.return_value = mock_result
 
         client = PGGuardClient()
-        result = client.util_create_guard(mock_guard, mock_db)
-
-        mock_guard_item_class.assert_called_once_with(
-            id=ANY, name="test_guard", guard={"name": "test_guard"}
+        result = client.util_create_guard(
+            CreateGuardRequest(name="test_guard"), mock_db
         )
-        mock_db.add.assert_called_once_with(mock_guard_item)
+
+        mock_db.execute.assert_called_once()
         mock_db.commit.assert_called_once()
-        mock_from_guard_item.assert_called_once_with(mock_guard_item)
+        mock_from_guard_item.assert_called_once_with(mock_row)
         self.assertEqual(result, mock_result)
 
-    @patch("guardrails_api.clients.pg_guard_client.GuardItem")
     @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
-    def test_raises_http_409_on_unique_violation(
-        self, mock_pg_client, mock_guard_item_class
-    ):
+    def test_raises_http_409_on_unique_violation(self, mock_pg_client):
         """Test util_create_guard raises HttpError 409 on UniqueViolation."""
         mock_db = Mock()
-        mock_guard = Mock()
-        mock_guard.name = "duplicate_guard"
-        mock_guard.model_dump.return_value = {"name": "duplicate_guard"}
-
         unique_violation = UniqueViolation()
         integrity_error = IntegrityError(
             statement=None, params=None, orig=unique_violation
         )
-        mock_db.add.side_effect = integrity_error
+        mock_db.execute.side_effect = integrity_error
 
         client = PGGuardClient()
         with self.assertRaises(HttpError) as ctx:
-            client.util_create_guard(mock_guard, mock_db)
+            client.util_create_guard(
+                CreateGuardRequest(name="duplicate_guard"), mock_db
+            )
 
         error = ctx.exception
         self.assertEqual(error.status, 409)
@@ -200,25 +350,18 @@ class TestUtilCreateGuard(unittest.TestCase):
         self.assertIsNotNone(error.cause)
         self.assertIn("duplicate_guard", error.cause)  # type: ignore[arg-type]
 
-    @patch("guardrails_api.clients.pg_guard_client.GuardItem")
     @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
-    def test_reraises_non_unique_integrity_error(
-        self, mock_pg_client, mock_guard_item_class
-    ):
+    def test_reraises_non_unique_integrity_error(self, mock_pg_client):
         """Test util_create_guard re-raises IntegrityError that is not UniqueViolation."""
         mock_db = Mock()
-        mock_guard = Mock()
-        mock_guard.name = "test_guard"
-        mock_guard.model_dump.return_value = {}
-
         other_error = IntegrityError(
             statement=None, params=None, orig=Exception("other")
         )
-        mock_db.add.side_effect = other_error
+        mock_db.execute.side_effect = other_error
 
         client = PGGuardClient()
         with self.assertRaises(IntegrityError):
-            client.util_create_guard(mock_guard, mock_db)
+            client.util_create_guard(CreateGuardRequest(name="test_guard"), mock_db)
 
 
 class TestGetGuard(unittest.TestCase):
@@ -261,61 +404,173 @@ class TestGetGuard(unittest.TestCase):
         self.assertIsNotNone(error.cause)
         self.assertIn("missing-id", error.cause)  # type: ignore[arg-type]
 
+    def test_as_of_query_is_one_statement_over_audit_and_latest(self):
+        """Test the point in time lookup is a single query preferring the
+        first audit row replaced after as_of_date over the latest row."""
+        sql = str(
+            guard_as_of_query("some-id", "2024-01-01").compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        self.assertEqual(sql.count("SELECT"), 3)
+        self.assertIn("UNION ALL", sql)
+        self.assertIn("guards_audit.replaced_on >", sql)
+        self.assertIn("ORDER BY guards_audit.replaced_on ASC", sql)
+        self.assertIn("ORDER BY anon_1.historical DESC", sql)
+
     @patch("guardrails_api.clients.pg_guard_client.from_guard_item")
-    @patch("guardrails_api.clients.pg_guard_client.GuardItemAudit")
     @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
-    def test_returns_audit_guard_id_when_as_of_date_given(
-        self, mock_pg_client, mock_audit_class, mock_from_guard_item
+    def test_returns_audit_version_when_as_of_date_given(
+        self, mock_pg_client, mock_from_guard_item
     ):
-        """Test get_guard uses audit item's guard_id when as_of_date is provided."""
-        mock_audit_class.replaced_on = _ComparableMock()
-        mock_latest = Mock()
-        mock_latest = "guard-id"
-        mock_audit_item = Mock()
-        mock_audit_item.id = "audit-id"
-        mock_audit_item.guard_id = "guard-id"
-
+        """Test get_guard builds the guard from the row the query returns."""
+        mock_row = Mock(id="some-id", historical=True)
         mock_session = Mock()
-        mock_session.query.return_value.get.return_value = mock_latest
-        (
-            mock_session.query.return_value.filter_by.return_value.filter.return_value.order_by.return_value.first.return_value
-        ) = mock_audit_item
+        mock_session.execute.return_value.first.return_value = mock_row
         mock_pg_client.return_value.SessionLocal.return_value = mock_session
-
         mock_result = Mock()
         mock_from_guard_item.return_value = mock_result
 
         client = PGGuardClient()
-        client.get_guard("some-id", as_of_date="2024-01-01")
+        result = client.get_guard("some-id", as_of_date="2024-01-01")
 
-        guard_item = mock_from_guard_item.call_args[0][0]
-        self.assertEqual(guard_item.id, "guard-id")
+        mock_session.execute.assert_called_once()
+        mock_session.query.assert_not_called()
+        mock_from_guard_item.assert_called_once_with(mock_row)
+        self.assertEqual(result, mock_result)
 
-    @patch("guardrails_api.clients.pg_guard_client.from_guard_item")
-    @patch("guardrails_api.clients.pg_guard_client.GuardItemAudit")
     @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
-    def test_falls_back_to_latest_when_no_audit_found(
-        self, mock_pg_client, mock_audit_class, mock_from_guard_item
-    ):
-        """Test get_guard falls back to latest guard when audit query returns None."""
-        mock_audit_class.replaced_on = _ComparableMock()
-        mock_latest = Mock()
-
+    def test_raises_404_when_no_version_found(self, mock_pg_client):
         mock_session = Mock()
-        mock_session.query.return_value.get.return_value = mock_latest
-        (
-            mock_session.query.return_value.filter_by.return_value.filter.return_value.order_by.return_value.first.return_value
-        ) = None
+        mock_session.execute.return_value.first.return_value = None
         mock_pg_client.return_value.SessionLocal.return_value = mock_session
 
-        mock_result = Mock()
-        mock_from_guard_item.return_value = mock_result
+        client = PGGuardClient()
+        with self.assertRaises(HttpError) as ctx:
+            client.get_guard("missing-id", as_of_date="2024-01-01")
 
+        self.assertEqual(ctx.exception.status, 404)
+
+
+class TestGetGuardCache(unittest.TestCase):
+    """Test cases for PGGuardClient's latest guard cache."""
+
+    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+    def test_does_not_cache_until_enabled(self, mock_pg_client):
+        """Test get_guard reads from the db every time while the cache is disabled."""
         client = PGGuardClient()
-        result = client.get_guard("some-id", as_of_date="2024-01-01")
+        client.util_load_guard = Mock(return_value=Mock())
 
-        mock_from_guard_item.assert_called_once_with(mock_latest)
-        self.assertEqual(result, mock_result)
+        client.get_guard("some-id")
+        client.get_guard("some-id")
+
+        self.assertEqual(client.util_load_guard.call_count, 2)
+
+    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+    def test_serves_cached_guard_when_enabled(self, mock_pg_client):
+        """Test get_guard only reads from the db once while the cache is enabled."""
+        mock_guard = Mock()
+        client = PGGuardClient()
+        client.util_load_guard = Mock(return_value=mock_guard)
+        client.enable_guard_cache()
+
+        first = client.get_guard("some-id")
+        second = client.get_guard("some-id")
+
+        self.assertIs(first, mock_guard)
+        self.assertIs(second, mock_guard)
+        client.util_load_guard.assert_called_once_with("some-id")
+
+    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+    def test_as_of_date_bypasses_latest_cache(self, mock_pg_client):
+        """Test point in time lookups neither read nor fill the latest cache."""
+        client = PGGuardClient()
+        client.util_load_guard_as_of = Mock(return_value=(Mock(), False))
+        client.enable_guard_cache()
+
+        client.get_guard("some-id", as_of_date="2024-01-01")
+
+        client.util_load_guard_as_of.assert_called_once_with("some-id", "2024-01-01")
+        self.assertEqual(client.cached_guards, {})
+
+    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+    def test_caches_historical_versions(self, mock_pg_client):
+        """Test versions from the audit table are cached without a listener."""
+        mock_guard = Mock()
+        client = PGGuardClient()
+        client.util_load_guard_as_of = Mock(return_value=(mock_guard, True))
+
+        first = client.get_guard("some-id", as_of_date="2024-01-01")
+        second = client.get_guard("some-id", as_of_date="2024-01-01")
+
+        self.assertIs(first, mock_guard)
+        self.assertIs(second, mock_guard)
+        client.util_load_guard_as_of.assert_called_once()
+
+    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+    def test_does_not_cache_latest_version_for_as_of_date(self, mock_pg_client):
+        """Test a lookup answered by the latest row is not cached, since the
+        guard can still be replaced."""
+        client = PGGuardClient()
+        client.util_load_guard_as_of = Mock(return_value=(Mock(), False))
+
+        client.get_guard("some-id", as_of_date="2024-01-01")
+        client.get_guard("some-id", as_of_date="2024-01-01")
+
+        self.assertEqual(client.util_load_guard_as_of.call_count, 2)
+
+    @patch("guardrails_api.clients.pg_guard_client.HISTORICAL_GUARDS_MAX_SIZE", 1)
+    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+    def test_evicts_least_recently_used_historical_version(self, mock_pg_client):
+        client = PGGuardClient()
+        client.util_cache_historical_guard("some-id", "2024-01-01", Mock())
+        client.util_cache_historical_guard("some-id", "2024-02-01", Mock())
+
+        self.assertEqual(list(client.historical_guards), [("some-id", "2024-02-01")])
+
+    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+    def test_evict_guard_forces_reload(self, mock_pg_client):
+        """Test evict_guard drops the cached guard."""
+        client = PGGuardClient()
+        client.util_load_guard = Mock(side_effect=[Mock(), Mock()])
+        client.enable_guard_cache()
+
+        first = client.get_guard("some-id")
+        client.evict_guard("some-id")
+        second = client.get_guard("some-id")
+
+        self.assertIsNot(first, second)
+        self.assertEqual(client.util_load_guard.call_count, 2)
+
+    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+    def test_change_during_read_is_not_cached(self, mock_pg_client):
+        """Test a guard read before a concurrent change is not cached."""
+        client = PGGuardClient()
+        client.enable_guard_cache()
+
+        def load_then_change(id):
+            client.evict_guard(id)
+            return Mock()
+
+        client.util_load_guard = Mock(side_effect=load_then_change)
+
+        client.get_guard("some-id")
+
+        self.assertEqual(client.cached_guards, {})
+
+    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+    def test_disable_guard_cache_clears_cache(self, mock_pg_client):
+        """Test disable_guard_cache empties and disables the cache."""
+        client = PGGuardClient()
+        client.util_load_guard = Mock(return_value=Mock())
+        client.enable_guard_cache()
+        client.get_guard("some-id")
+
+        client.disable_guard_cache()
+
+        self.assertFalse(client.guard_cache_enabled)
+        self.assertEqual(client.cached_guards, {})
 
 
 class TestGetGuards(unittest.TestCase):
@@ -380,6 +635,68 @@ class TestGetGuards(unittest.TestCase):
         self.assertEqual(result, [])
 
 
+class TestListGuards(unittest.TestCase):
+    """Test cases for PGGuardClient.list_guards."""
+
+    def compile(self, query) -> str:
+        return str(query.compile(dialect=postgresql.dialect()))
+
+    def test_query_uses_keyset_on_name_and_id(self):
+        """Test pages start after the cursor and read one extra row."""
+        sql = self.compile(
+            list_guards_query(guard_name="g", limit=10, after=("g", "id-1"))
+        )
+
+        self.assertIn("(guards.name, guards.id) > (", sql)
+        self.assertIn("ORDER BY guards.name, guards.id", sql)
+        self.assertIn("guards.name = ", sql)
+        self.assertIn("LIMIT", sql)
+
+    def test_projection_does_not_select_guard_json(self):
+        """Test projections select only their columns and the sort key."""
+        sql = self.compile(list_guards_query(fields=["updated_at"]))
+
+        self.assertNotIn("guards.guard", sql)
+        self.assertIn("guards.updated_at", sql)
+        self.assertNotIn("LIMIT", sql)
+
+    @patch("guardrails_api.clients.pg_guard_client.from_guard_item")
+    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+    def test_returns_page_and_next_key(self, mock_pg_client, mock_from_guard_item):
+        """Test the extra row is dropped and its predecessor's key returned."""
+        rows = [Mock(), Mock()]
+        rows[0].name, rows[0].id = "a", "id-a"
+        mock_session = Mock()
+        mock_session.scalars.return_value.all.return_value = rows
+        mock_pg_client.return_value.SessionLocal.return_value = mock_session
+        mock_guard = Mock()
+        mock_from_guard_item.return_value = mock_guard
+
+        client = PGGuardClient()
+        guards, after = client.list_guards(limit=1)
+
+        self.assertEqual(guards, [mock_guard])
+        self.assertEqual(after, ("a", "id-a"))
+        mock_from_guard_item.assert_called_once_with(rows[0])
+
+    @patch("guardrails_api.clients.pg_guard_client.from_guard_item")
+    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+    def test_projection_skips_guard_parsing(self, mock_pg_client, mock_from_guard_item):
+        """Test projected rows are returned as dicts without from_guard_item."""
+        row = Mock()
+        row.name, row.id = "a", "id-a"
+        mock_session = Mock()
+        mock_session.execute.return_value.all.return_value = [row]
+        mock_pg_client.return_value.SessionLocal.return_value = mock_session
+
+        client = PGGuardClient()
+        guards, after = client.list_guards(fields=["id", "name"])
+
+        self.assertEqual(guards, [{"id": "id-a", "name": "a"}])
+        self.assertIsNone(after)
+        mock_from_guard_item.assert_not_called()
+
+
 class TestCreateGuard(unittest.TestCase):
     """Test cases for PGGuardClient.create_guard."""
 
@@ -407,40 +724,35 @@ class TestUpdateGuard(unittest.TestCase):
     @patch("guardrails_api.clients.pg_guard_client.from_guard_item")
     @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
     def test_updates_existing_guard(self, mock_pg_client, mock_from_guard_item):
-        """Test update_guard updates the guard dict, timestamps, and commits."""
-        mock_guard_item = Mock()
+        """Test update_guard updates the row in one statement and commits."""
+        mock_row = Mock()
         mock_session = Mock()
-        mock_session.execute.return_value.scalar.return_value = "2024-01-01T00:00:00"
+        mock_session.execute.return_value = [mock_row]
         mock_pg_client.return_value.SessionLocal.return_value = mock_session
-
-        mock_guard = Mock()
-        mock_guard.model_dump.return_value = {"name": "updated"}
         mock_result = Mock()
         mock_from_guard_item.return_value = mock_result
 
         client = PGGuardClient()
-        client.util_get_guard_item = Mock(return_value=mock_guard_item)
-
-        result = client.update_guard("some-id", mock_guard)
+        client.evict_guard = Mock()
+        result = client.update_guard("some-id", IGuard(id="some-id", name="updated"))
 
-        client.util_get_guard_item.assert_called_once_with("some-id", mock_session)
-        self.assertEqual(mock_guard_item.guard, {"name": "updated"})
-        self.assertEqual(mock_guard_item.updated_at, "2024-01-01T00:00:00")
+        mock_session.execute.assert_called_once()
         mock_session.commit.assert_called_once()
-        mock_from_guard_item.assert_called_once_with(mock_guard_item)
+        client.evict_guard.assert_called_once_with("some-id")
+        mock_from_guard_item.assert_called_once_with(mock_row)
         self.assertEqual(result, mock_result)
 
     @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
     def test_raises_404_when_guard_not_found(self, mock_pg_client):
         """Test update_guard raises HttpError 404 when guard does not exist."""
         mock_session = Mock()
+        mock_session.execute.return_value = []
         mock_pg_client.return_value.SessionLocal.return_value = mock_session
 
         client = PGGuardClient()
-        client.util_get_guard_item = Mock(return_value=None)
 
         with self.assertRaises(HttpError) as ctx:
-            client.update_guard("missing-id", Mock())
+            client.update_guard("missing-id", IGuard(id="missing-id", name="missing"))
 
         error = ctx.exception
         self.assertEqual(error.status, 404)
@@ -454,45 +766,67 @@ class TestUpsertGuard(unittest.TestCase):
 
     @patch("guardrails_api.clients.pg_guard_client.from_guard_item")
     @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
-    def test_updates_when_guard_exists(self, mock_pg_client, mock_from_guard_item):
-        """Test upsert_guard updates existing guard."""
-        mock_guard_item = Mock()
+    def test_upserts_in_one_statement(self, mock_pg_client, mock_from_guard_item):
+        """Test upsert_guard writes with a single statement and evicts the guard."""
+        mock_row = Mock()
         mock_session = Mock()
-        mock_session.execute.return_value.scalar.return_value = "2024-01-01T00:00:00"
+        mock_session.execute.return_value = [mock_row]
         mock_pg_client.return_value.SessionLocal.return_value = mock_session
-
-        mock_guard = Mock()
-        mock_guard.model_dump.return_value = {"name": "updated"}
         mock_result = Mock()
         mock_from_guard_item.return_value = mock_result
 
         client = PGGuardClient()
-        client.util_get_guard_item = Mock(return_value=mock_guard_item)
-
-        result = client.upsert_guard("some-id", mock_guard)
+        client.evict_guard = Mock()
+        result = client.upsert_guard("some-id", CreateGuardRequest(name="updated"))
 
-        self.assertEqual(mock_guard_item.guard, {"name": "updated"})
+        mock_session.execute.assert_called_once()
+        mock_session.query.assert_not_called()
         mock_session.commit.assert_called_once()
-        mock_from_guard_item.assert_called_once_with(mock_guard_item)
+        client.evict_guard.assert_called_once_with("some-id")
+        mock_from_guard_item.assert_called_once_with(mock_row)
         self.assertEqual(result, mock_result)
 
+
+class TestUpsertGuards(unittest.TestCase):
+    """Test cases for PGGuardClient.upsert_guards."""
+
+    @patch("guardrails_api.clients.pg_guard_client.UPSERT_GUARDS_BATCH_SIZE", 1)
+    @patch("guardrails_api.clients.pg_guard_client.from_guard_item")
     @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
-    def test_creates_when_guard_not_found(self, mock_pg_client):
-        """Test upsert_guard creates a new guard when one does not exist."""
+    def test_upserts_batches_in_one_transaction(
+        self, mock_pg_client, mock_from_guard_item
+    ):
+        """Test every batch is written before a single commit and guards are
+        returned in the order they were given."""
+        rows = [Mock(id="b"), Mock(id="a")]
         mock_session = Mock()
+        mock_session.execute.side_effect = [[rows[0]], [rows[1]]]
         mock_pg_client.return_value.SessionLocal.return_value = mock_session
-
-        mock_guard = Mock()
-        mock_result = Mock()
+        mock_from_guard_item.side_effect = lambda row: f"guard-{row.id}"
 
         client = PGGuardClient()
-        client.util_get_guard_item = Mock(return_value=None)
-        client.util_create_guard = Mock(return_value=mock_result)
+        result = client.upsert_guards(
+            [IGuard(id="a", name="a"), IGuard(id="b", name="b")]
+        )
 
-        result = client.upsert_guard("new-id", mock_guard)
+        self.assertEqual(mock_session.execute.call_count, 2)
+        mock_session.commit.assert_called_once()
+        self.assertEqual(result, ["guard-a", "guard-b"])
 
-        client.util_create_guard.assert_called_once_with(mock_guard, mock_session)
-        self.assertEqual(result, mock_result)
+    @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
+    def test_raises_409_and_commits_nothing_on_conflict(self, mock_pg_client):
+        mock_session = Mock()
+        mock_session.execute.side_effect = IntegrityError(
+            statement=None, params=None, orig=UniqueViolation()
+        )
+        mock_pg_client.return_value.SessionLocal.return_value = mock_session
+
+        client = PGGuardClient()
+        with self.assertRaises(HttpError) as ctx:
+            client.upsert_guards([IGuard(id="a", name="a")])
+
+        self.assertEqual(ctx.exception.status, 409)
+        mock_session.commit.assert_not_called()
 
 
 class TestDeleteGuard(unittest.TestCase):
@@ -501,33 +835,31 @@ class TestDeleteGuard(unittest.TestCase):
     @patch("guardrails_api.clients.pg_guard_client.from_guard_item")
     @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
     def test_deletes_existing_guard(self, mock_pg_client, mock_from_guard_item):
-        """Test delete_guard deletes the item from db and returns it."""
-        mock_guard_item = Mock()
+        """Test delete_guard deletes the row and returns the deleted guard."""
+        mock_row = Mock()
         mock_session = Mock()
+        mock_session.execute.return_value.all.return_value = [mock_row]
         mock_pg_client.return_value.SessionLocal.return_value = mock_session
 
         mock_result = Mock()
         mock_from_guard_item.return_value = mock_result
 
         client = PGGuardClient()
-        client.util_get_guard_item = Mock(return_value=mock_guard_item)
-
         result = client.delete_guard("some-id")
 
-        client.util_get_guard_item.assert_called_once_with("some-id", mock_session)
-        mock_session.delete.assert_called_once_with(mock_guard_item)
+        mock_session.execute.assert_called_once()
         mock_session.commit.assert_called_once()
-        mock_from_guard_item.assert_called_once_with(mock_guard_item)
+        mock_from_guard_item.assert_called_once_with(mock_row)
         self.assertEqual(result, mock_result)
 
     @patch("guardrails_api.clients.pg_guard_client.PostgresClient")
     def test_raises_404_when_guard_not_found(self, mock_pg_client):
         """Test delete_guard raises HttpError 404 when guard does not exist."""
         mock_session = Mock()
+        mock_session.execute.return_value.all.return_value = []
         mock_pg_client.return_value.SessionLocal.return_value = mock_session
 
         client = PGGuardClient()
-        client.util_get_guard_item = Mock(return_value=None)
 
         with self.assertRaises(HttpError) as ctx:
             client.delete_guard("missing-id")
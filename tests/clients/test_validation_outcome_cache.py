@@ -0,0 +1,155 @@
+"""Unit tests for guardrails_api.clients.validation_outcome_cache module."""
+
+import os
+import unittest
+from unittest.mock import patch
+from guardrails_ai.types import Guard as IGuard, Validator
+from guardrails_api.clients.validation_outcome_cache import (
+    DEFAULT_VALIDATION_CACHE_MAX_BYTES,
+    DEFAULT_VALIDATION_CACHE_TTL,
+    ValidationOutcomeCache,
+    validation_cache_is_enabled,
+)
+from guardrails_api.utils.fast_json import loads
+from guardrails_api.utils.metrics import Metrics
+
+ENABLED = {"VALIDATION_CACHE_ENABLED": "true"}
+
+
+class TestValidationCacheIsEnabled(unittest.TestCase):
+    """Test cases for the validation_cache_is_enabled function."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_disabled_by_default(self):
+        self.assertFalse(validation_cache_is_enabled())
+
+    @patch.dict(os.environ, {"VALIDATION_CACHE_ENABLED": "TRUE"})
+    def test_enabled_case_insensitive(self):
+        self.assertTrue(validation_cache_is_enabled())
+
+
+class TestValidationOutcomeCache(unittest.TestCase):
+    """Test cases for the ValidationOutcomeCache class."""
+
+    def make_cache(self, env: dict) -> ValidationOutcomeCache:
+        cache = ValidationOutcomeCache()
+        with patch.dict(os.environ, env):
+            cache.initialize()
+        self.addCleanup(cache.initialize)
+        return cache
+
+    def make_guard(self, *validators: Validator) -> IGuard:
+        return IGuard(id="guard-id", name="guard", validators=list(validators))
+
+    def test_initialize_defaults(self):
+        """Test the default TTL and size bound."""
+        with patch.dict(os.environ, {}, clear=True):
+            cache = self.make_cache({})
+
+        self.assertFalse(cache.enabled)
+        self.assertEqual(cache.ttl, DEFAULT_VALIDATION_CACHE_TTL)
+        self.assertEqual(cache.max_bytes, DEFAULT_VALIDATION_CACHE_MAX_BYTES)
+
+    def test_not_cacheable_when_disabled(self):
+        """Test that nothing is cacheable while the cache is disabled."""
+        cache = self.make_cache({"VALIDATION_CACHE_ENABLED": "false"})
+
+        self.assertFalse(cache.is_cacheable(self.make_guard()))
+
+    def test_deterministic_guard_is_cacheable(self):
+        """Test that a guard without reasks or LLM validators is cacheable."""
+        cache = self.make_cache(ENABLED)
+        guard = self.make_guard(
+            Validator(id="guardrails/regex_match", onFail="exception")
+        )
+
+        self.assertTrue(cache.is_cacheable(guard))
+
+    def test_reask_guard_is_not_cacheable(self):
+        """Test that guards with reask validators skip the cache."""
+        cache = self.make_cache(ENABLED)
+        skips = Metrics().get("validation_cache_skips_total")
+
+        self.assertFalse(
+            cache.is_cacheable(self.make_guard(Validator(id="a", onFail="reask")))
+        )
+        self.assertFalse(
+            cache.is_cacheable(self.make_guard(Validator(id="a", onFail="fix_reask")))
+        )
+        self.assertEqual(Metrics().get("validation_cache_skips_total"), skips + 2)
+
+    def test_llm_validator_is_not_cacheable(self):
+        """Test that validators configured with an llm_callable skip the cache."""
+        cache = self.make_cache(ENABLED)
+        guard = self.make_guard(
+            Validator(id="guardrails/llm_critic", kwargs={"llm_callable": "gpt-4o"})
+        )
+
+        self.assertFalse(cache.is_cacheable(guard))
+
+    def test_skipped_validators_are_not_cacheable(self):
+        """Test that VALIDATION_CACHE_SKIP_VALIDATORS opts validators out."""
+        cache = self.make_cache(
+            {**ENABLED, "VALIDATION_CACHE_SKIP_VALIDATORS": "a/random, b/other"}
+        )
+
+        self.assertFalse(cache.is_cacheable(self.make_guard(Validator(id="b/other"))))
+        self.assertTrue(cache.is_cacheable(self.make_guard(Validator(id="c/fine"))))
+
+    def test_key_depends_on_inputs_and_guard_version(self):
+        """Test that the key changes with each input and with the guard version."""
+        cache = self.make_cache(ENABLED)
+        guard = self.make_guard(Validator(id="a"))
+        key = cache.get_key(guard, "v1", "out", {"m": 1}, {"p": 1})
+
+        self.assertEqual(key, cache.get_key(guard, "v1", "out", {"m": 1}, {"p": 1}))
+        self.assertNotEqual(
+            key, cache.get_key(guard, "v1", "other", {"m": 1}, {"p": 1})
+        )
+        self.assertNotEqual(key, cache.get_key(guard, "v1", "out", {"m": 2}, {"p": 1}))
+        self.assertNotEqual(key, cache.get_key(guard, "v1", "out", {"m": 1}, {"p": 2}))
+        self.assertNotEqual(key, cache.get_key(guard, "v2", "out", {"m": 1}, {"p": 1}))
+
+    def test_get_and_set_count_hits_and_misses(self):
+        """Test that outcomes round trip and hits and misses are counted."""
+        cache = self.make_cache(ENABLED)
+        hits = Metrics().get("validation_cache_hits_total")
+        misses = Metrics().get("validation_cache_misses_total")
+
+        self.assertIsNone(cache.get("key"))
+        cache.set("key", {"callId": "1", "validationPassed": True})
+
+        outcome = loads(cache.get("key"))
+        self.assertEqual(outcome["validationPassed"], True)
+        self.assertEqual(Metrics().get("validation_cache_hits_total"), hits + 1)
+        self.assertEqual(Metrics().get("validation_cache_misses_total"), misses + 1)
+
+    def test_get_replays_outcome_with_a_new_call_id(self):
+        """Test that every hit gets its own callId instead of the cached one."""
+        cache = self.make_cache(ENABLED)
+        cache.set("key", {"callId": "1", "validationPassed": True})
+
+        first, second = loads(cache.get("key")), loads(cache.get("key"))
+
+        self.assertEqual(list(first), ["callId", "validationPassed"])
+        self.assertNotIn(first["callId"], {"1", second["callId"]})
+
+    def test_set_counts_evictions(self):
+        """Test that evictions caused by the byte bound are counted."""
+        cache = self.make_cache({**ENABLED, "VALIDATION_CACHE_MAX_BYTES": "30"})
+        evictions = Metrics().get("validation_cache_evictions_total")
+
+        cache.set("a", {"v": "x" * 10})
+        cache.set("b", {"v": "x" * 10})
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(
+            Metrics().get("validation_cache_evictions_total"), evictions + 1
+        )
+        self.assertEqual(
+            Metrics().get("validation_cache_bytes"), cache.outcomes.total_bytes
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
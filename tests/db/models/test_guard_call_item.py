@@ -0,0 +1,37 @@
+"""Unit tests for guardrails_api.models.guard_call_item module."""
+
+import unittest
+from guardrails_api.db.models.guard_call_item import GuardCallItem
+
+
+class TestGuardCallItem(unittest.TestCase):
+    """Test cases for the GuardCallItem model."""
+
+    def test_guard_call_item_initialization(self):
+        """Test GuardCallItem initialization."""
+        call = {"id": "call-123", "iterations": []}
+
+        guard_call_item = GuardCallItem(id="call-123", guard_id="guard-1", call=call)
+
+        self.assertEqual(guard_call_item.id, "call-123")
+        self.assertEqual(guard_call_item.guard_id, "guard-1")
+        self.assertEqual(guard_call_item.call, call)
+
+    def test_guard_call_item_table_name(self):
+        """Test that GuardCallItem uses the guard_calls table."""
+        self.assertEqual(GuardCallItem.__tablename__, "guard_calls")
+
+    def test_guard_call_item_is_indexed_by_guard_and_time(self):
+        """Test that calls are indexed for lookups by guard id and time range."""
+        indexes = {
+            index.name: [column.name for column in index.columns]
+            for index in GuardCallItem.__table__.indexes
+        }
+
+        self.assertEqual(
+            indexes["ix_guard_calls_guard_id_created_at"], ["guard_id", "created_at"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -125,6 +125,12 @@ class TestGuardItemAudit(unittest.TestCase):
 
         self.assertEqual(audit.id, "primary-key-test")
 
+    def test_guard_item_audit_primary_key_includes_replaced_on(self):
+        """Test that the primary key matches the partitioned guards_audit table."""
+        primary_key = [column.name for column in GuardItemAudit.__table__.primary_key]
+
+        self.assertEqual(primary_key, ["id", "replaced_on"])
+
 
 if __name__ == "__main__":
     unittest.main()
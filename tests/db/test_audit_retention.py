@@ -0,0 +1,250 @@
+"""Unit tests for guardrails_api.db.audit_retention module."""
+
+import io
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from guardrails_api.db import audit_retention
+from guardrails_api.db.audit_retention import (
+    compact_audit,
+    create_audit_partitions,
+    delete_expired_versions,
+    drop_expired_partitions,
+    get_audit_partitions,
+    get_audit_retention_days,
+    next_month_start,
+    partition_name,
+)
+
+
+def mock_engine(connection: MagicMock) -> MagicMock:
+    engine = MagicMock()
+    engine.begin.return_value.__enter__.return_value = connection
+    engine.connect.return_value.__enter__.return_value = connection
+    return engine
+
+
+def audit_row(id: str):
+    return SimpleNamespace(
+        _asdict=lambda: {"id": id, "replaced_on": datetime(2024, 1, 1)}
+    )
+
+
+class TestGetAuditRetentionDays(unittest.TestCase):
+    @patch.dict("os.environ", {}, clear=True)
+    def test_keeps_versions_forever_by_default(self):
+        self.assertIsNone(get_audit_retention_days())
+
+    @patch.dict("os.environ", {"GUARD_AUDIT_RETENTION_DAYS": "90"})
+    def test_reads_env_var(self):
+        self.assertEqual(get_audit_retention_days(), 90)
+
+    @patch.dict("os.environ", {"GUARD_AUDIT_RETENTION_DAYS": "0"})
+    def test_rejects_non_positive_days(self):
+        with self.assertRaises(ValueError):
+            get_audit_retention_days()
+
+
+class TestPartitionNames(unittest.TestCase):
+    def test_next_month_start_rolls_over_the_year(self):
+        self.assertEqual(
+            next_month_start(datetime(2024, 12, 31, 23, 59)), datetime(2025, 1, 1)
+        )
+
+    def test_partition_name(self):
+        self.assertEqual(partition_name(datetime(2024, 3, 1)), "guards_audit_p202403")
+
+
+class TestGetAuditPartitions(unittest.TestCase):
+    def test_parses_upper_bounds(self):
+        connection = MagicMock()
+        connection.execute.return_value.all.return_value = [
+            (
+                "guards_audit_legacy",
+                "FOR VALUES FROM (MINVALUE) TO ('2024-02-01 00:00:00')",
+            ),
+            ("guards_audit_default", "DEFAULT"),
+        ]
+
+        self.assertEqual(
+            get_audit_partitions(connection),
+            [
+                ("guards_audit_legacy", datetime(2024, 2, 1)),
+                ("guards_audit_default", None),
+            ],
+        )
+
+
+class TestCreateAuditPartitions(unittest.TestCase):
+    @patch.object(audit_retention, "get_audit_partitions")
+    def test_skips_months_covered_by_existing_partitions(self, mock_partitions):
+        mock_partitions.return_value = [
+            ("guards_audit_legacy", datetime(2024, 2, 1)),
+        ]
+        connection = MagicMock()
+
+        create_audit_partitions(connection, datetime(2024, 1, 15), months=3)
+
+        statements = [str(c.args[0]) for c in connection.execute.call_args_list]
+        self.assertEqual(len(statements), 2)
+        self.assertIn('"guards_audit_p202402"', statements[0])
+        self.assertIn(
+            "FROM ('2024-02-01T00:00:00') TO ('2024-03-01T00:00:00')", statements[0]
+        )
+        self.assertIn('"guards_audit_p202403"', statements[1])
+
+    @patch.object(audit_retention, "get_audit_partitions")
+    def test_creates_partitions_ahead_of_an_empty_default_partition(
+        self, mock_partitions
+    ):
+        mock_partitions.return_value = [
+            ("guards_audit_p202401", datetime(2024, 2, 1)),
+            ("guards_audit_default", None),
+        ]
+        connection = MagicMock()
+        connection.execute.return_value.scalar.return_value = None
+
+        create_audit_partitions(connection, datetime(2024, 1, 15), months=2)
+
+        calls = connection.execute.call_args_list
+        statements = [str(c.args[0]) for c in calls]
+        self.assertEqual(len(statements), 2)
+        self.assertIn("SELECT 1 FROM guards_audit_default", statements[0])
+        self.assertEqual(
+            calls[0].args[1],
+            {"start": datetime(2024, 2, 1), "end": datetime(2024, 3, 1)},
+        )
+        self.assertIn(
+            'CREATE TABLE IF NOT EXISTS "guards_audit_p202402"', statements[1]
+        )
+        # Rows are never moved out of the default partition under a lock
+        self.assertFalse(any("DETACH" in statement for statement in statements))
+
+    @patch.object(audit_retention, "get_audit_partitions")
+    def test_skips_months_the_default_partition_holds_rows_for(self, mock_partitions):
+        mock_partitions.return_value = [
+            ("guards_audit_p202401", datetime(2024, 2, 1)),
+            ("guards_audit_default", None),
+        ]
+        connection = MagicMock()
+        connection.execute.return_value.scalar.side_effect = [1, None]
+
+        with self.assertLogs("guardrails-api", level="WARNING") as logs:
+            create_audit_partitions(connection, datetime(2024, 1, 15), months=3)
+
+        statements = [str(c.args[0]) for c in connection.execute.call_args_list]
+        self.assertEqual(len(statements), 3)
+        self.assertIn("guards_audit_p202402", logs.output[0])
+        self.assertIn('"guards_audit_p202403"', statements[2])
+        self.assertFalse(any("guards_audit_p202402" in s for s in statements))
+
+    @patch.object(audit_retention, "get_audit_partitions")
+    def test_leaves_default_partition_alone_when_nothing_to_create(
+        self, mock_partitions
+    ):
+        mock_partitions.return_value = [
+            ("guards_audit_p202401", datetime(2024, 2, 1)),
+            ("guards_audit_p202402", datetime(2024, 3, 1)),
+            ("guards_audit_default", None),
+        ]
+        connection = MagicMock()
+
+        create_audit_partitions(connection, datetime(2024, 1, 15), months=2)
+
+        connection.execute.assert_not_called()
+
+
+class TestDropExpiredPartitions(unittest.TestCase):
+    @patch.object(audit_retention, "get_audit_partitions")
+    def test_archives_and_drops_partitions_older_than_cutoff(self, mock_partitions):
+        mock_partitions.return_value = [
+            ("guards_audit_legacy", datetime(2024, 2, 1)),
+            ("guards_audit_p202402", datetime(2024, 3, 1)),
+            ("guards_audit_default", None),
+        ]
+        connection = MagicMock()
+        rows = connection.execution_options.return_value.execute.return_value
+        rows.partitions.return_value = [[audit_row("a"), audit_row("b")]]
+        archive = io.BytesIO()
+
+        dropped = drop_expired_partitions(
+            mock_engine(connection), datetime(2024, 2, 15), archive
+        )
+
+        self.assertEqual(dropped, 2)
+        statements = [str(c.args[0]) for c in connection.execute.call_args_list]
+        self.assertEqual(statements, ['DROP TABLE "guards_audit_legacy"'])
+        self.assertEqual(len(archive.getvalue().splitlines()), 2)
+
+
+class TestDeleteExpiredVersions(unittest.TestCase):
+    def test_deletes_in_batches_until_a_short_batch(self):
+        connection = MagicMock()
+        connection.execute.return_value.all.side_effect = [
+            [audit_row("a"), audit_row("b")],
+            [audit_row("c")],
+        ]
+        engine = mock_engine(connection)
+        archive = io.BytesIO()
+
+        deleted = delete_expired_versions(
+            engine, datetime(2024, 1, 1), batch_size=2, archive=archive
+        )
+
+        self.assertEqual(deleted, 3)
+        # One transaction per batch
+        self.assertEqual(engine.begin.call_count, 2)
+        self.assertIn(b'"id":"c"', archive.getvalue())
+        statement = str(
+            connection.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        self.assertIn("DELETE FROM guards_audit", statement)
+        self.assertIn("FOR UPDATE SKIP LOCKED", statement)
+
+
+class TestCompactAudit(unittest.TestCase):
+    @patch.object(audit_retention, "create_audit_partitions")
+    @patch.object(audit_retention, "delete_expired_versions", return_value=3)
+    @patch.object(audit_retention, "drop_expired_partitions")
+    @patch.object(audit_retention, "audit_is_partitioned", return_value=False)
+    @patch.object(
+        audit_retention, "get_db_timestamp", return_value=datetime(2024, 3, 31)
+    )
+    def test_deletes_rows_of_unpartitioned_table(
+        self, _, __, mock_drop, mock_delete, mock_create
+    ):
+        engine = mock_engine(MagicMock())
+
+        removed = compact_audit(engine, 30, batch_size=10)
+
+        self.assertEqual(removed, 3)
+        mock_drop.assert_not_called()
+        mock_delete.assert_called_once_with(engine, datetime(2024, 3, 1), 10, None)
+        mock_create.assert_not_called()
+
+    @patch.object(audit_retention, "create_audit_partitions")
+    @patch.object(audit_retention, "delete_expired_versions", return_value=3)
+    @patch.object(audit_retention, "drop_expired_partitions", return_value=5)
+    @patch.object(audit_retention, "audit_is_partitioned", return_value=True)
+    @patch.object(
+        audit_retention, "get_db_timestamp", return_value=datetime(2024, 3, 31)
+    )
+    def test_drops_partitions_and_creates_upcoming_ones(
+        self, _, __, mock_drop, mock_delete, mock_create
+    ):
+        connection = MagicMock()
+        engine = mock_engine(connection)
+
+        removed = compact_audit(engine, 30)
+
+        self.assertEqual(removed, 8)
+        mock_drop.assert_called_once_with(engine, datetime(2024, 3, 1), None)
+        mock_create.assert_called_once_with(connection, datetime(2024, 3, 31))
+
+
+if __name__ == "__main__":
+    unittest.main()
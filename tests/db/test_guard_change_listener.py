@@ -0,0 +1,116 @@
+"""Unit tests for guardrails_api.db.guard_change_listener module."""
+
+import unittest
+from unittest.mock import patch, Mock, MagicMock
+from guardrails_api.db.guard_change_listener import (
+    GuardChangeListener,
+    guard_change_notify_is_enabled,
+)
+
+
+class TestGuardChangeNotifyIsEnabled(unittest.TestCase):
+    """Test cases for the guard_change_notify_is_enabled function."""
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_enabled_by_default(self):
+        self.assertTrue(guard_change_notify_is_enabled())
+
+    @patch.dict("os.environ", {"GUARD_CHANGE_NOTIFY_ENABLED": "FALSE"})
+    def test_disabled_case_insensitive(self):
+        self.assertFalse(guard_change_notify_is_enabled())
+
+
+class TestGuardChangeListener(unittest.TestCase):
+    """Test cases for the GuardChangeListener class."""
+
+    def _make_engine(self, dbapi_connection):
+        connection = Mock()
+        connection.driver_connection = dbapi_connection
+        engine = Mock()
+        engine.raw_connection.return_value = connection
+        return engine, connection
+
+    @patch("guardrails_api.db.guard_change_listener.select.select")
+    def test_listen_dispatches_notifications(self, mock_select):
+        """Test that each notification payload is passed to on_change."""
+        dbapi_connection = MagicMock()
+        dbapi_connection.notifies = []
+        engine, connection = self._make_engine(dbapi_connection)
+        on_change = Mock()
+        on_listen = Mock()
+        listener = GuardChangeListener(engine, on_change=on_change, on_listen=on_listen)
+
+        def poll():
+            dbapi_connection.notifies.extend(
+                [Mock(payload="guard-1"), Mock(payload="guard-2")]
+            )
+            listener.stop_event.set()
+
+        dbapi_connection.poll.side_effect = poll
+        mock_select.return_value = ([dbapi_connection], [], [])
+
+        listener.listen()
+
+        cursor = dbapi_connection.cursor.return_value.__enter__.return_value
+        cursor.execute.assert_called_once_with("LISTEN guards_changed;")
+        on_listen.assert_called_once()
+        self.assertEqual(
+            [c.args[0] for c in on_change.call_args_list], ["guard-1", "guard-2"]
+        )
+        connection.detach.assert_called_once()
+        connection.close.assert_called_once()
+
+    @patch("guardrails_api.db.guard_change_listener.select.select")
+    def test_listen_skips_poll_on_timeout(self, mock_select):
+        """Test that the connection is not polled when select times out."""
+        dbapi_connection = MagicMock()
+        dbapi_connection.notifies = []
+        engine, _ = self._make_engine(dbapi_connection)
+        listener = GuardChangeListener(engine, on_change=Mock())
+
+        def timeout(*args):
+            listener.stop_event.set()
+            return ([], [], [])
+
+        mock_select.side_effect = timeout
+
+        listener.listen()
+
+        dbapi_connection.poll.assert_not_called()
+
+    @patch("guardrails_api.db.guard_change_listener.logger")
+    def test_run_calls_on_disconnect_after_error(self, mock_logger):
+        """Test that a lost connection is logged and reported via on_disconnect."""
+        engine = Mock()
+        on_disconnect = Mock()
+        listener = GuardChangeListener(
+            engine, on_change=Mock(), on_disconnect=on_disconnect
+        )
+
+        def fail():
+            listener.stop_event.set()
+            raise RuntimeError("connection lost")
+
+        engine.raw_connection.side_effect = fail
+
+        listener.run()
+
+        mock_logger.error.assert_called_once()
+        on_disconnect.assert_called_once()
+
+    def test_start_and_stop_manage_thread(self):
+        """Test that start runs the listener in a thread and stop joins it."""
+        listener = GuardChangeListener(Mock(), on_change=Mock())
+        listener.run = Mock()
+
+        listener.start()
+        thread = listener.thread
+        listener.stop(timeout=1)
+
+        self.assertIsNotNone(thread)
+        self.assertTrue(listener.stop_event.is_set())
+        self.assertIsNone(listener.thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
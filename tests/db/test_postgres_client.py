@@ -2,7 +2,12 @@
 
 import unittest
 from unittest.mock import patch, Mock
-from guardrails_api.db.postgres_client import postgres_is_enabled, PostgresClient
+from guardrails_api.db.postgres_client import (
+    postgres_async_is_enabled,
+    postgres_is_enabled,
+    postgres_replica_is_enabled,
+    PostgresClient,
+)
 
 
 class TestPostgresIsEnabled(unittest.TestCase):
@@ -27,6 +32,43 @@ class TestPostgresIsEnabled(unittest.TestCase):
         self.assertTrue(result)
 
 
+class TestPostgresAsyncIsEnabled(unittest.TestCase):
+    """Test cases for the postgres_async_is_enabled function."""
+
+    @patch.dict("os.environ", {"PGHOST": "localhost"}, clear=True)
+    def test_disabled_without_async_driver(self):
+        """Test that async postgres is disabled when PG_ASYNC_DRIVER is not set."""
+        self.assertFalse(postgres_async_is_enabled())
+
+    @patch.dict("os.environ", {"PG_ASYNC_DRIVER": "asyncpg"}, clear=True)
+    def test_disabled_without_postgres(self):
+        """Test that async postgres requires postgres to be enabled."""
+        self.assertFalse(postgres_async_is_enabled())
+
+    @patch.dict(
+        "os.environ", {"PGHOST": "localhost", "PG_ASYNC_DRIVER": "asyncpg"}, clear=True
+    )
+    def test_enabled_with_async_driver(self):
+        """Test that async postgres is enabled when PG_ASYNC_DRIVER is set."""
+        self.assertTrue(postgres_async_is_enabled())
+
+
+class TestPostgresReplicaIsEnabled(unittest.TestCase):
+    """Test cases for the postgres_replica_is_enabled function."""
+
+    @patch.dict("os.environ", {"PGHOST": "localhost"}, clear=True)
+    def test_disabled_without_replica_url(self):
+        self.assertFalse(postgres_replica_is_enabled())
+
+    @patch.dict(
+        "os.environ",
+        {"PGHOST": "localhost", "DB_REPLICA_URL": "postgresql://replica/db"},
+        clear=True,
+    )
+    def test_enabled_with_replica_url(self):
+        self.assertTrue(postgres_replica_is_enabled())
+
+
 class TestPostgresClient(unittest.TestCase):
     """Test cases for the PostgresClient class."""
 
@@ -90,6 +132,35 @@ class TestPostgresClient(unittest.TestCase):
 
         self.assertEqual(result, mock_session)
 
+    @patch.dict(
+        "os.environ",
+        {
+            "DB_URL": "postgresql://primary/db",
+            "DB_REPLICA_URL": "postgresql://replica/db",
+            "PG_ASYNC_DRIVER": "asyncpg",
+        },
+        clear=True,
+    )
+    @patch("guardrails_api.db.postgres_client.create_async_engine")
+    @patch("guardrails_api.db.postgres_client.create_engine")
+    def test_create_engines_with_replica(
+        self, mock_create_engine, mock_create_async_engine
+    ):
+        """Test that the replica gets its own sync and async engines."""
+        mock_create_engine.side_effect = [Mock(), Mock()]
+        client = PostgresClient()
+        client.create_engines()
+
+        urls = [c.args[0] for c in mock_create_engine.call_args_list]
+        self.assertEqual(urls, ["postgresql://primary/db", "postgresql://replica/db"])
+        async_urls = [c.args[0] for c in mock_create_async_engine.call_args_list]
+        self.assertEqual(
+            async_urls,
+            ["postgresql+asyncpg://primary/db", "postgresql+asyncpg://replica/db"],
+        )
+        self.assertIs(client.ReplicaSessionLocal.kw["bind"], client.replica_engine)
+        self.assertIsNot(client.replica_engine, client.engine)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,10 @@
 """Unit tests for guardrails_api.app module."""
 
+import asyncio
 import json
 import os
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import FastAPI
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -11,6 +12,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from guardrails_api.app import (
     CustomJSONEncoder,
     create_app,
+    lifespan,
     register_config,
     register_middleware,
 )
@@ -449,5 +451,60 @@ class TestCreateApp(unittest.TestCase):
         self.assertIn(ValueError, result.exception_handlers)
 
 
+class TestLifespan(unittest.TestCase):
+    """Tests for lifespan()"""
+
+    async def _run_lifespan(self):
+        async with lifespan(FastAPI()):
+            pass
+
+    @patch("guardrails_api.app.start_guard_change_listener")
+    @patch("guardrails_api.app.postgres_is_enabled", return_value=True)
+    def test_starts_and_stops_listener_with_postgres(self, _, mock_start):
+        mock_listener = MagicMock()
+        mock_start.return_value = mock_listener
+
+        asyncio.run(self._run_lifespan())
+
+        mock_start.assert_called_once()
+        mock_listener.stop.assert_called_once()
+
+    @patch("guardrails_api.app.start_guard_change_listener")
+    @patch("guardrails_api.app.postgres_is_enabled", return_value=False)
+    def test_no_listener_without_postgres(self, _, mock_start):
+        asyncio.run(self._run_lifespan())
+
+        mock_start.assert_not_called()
+
+    @patch("guardrails_api.api.guards.guard_process_pool")
+    @patch("guardrails_api.api.guards.guard_executor")
+    @patch("guardrails_api.app.postgres_is_enabled", return_value=False)
+    def test_shuts_down_guard_executors(
+        self, _, mock_guard_executor, mock_guard_process_pool
+    ):
+        asyncio.run(self._run_lifespan())
+
+        mock_guard_executor.shutdown.assert_called_once_with(wait=False)
+        mock_guard_process_pool.shutdown.assert_called_once_with(wait=False)
+
+    @patch("guardrails_api.api.guards.guard_history_store")
+    @patch("guardrails_api.app.postgres_is_enabled", return_value=False)
+    def test_flushes_guard_history(self, _, mock_guard_history_store):
+        mock_guard_history_store.flush = AsyncMock()
+
+        asyncio.run(self._run_lifespan())
+
+        mock_guard_history_store.flush.assert_awaited_once()
+
+    @patch("guardrails_api.api.guards.guard_call_store")
+    @patch("guardrails_api.app.postgres_is_enabled", return_value=False)
+    def test_flushes_guard_calls(self, _, mock_guard_call_store):
+        mock_guard_call_store.flush = AsyncMock()
+
+        asyncio.run(self._run_lifespan())
+
+        mock_guard_call_store.flush.assert_awaited_once()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,68 @@
+"""Unit tests for guardrails_api.utils.batch_writer module."""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+from guardrails_api.utils.batch_writer import BatchWriter
+from guardrails_api.utils.metrics import Metrics
+
+
+class TestBatchWriter(unittest.TestCase):
+    """Test cases for the BatchWriter class."""
+
+    def _add_and_flush(self, writer: BatchWriter, *items):
+        async def run():
+            for item in items:
+                writer.add(item)
+            await writer.flush()
+
+        asyncio.run(run())
+
+    def test_writes_in_batches(self):
+        """Test that queued items are written batch_size at a time."""
+        write = AsyncMock()
+        writer = BatchWriter(write, 10, 2, "test_batch_writer")
+
+        self._add_and_flush(writer, 1, 2, 3)
+
+        self.assertEqual([c.args[0] for c in write.call_args_list], [[1, 2], [3]])
+
+    def test_drops_items_when_queue_is_full(self):
+        """Test that items are dropped and counted while the queue is full."""
+        write = AsyncMock()
+        writer = BatchWriter(write, 1, 10, "test_batch_writer")
+        metrics = Metrics()
+        dropped = metrics.get("test_batch_writer_dropped_total")
+
+        self._add_and_flush(writer, 1, 2)
+
+        self.assertEqual(metrics.get("test_batch_writer_dropped_total"), dropped + 1)
+        write.assert_awaited_once_with([1])
+
+    def test_queue_size_zero_is_unbounded(self):
+        """Test that a queue_size of 0 never drops items."""
+        write = AsyncMock()
+        writer = BatchWriter(write, 0, 10, "test_batch_writer")
+
+        self._add_and_flush(writer, 1, 2, 3)
+
+        write.assert_awaited_once_with([1, 2, 3])
+
+    def test_write_errors_are_counted(self):
+        """Test that a failing write doesn't stop the writer."""
+        write = AsyncMock(side_effect=[Exception("down"), None])
+        writer = BatchWriter(write, 10, 1, "test_batch_writer")
+        metrics = Metrics()
+        errors = metrics.get("test_batch_writer_write_errors_total")
+
+        self._add_and_flush(writer, 1, 2)
+
+        self.assertEqual(
+            metrics.get("test_batch_writer_write_errors_total"), errors + 1
+        )
+        self.assertEqual(write.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
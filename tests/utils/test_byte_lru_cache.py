@@ -0,0 +1,92 @@
+"""Unit tests for guardrails_api.utils.byte_lru_cache module."""
+
+import unittest
+from unittest.mock import patch
+from guardrails_api.utils.byte_lru_cache import ByteLRUCache
+
+
+class TestByteLRUCache(unittest.TestCase):
+    """Test cases for the ByteLRUCache class."""
+
+    def test_get_and_set(self):
+        """Test that stored values are returned and counted as hits."""
+        cache = ByteLRUCache(max_bytes=100)
+        cache.set("a", b"value")
+
+        self.assertEqual(cache.get("a"), b"value")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_tracks_bytes_of_keys_and_values(self):
+        """Test that total_bytes follows inserts, replacements and deletes."""
+        cache = ByteLRUCache(max_bytes=100)
+        cache.set("a", b"1234")
+        cache.set("a", b"12")
+        cache.set("bb", b"123")
+
+        self.assertEqual(cache.total_bytes, 3 + 5)
+
+        cache.delete("a")
+
+        self.assertEqual(cache.total_bytes, 5)
+
+    def test_evicts_least_recently_used(self):
+        """Test that entries are evicted in LRU order once max_bytes is exceeded."""
+        cache = ByteLRUCache(max_bytes=12)
+        cache.set("a", b"12345")
+        cache.set("b", b"12345")
+        cache.get("a")
+        cache.set("c", b"12345")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"12345")
+        self.assertEqual(cache.get("c"), b"12345")
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.total_bytes, 12)
+
+    def test_rejects_values_larger_than_max_bytes(self):
+        """Test that an oversized value is not stored and evicts nothing."""
+        cache = ByteLRUCache(max_bytes=10)
+        cache.set("a", b"1")
+
+        self.assertFalse(cache.set("b", b"x" * 20))
+        self.assertEqual(cache.get("a"), b"1")
+        self.assertEqual(len(cache), 1)
+
+    @patch("guardrails_api.utils.byte_lru_cache.time.monotonic")
+    def test_expires_entries_after_ttl(self, mock_monotonic):
+        """Test that entries are dropped once their TTL has passed."""
+        mock_monotonic.return_value = 100.0
+        cache = ByteLRUCache(max_bytes=100)
+        cache.set("a", b"value", ttl=10)
+
+        mock_monotonic.return_value = 109.0
+        self.assertEqual(cache.get("a"), b"value")
+
+        mock_monotonic.return_value = 110.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.total_bytes, 0)
+
+    def test_clear_and_stats(self):
+        """Test that clear empties the cache and stats reports counters."""
+        cache = ByteLRUCache(max_bytes=100)
+        cache.set("a", b"value")
+        cache.get("a")
+        cache.clear()
+
+        self.assertEqual(
+            cache.stats(),
+            {
+                "entries": 0,
+                "bytes": 0,
+                "max_bytes": 100,
+                "hits": 1,
+                "misses": 0,
+                "evictions": 0,
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
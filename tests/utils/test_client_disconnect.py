@@ -0,0 +1,156 @@
+"""Unit tests for guardrails_api.utils.client_disconnect module."""
+
+import asyncio
+import unittest
+from unittest.mock import Mock
+from guardrails_api.classes.http_error import HttpError
+from guardrails_api.utils.client_disconnect import (
+    cancel_on_disconnect,
+    cancel_stream_on_disconnect,
+)
+from guardrails_api.utils.metrics import Metrics
+
+
+def _mock_request(disconnected: asyncio.Event):
+    """Create a request whose receive() reports a disconnect once the event is set."""
+    request = Mock()
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    request.receive = receive
+    return request
+
+
+class TestCancelOnDisconnect(unittest.TestCase):
+    """Test cases for the cancel_on_disconnect function."""
+
+    def test_returns_result_when_work_finishes_first(self):
+        """Test that the work's result is returned while the client is connected."""
+
+        async def work():
+            return "done"
+
+        async def run():
+            return await cancel_on_disconnect(
+                _mock_request(asyncio.Event()), work(), "test"
+            )
+
+        self.assertEqual(asyncio.run(run()), "done")
+
+    def test_propagates_work_errors(self):
+        """Test that errors raised by the work reach the caller."""
+
+        async def work():
+            raise ValueError("boom")
+
+        async def run():
+            return await cancel_on_disconnect(
+                _mock_request(asyncio.Event()), work(), "test"
+            )
+
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
+
+    def test_cancels_work_when_client_disconnects(self):
+        """Test that a disconnect cancels the work and is recorded in metrics."""
+        metrics = Metrics()
+        disconnects = metrics.get("test_client_disconnects_total")
+        cancelled = []
+
+        async def work():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def run():
+            disconnected = asyncio.Event()
+            asyncio.get_running_loop().call_later(0.01, disconnected.set)
+            try:
+                await cancel_on_disconnect(_mock_request(disconnected), work(), "test")
+            finally:
+                # Let the cancelled work unwind
+                await asyncio.sleep(0)
+
+        with self.assertRaises(HttpError) as ctx:
+            asyncio.run(run())
+
+        self.assertEqual(ctx.exception.status, 499)
+        self.assertEqual(cancelled, [True])
+        self.assertEqual(metrics.get("test_client_disconnects_total"), disconnects + 1)
+
+
+class TestCancelStreamOnDisconnect(unittest.TestCase):
+    """Test cases for the cancel_stream_on_disconnect function."""
+
+    def test_forwards_every_item(self):
+        """Test that all items are forwarded in order while connected."""
+
+        async def stream():
+            for item in ["a", "b", "c"]:
+                yield item
+
+        async def collect():
+            return [
+                item
+                async for item in cancel_stream_on_disconnect(
+                    _mock_request(asyncio.Event()), stream(), "test"
+                )
+            ]
+
+        self.assertEqual(asyncio.run(collect()), ["a", "b", "c"])
+
+    def test_propagates_stream_errors(self):
+        """Test that errors raised by the stream reach the consumer."""
+
+        async def stream():
+            yield "a"
+            raise ValueError("boom")
+
+        async def collect():
+            return [
+                item
+                async for item in cancel_stream_on_disconnect(
+                    _mock_request(asyncio.Event()), stream(), "test"
+                )
+            ]
+
+        with self.assertRaises(ValueError):
+            asyncio.run(collect())
+
+    def test_stops_stream_when_client_disconnects(self):
+        """Test that a disconnect ends the response and closes the upstream stream."""
+        metrics = Metrics()
+        disconnects = metrics.get("client_disconnects_total")
+        closed = []
+
+        async def stream():
+            try:
+                yield "first"
+                await asyncio.sleep(10)
+                yield "never"
+            finally:
+                closed.append(True)
+
+        async def collect():
+            disconnected = asyncio.Event()
+            items = []
+            async for item in cancel_stream_on_disconnect(
+                _mock_request(disconnected), stream(), "test"
+            ):
+                items.append(item)
+                disconnected.set()
+            # Let the cancelled producer unwind
+            await asyncio.sleep(0)
+            return items
+
+        self.assertEqual(asyncio.run(collect()), ["first"])
+        self.assertEqual(closed, [True])
+        self.assertEqual(metrics.get("client_disconnects_total"), disconnects + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+"""Unit tests for guardrails_api.utils.cursor module."""
+
+import unittest
+
+from guardrails_api.classes.http_error import HttpError
+from guardrails_api.utils.cursor import decode_cursor, encode_cursor
+
+
+class TestCursor(unittest.TestCase):
+    def test_round_trip(self):
+        """Test a cursor decodes to the values it was encoded from."""
+        cursor = encode_cursor("my guard", "id/1")
+
+        self.assertEqual(decode_cursor(cursor, 2), ("my guard", "id/1"))
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor("?&=+/", "id")
+
+        self.assertRegex(cursor, r"^[A-Za-z0-9_=-]+$")
+
+    def test_invalid_cursor_raises_400(self):
+        for cursor in ["not-a-cursor", encode_cursor("a"), encode_cursor("a", "b")]:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(HttpError) as context:
+                    decode_cursor(cursor, 3)
+                self.assertEqual(context.exception.status, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
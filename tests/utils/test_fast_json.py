@@ -0,0 +1,73 @@
+"""Unit tests for guardrails_api.utils.fast_json module."""
+
+import json
+import unittest
+from datetime import datetime
+from fastapi.encoders import jsonable_encoder
+from guardrails.classes import ValidationOutcome
+from guardrails.classes.validation.validation_summary import ValidationSummary
+from guardrails_api.utils.fast_json import FastJSONResponse, dumps, loads
+
+
+def _outcome() -> ValidationOutcome:
+    return ValidationOutcome(
+        callId="1",
+        validationPassed=False,
+        validatedOutput={"a": [1, 2]},
+        rawLlmOutput="x",
+        validation_summaries=[
+            ValidationSummary(
+                validator_name="v",
+                validator_status="fail",
+                property_path="$",
+                failure_reason="bad",
+            )
+        ],
+    )
+
+
+class TestDumps(unittest.TestCase):
+    """Test cases for the dumps function."""
+
+    def test_models_match_jsonable_encoder(self):
+        """Test that models encode like FastAPI's default encoding."""
+        outcome = _outcome()
+
+        self.assertEqual(loads(dumps(outcome)), jsonable_encoder(outcome))
+
+    def test_models_honor_by_alias_and_exclude_none(self):
+        """Test that by_alias and exclude_none are passed to the model."""
+        encoded = loads(dumps(_outcome(), by_alias=False, exclude_none=True))
+
+        self.assertIn("call_id", encoded)
+        self.assertNotIn("reask", encoded)
+
+    def test_nested_models_and_sets(self):
+        """Test that values orjson can't encode natively are converted."""
+        content = {"outcome": _outcome(), "ids": {"a"}, 1: datetime(2026, 10, 18)}
+
+        encoded = loads(dumps(content))
+
+        self.assertEqual(encoded["outcome"]["callId"], "1")
+        self.assertEqual(encoded["ids"], ["a"])
+        self.assertEqual(encoded["1"], "2026-10-18T00:00:00")
+
+    def test_unsupported_values_raise(self):
+        """Test that unsupported values raise a TypeError like json.dumps."""
+        with self.assertRaises(TypeError):
+            dumps({"value": object()})
+
+
+class TestFastJSONResponse(unittest.TestCase):
+    """Test cases for the FastJSONResponse class."""
+
+    def test_renders_with_dumps(self):
+        """Test that the response body is the encoded content."""
+        response = FastJSONResponse([{"callId": "1"}])
+
+        self.assertEqual(json.loads(response.body), [{"callId": "1"}])
+        self.assertEqual(response.media_type, "application/json")
+
+
+if __name__ == "__main__":
+    unittest.main()
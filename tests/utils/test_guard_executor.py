@@ -0,0 +1,181 @@
+"""Unit tests for guardrails_api.utils.guard_executor module."""
+
+import asyncio
+import contextvars
+import os
+import threading
+import unittest
+from unittest.mock import patch
+from guardrails_api.classes.http_error import HttpError
+from guardrails_api.utils.guard_executor import (
+    DEFAULT_GUARD_EXECUTOR_MAX_WORKERS,
+    GuardExecutor,
+    get_guard_execution_mode,
+)
+from guardrails_api.utils.metrics import Metrics
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class TestGetGuardExecutionMode(unittest.TestCase):
+    """Test cases for the get_guard_execution_mode function."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_defaults_to_inline(self):
+        self.assertEqual(get_guard_execution_mode(), "inline")
+
+    @patch.dict(os.environ, {"GUARD_EXECUTION_MODE": "THREAD"})
+    def test_case_insensitive(self):
+        self.assertEqual(get_guard_execution_mode(), "thread")
+
+    @patch.dict(os.environ, {"GUARD_EXECUTION_MODE": "fork"})
+    def test_invalid_mode_raises(self):
+        with self.assertRaises(ValueError):
+            get_guard_execution_mode()
+
+
+class TestGuardExecutor(unittest.TestCase):
+    """Test cases for the GuardExecutor class."""
+
+    def make_executor(self, env: dict) -> GuardExecutor:
+        executor = GuardExecutor()
+        with patch.dict(os.environ, env):
+            executor.initialize()
+        self.addCleanup(executor.initialize)
+        self.addCleanup(executor.shutdown)
+        return executor
+
+    def test_initialize_defaults(self):
+        """Test default pool size and queue bound."""
+        with patch.dict(os.environ, {}, clear=True):
+            executor = self.make_executor({})
+
+        self.assertFalse(executor.enabled)
+        self.assertEqual(executor.max_workers, DEFAULT_GUARD_EXECUTOR_MAX_WORKERS)
+        self.assertEqual(executor.max_queue_size, 0)
+
+    def test_inline_mode_runs_on_calling_thread(self):
+        """Test that inline mode calls the function on the event loop thread."""
+        executor = self.make_executor({"GUARD_EXECUTION_MODE": "inline"})
+
+        result = asyncio.run(executor.run(threading.get_ident))
+
+        self.assertEqual(result, threading.get_ident())
+        self.assertIsNone(executor.executor)
+
+    def test_thread_mode_runs_in_pool(self):
+        """Test that thread mode runs sync functions in the pool."""
+        executor = self.make_executor({"GUARD_EXECUTION_MODE": "thread"})
+
+        result = asyncio.run(executor.run(threading.current_thread))
+
+        self.assertTrue(result.name.startswith("guard-executor"))
+
+    def test_thread_mode_passes_arguments(self):
+        """Test that positional and keyword arguments reach the function."""
+        executor = self.make_executor({"GUARD_EXECUTION_MODE": "thread"})
+
+        def add(a, b=0):
+            return a + b
+
+        self.assertEqual(asyncio.run(executor.run(add, 1, b=2)), 3)
+
+    def test_thread_mode_propagates_context(self):
+        """Test that the caller's contextvars are visible in the pool."""
+        executor = self.make_executor({"GUARD_EXECUTION_MODE": "thread"})
+
+        async def call():
+            request_id.set("abc")
+            return await executor.run(request_id.get)
+
+        self.assertEqual(asyncio.run(call()), "abc")
+
+    def test_thread_mode_keeps_coroutine_functions_on_loop(self):
+        """Test that async functions are awaited on the loop, not the pool."""
+        executor = self.make_executor({"GUARD_EXECUTION_MODE": "thread"})
+
+        async def get_thread():
+            return threading.get_ident()
+
+        result = asyncio.run(executor.run(get_thread))
+
+        self.assertEqual(result, threading.get_ident())
+
+    def test_thread_mode_propagates_exceptions(self):
+        """Test that exceptions raised in the pool reach the caller."""
+        executor = self.make_executor({"GUARD_EXECUTION_MODE": "thread"})
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(executor.run(fail))
+
+    def test_iterate_thread_mode(self):
+        """Test that each step of a sync iterator runs in the pool."""
+        executor = self.make_executor({"GUARD_EXECUTION_MODE": "thread"})
+
+        def chunks():
+            for i in range(3):
+                yield i, threading.current_thread().name
+
+        async def collect():
+            return [item async for item in executor.iterate(chunks())]
+
+        items = asyncio.run(collect())
+
+        self.assertEqual([i for i, _ in items], [0, 1, 2])
+        self.assertTrue(all(n.startswith("guard-executor") for _, n in items))
+
+    def test_iterate_inline_mode(self):
+        """Test that inline mode iterates on the event loop thread."""
+        executor = self.make_executor({"GUARD_EXECUTION_MODE": "inline"})
+
+        async def collect():
+            return [item async for item in executor.iterate(iter([1, 2]))]
+
+        self.assertEqual(asyncio.run(collect()), [1, 2])
+
+    def test_rejects_when_queue_is_full(self):
+        """Test that a full queue raises a 503 and counts the rejection."""
+        executor = self.make_executor(
+            {
+                "GUARD_EXECUTION_MODE": "thread",
+                "GUARD_EXECUTOR_MAX_WORKERS": "1",
+                "GUARD_EXECUTOR_MAX_QUEUE_SIZE": "1",
+            }
+        )
+        rejected_before = Metrics().get("guard_executor_rejected_total")
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        async def saturate():
+            running = asyncio.ensure_future(executor.run(block))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            queued = asyncio.ensure_future(executor.run(lambda: None))
+            await asyncio.sleep(0)
+            try:
+                with self.assertRaises(HttpError) as ctx:
+                    await executor.run(lambda: None)
+                self.assertEqual(ctx.exception.status, 503)
+                self.assertEqual(Metrics().get("guard_executor_queue_depth"), 1)
+                self.assertEqual(Metrics().get("guard_executor_active"), 1)
+            finally:
+                release.set()
+                await asyncio.gather(running, queued)
+
+        asyncio.run(saturate())
+
+        self.assertEqual(
+            Metrics().get("guard_executor_rejected_total"), rejected_before + 1
+        )
+        self.assertEqual(Metrics().get("guard_executor_queue_depth"), 0)
+        self.assertEqual(Metrics().get("guard_executor_active"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Unit tests for guardrails_api.utils.guard_history module."""
+
+import os
+import unittest
+from unittest.mock import patch
+from guardrails import Guard
+from guardrails.classes.generic.stack import Stack
+from guardrails_api.utils.guard_history import (
+    bound_guard_history,
+    copy_guard,
+    get_guard_history_max_length,
+)
+
+
+class TestGetGuardHistoryMaxLength(unittest.TestCase):
+    """Test cases for the get_guard_history_max_length function."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_defaults_to_ten(self):
+        self.assertEqual(get_guard_history_max_length(), 10)
+
+    @patch.dict(os.environ, {"GUARD_HISTORY_MAX_LENGTH": "3"})
+    def test_reads_env_var(self):
+        self.assertEqual(get_guard_history_max_length(), 3)
+
+    @patch.dict(os.environ, {"GUARD_HISTORY_MAX_LENGTH": "0"})
+    def test_rejects_values_below_one(self):
+        with self.assertRaises(ValueError):
+            get_guard_history_max_length()
+
+
+class TestBoundGuardHistory(unittest.TestCase):
+    """Test cases for the bound_guard_history function."""
+
+    def test_keeps_latest_calls(self):
+        """Test that an oversized history is trimmed to the latest calls."""
+        guard = Guard(name="test", history_max_length=100)
+        guard.history = Stack("call-1", "call-2", "call-3", max_length=100)
+
+        bound_guard_history(guard, 2)
+
+        self.assertEqual(list(guard.history), ["call-2", "call-3"])
+
+    def test_history_stays_bounded(self):
+        """Test that the history behaves as a ring buffer after bounding."""
+        guard = bound_guard_history(Guard(name="test", history_max_length=100), 2)
+
+        for call in ["call-1", "call-2", "call-3", "call-4"]:
+            guard.history.push(call)
+
+        self.assertEqual(list(guard.history), ["call-3", "call-4"])
+
+    @patch.dict(os.environ, {"GUARD_HISTORY_MAX_LENGTH": "1"})
+    def test_uses_configured_max_length(self):
+        """Test that GUARD_HISTORY_MAX_LENGTH is used by default."""
+        guard = bound_guard_history(Guard(name="test"))
+
+        guard.history.push("call-1")
+        guard.history.push("call-2")
+
+        self.assertEqual(list(guard.history), ["call-2"])
+
+
+class TestCopyGuard(unittest.TestCase):
+    """Test cases for the copy_guard function."""
+
+    def test_copy_has_its_own_history_and_num_reasks(self):
+        guard = bound_guard_history(Guard(name="shared"), max_length=3)
+        guard.parse("hello")
+
+        request_guard = copy_guard(guard)
+        request_guard.parse("world", num_reasks=2)
+
+        self.assertEqual(len(guard.history), 1)
+        self.assertEqual(len(request_guard.history), 1)
+        self.assertEqual(request_guard.history._max_length, 3)
+        self.assertEqual(request_guard._num_reasks, 2)
+        self.assertNotEqual(guard._num_reasks, 2)
+
+    def test_copy_shares_validators(self):
+        guard = Guard(name="shared")
+
+        request_guard = copy_guard(guard)
+
+        self.assertIs(request_guard._validators, guard._validators)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Unit tests for guardrails_api.utils.guard_ndjson module."""
+
+import asyncio
+import unittest
+
+from guardrails import Guard
+from guardrails_ai.types import Guard as IGuard
+
+from guardrails_api.utils.guard_ndjson import GuardImport, aiter_lines, dump_guard_line
+
+
+class TestDumpGuardLine(unittest.TestCase):
+    def test_dumps_guard_with_iguard_schema(self):
+        """Test guardrails Guards are written without their history."""
+        line = dump_guard_line(Guard(id="guard-1", name="guard"))
+
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(
+            IGuard.model_validate_json(line), IGuard(id="guard-1", name="guard")
+        )
+        self.assertNotIn(b"history", line)
+
+    def test_dumps_projection(self):
+        self.assertEqual(dump_guard_line({"id": "guard-1"}), b'{"id":"guard-1"}\n')
+
+
+class TestAiterLines(unittest.TestCase):
+    def test_joins_lines_split_across_chunks(self):
+        async def chunks():
+            for chunk in [b'{"a"', b':1}\n{"b":2}\n', b'{"c":3}']:
+                yield chunk
+
+        async def collect():
+            return [line async for line in aiter_lines(chunks())]
+
+        self.assertEqual(asyncio.run(collect()), [b'{"a":1}', b'{"b":2}', b'{"c":3}'])
+
+
+class TestGuardImport(unittest.TestCase):
+    def test_reports_each_line(self):
+        """Test written, conflicting and invalid lines are reported in order."""
+        guard_import = GuardImport()
+        for line in [
+            b'{"id": "a", "name": "a"}',
+            b"",
+            b'{"name": "missing id"}',
+            b'{"id": "b", "name": "b"}',
+        ]:
+            guard_import.add_line(line)
+
+        self.assertEqual([g.id for g in guard_import.guards], ["a", "b"])
+
+        guard_import.add_written([IGuard(id="a", name="a"), None])
+
+        self.assertEqual(
+            [(r["line"], r["status"]) for r in guard_import.results],
+            [(1, "written"), (3, "invalid"), (4, "conflict")],
+        )
+        self.assertEqual(guard_import.results[1]["errors"][0]["loc"], ("id",))
+        self.assertEqual(
+            guard_import.counts(), {"written": 1, "conflict": 1, "invalid": 1}
+        )
+        self.assertEqual(guard_import.dump_results().count(b"\n"), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
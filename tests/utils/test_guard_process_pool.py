@@ -0,0 +1,168 @@
+"""Unit tests for guardrails_api.utils.guard_process_pool module."""
+
+import asyncio
+import os
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, Mock, patch
+from guardrails import Guard
+from guardrails.classes.generic.stack import Stack
+from guardrails_api.classes.http_error import HttpError
+from guardrails_api.utils import guard_process_pool as guard_process_pool_module
+from guardrails_api.utils.guard_process_pool import (
+    GuardProcessPool,
+    parse_in_worker,
+)
+from guardrails_api.utils.metrics import Metrics
+
+
+class TestParseInWorker(unittest.TestCase):
+    """Test cases for the parse_in_worker function."""
+
+    def setUp(self):
+        guard_process_pool_module.worker_guards.clear()
+        self.addCleanup(guard_process_pool_module.worker_guards.clear)
+
+    def test_returns_none_for_unknown_guard(self):
+        """Test that a cold worker asks for the guard definition."""
+        result = parse_in_worker("guard-id", "v1", None, "Hello!", {})
+
+        self.assertIsNone(result)
+
+    @patch("guardrails_api.utils.guard_process_pool.Guard.from_dict")
+    def test_hydrates_and_reuses_guard(self, mock_from_dict):
+        """Test that a guard is hydrated once and reused for the same version."""
+        mock_guard = Mock()
+        outcome = Mock(call_id="call-1")
+        call = Mock(id="call-1")
+        mock_guard.parse.return_value = outcome
+        mock_guard.history = Stack(call)
+        mock_from_dict.return_value = mock_guard
+
+        first = parse_in_worker("guard-id", "v1", {"name": "g"}, "Hello!", {})
+        second = parse_in_worker(
+            "guard-id", "v1", None, "Hi!", {"metadata": {"k": "v"}}
+        )
+
+        mock_from_dict.assert_called_once_with({"name": "g"})
+        self.assertEqual(first, (outcome, call))
+        self.assertEqual(second, (outcome, call))
+        mock_guard.parse.assert_called_with(llm_output="Hi!", metadata={"k": "v"})
+
+    @patch("guardrails_api.utils.guard_process_pool.Guard.from_dict")
+    def test_stale_version_needs_definition(self, mock_from_dict):
+        """Test that a changed version is not served from the old guard."""
+        mock_guard = Mock()
+        mock_guard.history = Stack()
+        mock_from_dict.return_value = mock_guard
+        parse_in_worker("guard-id", "v1", {"name": "g"}, "Hello!", {})
+
+        result = parse_in_worker("guard-id", "v2", None, "Hello!", {})
+
+        self.assertIsNone(result)
+
+
+class TestGuardProcessPool(unittest.TestCase):
+    """Test cases for the GuardProcessPool class."""
+
+    def make_pool(self, env: dict) -> GuardProcessPool:
+        pool = GuardProcessPool()
+        with patch.dict(os.environ, env):
+            pool.initialize()
+        self.addCleanup(pool.initialize)
+        self.addCleanup(pool.shutdown)
+        return pool
+
+    def test_enabled_only_in_process_mode(self):
+        """Test that the pool is only enabled for GUARD_EXECUTION_MODE=process."""
+        self.assertFalse(self.make_pool({"GUARD_EXECUTION_MODE": "thread"}).enabled)
+        self.assertTrue(self.make_pool({"GUARD_EXECUTION_MODE": "process"}).enabled)
+
+    def test_pool_size_from_env(self):
+        """Test that GUARD_PROCESS_POOL_SIZE sets the number of workers."""
+        pool = self.make_pool({"GUARD_PROCESS_POOL_SIZE": "3"})
+
+        self.assertEqual(pool.max_workers, 3)
+
+    def test_parse_sends_id_and_version_first(self):
+        """Test that a warm worker only receives the guard id and version."""
+        pool = self.make_pool({"GUARD_EXECUTION_MODE": "process"})
+        response = (Mock(), Mock())
+        pool.util_submit = AsyncMock(return_value=response)
+        guard = Guard(name="my-guard")
+
+        result = asyncio.run(pool.parse(guard, "v1", llm_output="Hello!", num_reasks=0))
+
+        self.assertIs(result, response)
+        pool.util_submit.assert_awaited_once()
+        guard_id, version, guard_dict, llm_output, parse_kwargs = (
+            pool.util_submit.call_args.args
+        )
+        self.assertEqual(guard_id, guard.id)
+        self.assertEqual(version, "v1")
+        self.assertIsNone(guard_dict)
+        self.assertEqual(llm_output, "Hello!")
+        self.assertEqual(parse_kwargs, {"num_reasks": 0})
+
+    def test_parse_resends_definition_on_miss(self):
+        """Test that the guard definition is sent when a worker is cold."""
+        pool = self.make_pool({"GUARD_EXECUTION_MODE": "process"})
+        response = (Mock(), Mock())
+        pool.util_submit = AsyncMock(side_effect=[None, response])
+        guard = Guard(name="my-guard")
+        hydrations = Metrics().get("guard_process_pool_hydrations_total")
+
+        result = asyncio.run(pool.parse(guard, "v1", llm_output="Hello!"))
+
+        self.assertIs(result, response)
+        guard_dict = pool.util_submit.call_args.args[2]
+        self.assertEqual(guard_dict["name"], "my-guard")
+        self.assertNotIn("history", guard_dict)
+        self.assertEqual(
+            Metrics().get("guard_process_pool_hydrations_total"), hydrations + 1
+        )
+
+    def test_broken_pool_raises_503_and_resets(self):
+        """Test that a crashed worker surfaces as a 503 and the pool is rebuilt."""
+        pool = self.make_pool({"GUARD_EXECUTION_MODE": "process"})
+        mock_executor = Mock()
+        pool.pool = mock_executor
+
+        async def submit():
+            with patch("asyncio.get_running_loop") as mock_get_loop:
+                mock_get_loop.return_value.run_in_executor = AsyncMock(
+                    side_effect=BrokenProcessPool()
+                )
+                await pool.util_submit("guard-id", "v1", None, "Hello!", {})
+
+        with self.assertRaises(HttpError) as ctx:
+            asyncio.run(submit())
+
+        self.assertEqual(ctx.exception.status, 503)
+        self.assertIsNone(pool.pool)
+        self.assertEqual(pool.pending, 0)
+
+    def test_parse_in_worker_process(self):
+        """Test a parse round trip through a real worker process."""
+        pool = self.make_pool(
+            {"GUARD_EXECUTION_MODE": "process", "GUARD_PROCESS_POOL_SIZE": "1"}
+        )
+        # Don't wait for the worker to flush telemetry on exit
+        self.addCleanup(pool.shutdown, wait=False)
+        guard = Guard(name="my-guard")
+
+        async def parse_twice():
+            first = await pool.parse(guard, "v1", llm_output="Hello!")
+            second = await pool.parse(guard, "v1", llm_output="Hi!")
+            return first, second
+
+        (outcome, call), (second_outcome, _) = asyncio.run(parse_twice())
+
+        self.assertTrue(outcome.validation_passed)
+        self.assertEqual(outcome.validated_output, "Hello!")
+        self.assertEqual(call.id, outcome.call_id)
+        self.assertEqual(second_outcome.validated_output, "Hi!")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+"""Unit tests for guardrails_api.utils.maybe_await module."""
+
+import asyncio
+import unittest
+from guardrails_api.utils.maybe_await import maybe_await
+
+
+class TestMaybeAwait(unittest.TestCase):
+    """Test cases for the maybe_await function."""
+
+    def test_returns_plain_values(self):
+        """Test that non awaitable values are returned as is."""
+        self.assertEqual(asyncio.run(maybe_await("value")), "value")
+
+    def test_awaits_coroutines(self):
+        """Test that coroutines are awaited."""
+
+        async def get_value():
+            return "value"
+
+        self.assertEqual(asyncio.run(maybe_await(get_value())), "value")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""Unit tests for guardrails_api.utils.metrics module."""
+
+import unittest
+from guardrails_api.utils.metrics import Metrics
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for the Metrics class."""
+
+    def setUp(self):
+        self.metrics = Metrics()
+        self.metrics.initialize()
+
+    def test_singleton(self):
+        """Test that Metrics is a process wide singleton."""
+        self.assertIs(Metrics(), self.metrics)
+
+    def test_increment_counters(self):
+        """Test that counters accumulate increments."""
+        self.metrics.increment("requests_total")
+        self.metrics.increment("requests_total", 2)
+
+        self.assertEqual(self.metrics.get("requests_total"), 3)
+
+    def test_set_gauge_replaces_value(self):
+        """Test that gauges hold the latest value."""
+        self.metrics.set_gauge("queue_depth", 4)
+        self.metrics.set_gauge("queue_depth", 1)
+
+        self.assertEqual(self.metrics.get("queue_depth"), 1)
+
+    def test_get_unknown_metric(self):
+        """Test that unknown metrics read as zero."""
+        self.assertEqual(self.metrics.get("missing"), 0)
+
+    def test_snapshot_is_a_copy(self):
+        """Test that snapshot returns counters and gauges by value."""
+        self.metrics.increment("requests_total")
+        self.metrics.set_gauge("queue_depth", 2)
+
+        snapshot = self.metrics.snapshot()
+        self.metrics.increment("requests_total")
+
+        self.assertEqual(
+            snapshot,
+            {"counters": {"requests_total": 1}, "gauges": {"queue_depth": 2}},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
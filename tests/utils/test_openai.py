@@ -3,8 +3,15 @@
 import asyncio
 import json
 import unittest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
+from guardrails import AsyncGuard
+from guardrails.classes import ValidationOutcome
+from guardrails.classes.generic.stack import Stack
+from guardrails.classes.history import Call
+from guardrails.classes.history.call_inputs import CallInputs
+
 from guardrails_api.utils.openai import (
     guarded_chat_completion,
     guarded_chat_completion_stream,
@@ -14,6 +21,14 @@ from guardrails_api.utils.openai import (
 class TestGuardedChatCompletion(unittest.TestCase):
     """Test cases for guarded_chat_completion function."""
 
+    def setUp(self):
+        # Calls run on the mock guard itself instead of a copy of it
+        patcher = patch(
+            "guardrails_api.utils.openai.copy_guard", side_effect=lambda guard: guard
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def _make_mock_model_response(self, content="Hello!"):
         """Create a mock litellm ModelResponse."""
         mock_response = Mock()
@@ -26,11 +41,16 @@ class TestGuardedChatCompletion(unittest.TestCase):
         mock_choice.message.function_call = None
         mock_choice.message.tool_calls = None
         mock_response.choices = [mock_choice]
+        mock_response.model = "gpt-4"
+        mock_response.model_fields_set = {"choices", "model"}
         return mock_response
 
     def _make_fake_guard(self, mock_outcome):
         """Create a mock guard that calls llm_api and returns mock_outcome."""
         mock_guard = AsyncMock()
+        call = Call()
+        mock_guard.history = Stack(call)
+        mock_outcome.call_id = call.id
 
         async def fake_guard_call(*args, **kwargs):
             llm_api = kwargs.get("llm_api")
@@ -65,7 +85,11 @@ class TestGuardedChatCompletion(unittest.TestCase):
 
         self.assertIn("guardrails", result)
         self.assertIn("choices", result)
-        self.assertTrue(result["guardrails"].validation_passed)
+        # The response is built from the completion and outcome as they are
+        self.assertIs(result.guardrails, mock_outcome)
+        self.assertEqual(result.choices, mock_model_response.choices)
+        mock_model_response.model_dump.assert_not_called()
+        mock_outcome.model_dump.assert_not_called()
 
     def test_guard_called_with_num_reasks_zero(self):
         """Test guard is always called with num_reasks=0."""
@@ -94,6 +118,31 @@ class TestGuardedChatCompletion(unittest.TestCase):
         call_kwargs = mock_guard.call_args[1]
         self.assertEqual(call_kwargs["num_reasks"], 0)
 
+    def test_on_call_receives_the_guard_call(self):
+        """Test that on_call is passed the call recorded by the guard."""
+        mock_model_response = self._make_mock_model_response()
+        mock_outcome = Mock()
+        mock_outcome.model_dump.return_value = {
+            "validation_passed": True,
+            "callId": "123",
+        }
+        mock_guard = self._make_fake_guard(mock_outcome)
+        on_call = Mock()
+
+        with patch(
+            "guardrails_api.utils.openai.litellm.acompletion",
+            return_value=mock_model_response,
+        ):
+            asyncio.run(
+                guarded_chat_completion(
+                    mock_guard,
+                    {"messages": [{"role": "user", "content": "Test"}]},
+                    on_call=on_call,
+                )
+            )
+
+        on_call.assert_called_once_with(mock_guard.history.last)
+
     def test_llm_wrapper_extracts_content_from_message(self):
         """Test llm_wrapper extracts content from message.content."""
         mock_model_response = self._make_mock_model_response(
@@ -146,6 +195,7 @@ class TestGuardedChatCompletion(unittest.TestCase):
         mock_choice.message.function_call.arguments = '{"key": "val"}'
         mock_choice.message.tool_calls = None
         mock_model_response.choices = [mock_choice]
+        mock_model_response.model_fields_set = {"choices"}
 
         mock_outcome = Mock()
         mock_outcome.model_dump.return_value = {
@@ -194,6 +244,7 @@ class TestGuardedChatCompletion(unittest.TestCase):
         mock_choice.message.function_call = None
         mock_choice.message.tool_calls = [mock_tool_call]
         mock_model_response.choices = [mock_choice]
+        mock_model_response.model_fields_set = {"choices"}
 
         mock_outcome = Mock()
         mock_outcome.model_dump.return_value = {
@@ -225,6 +276,14 @@ class TestGuardedChatCompletion(unittest.TestCase):
 class TestGuardedChatCompletionStream(unittest.TestCase):
     """Test cases for guarded_chat_completion_stream function."""
 
+    def setUp(self):
+        # Streams run on the mock guard itself instead of a copy of it
+        patcher = patch(
+            "guardrails_api.utils.openai.copy_guard", side_effect=lambda guard: guard
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def _make_mock_stream_chunk(self, content="Hello"):
         """Create a mock streaming chunk."""
         mock_chunk = Mock()
@@ -240,22 +299,31 @@ class TestGuardedChatCompletionStream(unittest.TestCase):
         mock_chunk.choices = [mock_choice]
         return mock_chunk
 
+    def _make_chunk_stream(self, *chunks):
+        """Create an async iterable like litellm's CustomStreamWrapper."""
+
+        async def chunk_stream():
+            for chunk in chunks:
+                yield chunk
+
+        return chunk_stream()
+
     def _make_fake_stream_guard(self, mock_outcome):
-        """Create a mock guard that calls llm_api (consuming one chunk) and yields mock_outcome."""
-        mock_guard = Mock()
-        mock_guard.history = Mock()
-        mock_guard.history.last = Mock()
-        mock_guard.history.last.validator_logs = []
+        """Create a mock async guard that calls llm_api and yields mock_outcome per chunk."""
+        mock_guard = AsyncMock()
+        call = Call()
+        mock_guard.history = Stack(call)
+        mock_outcome.call_id = call.id
 
-        def fake_stream_call(*args, **kwargs):
+        async def fake_stream_call(*args, **kwargs):
             llm_api = kwargs.get("llm_api")
-            if llm_api:
-                gen = llm_api(messages=kwargs.get("messages", []))
-                try:
-                    next(gen)
-                except StopIteration:
-                    pass
-            yield mock_outcome
+            llm_response = await llm_api(messages=kwargs.get("messages", []))
+
+            async def outcomes():
+                async for _ in llm_response.completion_stream:
+                    yield mock_outcome
+
+            return outcomes()
 
         mock_guard.side_effect = fake_stream_call
         return mock_guard
@@ -280,8 +348,9 @@ class TestGuardedChatCompletionStream(unittest.TestCase):
             return [chunk async for chunk in gen]
 
         with patch(
-            "guardrails_api.utils.openai.litellm.completion",
-            side_effect=lambda *args, **kwargs: iter([mock_chunk]),
+            "guardrails_api.utils.openai.litellm.acompletion",
+            new_callable=AsyncMock,
+            return_value=self._make_chunk_stream(mock_chunk),
         ):
             # Must consume generator inside patch context since it's lazy
             chunks = asyncio.run(collect())
@@ -317,8 +386,9 @@ class TestGuardedChatCompletionStream(unittest.TestCase):
             return [chunk async for chunk in gen]
 
         with patch(
-            "guardrails_api.utils.openai.litellm.completion",
-            side_effect=lambda *args, **kwargs: iter([mock_chunk]),
+            "guardrails_api.utils.openai.litellm.acompletion",
+            new_callable=AsyncMock,
+            return_value=self._make_chunk_stream(mock_chunk),
         ):
             # Must consume generator inside patch context since it's lazy
             chunks = asyncio.run(collect())
@@ -349,14 +419,238 @@ class TestGuardedChatCompletionStream(unittest.TestCase):
             return [chunk async for chunk in gen]
 
         with patch(
-            "guardrails_api.utils.openai.litellm.completion",
-            side_effect=lambda *args, **kwargs: iter([mock_chunk]),
+            "guardrails_api.utils.openai.litellm.acompletion",
+            new_callable=AsyncMock,
+            return_value=self._make_chunk_stream(mock_chunk),
         ):
             # Must consume generator inside patch context since it's lazy
             chunks = asyncio.run(collect())
 
         self.assertEqual(chunks[-1], "\n")
 
+    def test_on_call_receives_the_guard_call_after_the_stream(self):
+        """Test that on_call is passed the call once the stream is done."""
+        mock_chunk = self._make_mock_stream_chunk(content="End")
+        mock_outcome = Mock()
+        mock_outcome.model_dump.return_value = {"validation_passed": True}
+        mock_outcome.validation_summaries = [Mock()]
+        mock_guard = self._make_fake_stream_guard(mock_outcome)
+        on_call = Mock()
+
+        async def collect():
+            gen = await guarded_chat_completion_stream(
+                mock_guard,
+                {"messages": [{"role": "user", "content": "End"}]},
+                on_call=on_call,
+            )
+            chunks = [await gen.__anext__()]
+            on_call.assert_not_called()
+            return chunks + [chunk async for chunk in gen]
+
+        with patch(
+            "guardrails_api.utils.openai.litellm.acompletion",
+            new_callable=AsyncMock,
+            return_value=self._make_chunk_stream(mock_chunk),
+        ):
+            asyncio.run(collect())
+
+        on_call.assert_called_once_with(mock_guard.history.last)
+
+    def test_forwards_each_chunk_as_it_arrives(self):
+        """Test that every streamed chunk produces its own SSE event."""
+        chunks_in = [
+            self._make_mock_stream_chunk(content=text)
+            for text in ["Hello", " there", "!"]
+        ]
+        mock_outcome = Mock()
+        mock_outcome.model_dump.return_value = {"validation_passed": True}
+        mock_outcome.validation_summaries = [Mock()]
+
+        mock_guard = self._make_fake_stream_guard(mock_outcome)
+
+        async def collect():
+            gen = await guarded_chat_completion_stream(
+                mock_guard,
+                {"messages": [{"role": "user", "content": "Hi"}], "stream": True},
+            )
+            return [chunk async for chunk in gen]
+
+        with patch(
+            "guardrails_api.utils.openai.litellm.acompletion",
+            new_callable=AsyncMock,
+            return_value=self._make_chunk_stream(*chunks_in),
+        ) as mock_acompletion:
+            chunks = asyncio.run(collect())
+
+        mock_acompletion.assert_awaited_once()
+        data_chunks = [c for c in chunks if c.startswith("data: ")]
+        self.assertEqual(
+            [json.loads(c[6:])["choices"][0]["delta"]["content"] for c in data_chunks],
+            ["Hello", " there", "!"],
+        )
+
+    @patch("guardrails_api.utils.openai.AsyncGuard.from_dict")
+    def test_sync_guard_is_converted_to_async_guard(self, mock_from_dict):
+        """Test that synchronous guards are streamed through an AsyncGuard."""
+        from guardrails import Guard
+
+        sync_guard = Mock(spec=Guard)
+        sync_guard.to_dict.return_value = {"name": "sync-guard"}
+        mock_outcome = Mock()
+        mock_outcome.model_dump.return_value = {"validation_passed": True}
+        mock_outcome.validation_summaries = [Mock()]
+        mock_from_dict.return_value = self._make_fake_stream_guard(mock_outcome)
+
+        async def collect():
+            gen = await guarded_chat_completion_stream(
+                sync_guard,
+                {"messages": [{"role": "user", "content": "Hi"}]},
+            )
+            return [chunk async for chunk in gen]
+
+        with patch(
+            "guardrails_api.utils.openai.litellm.acompletion",
+            new_callable=AsyncMock,
+            return_value=self._make_chunk_stream(self._make_mock_stream_chunk()),
+        ):
+            chunks = asyncio.run(collect())
+
+        mock_from_dict.assert_called_once_with({"name": "sync-guard"})
+        self.assertEqual(chunks[-1], "\n")
+
+
+def _stream_chunk(content: str) -> SimpleNamespace:
+    delta = SimpleNamespace(content=content, function_call=None, tool_calls=None)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=delta)],
+        model_dump=lambda: {"choices": [{"delta": {"content": content}}]},
+    )
+
+
+class TestGuardedChatCompletionStreamSharedGuard(unittest.TestCase):
+    """Concurrent streams on one shared AsyncGuard."""
+
+    def test_concurrent_streams_get_their_own_calls(self):
+        guard = AsyncGuard()
+
+        async def fake_call(guard, *args, llm_api, messages, **kwargs):
+            call = Call(inputs=CallInputs(messages=messages))
+            guard.history.push(call)
+            llm_response = await llm_api(messages=messages)
+
+            async def outcomes():
+                async for text in llm_response.completion_stream:
+                    # Both streams are in flight before either one finishes
+                    await asyncio.sleep(0.01)
+                    yield ValidationOutcome(
+                        callId=call.id,
+                        validationPassed=True,
+                        validatedOutput=text,
+                        rawLlmOutput=text,
+                    )
+
+            return outcomes()
+
+        async def fake_acompletion(*args, messages, **kwargs):
+            content = messages[0]["content"]
+
+            async def chunks():
+                for _ in range(3):
+                    yield _stream_chunk(content)
+
+            return chunks()
+
+        calls = {}
+
+        async def stream(content):
+            gen = await guarded_chat_completion_stream(
+                guard,
+                {"messages": [{"role": "user", "content": content}]},
+                on_call=lambda call: calls.setdefault(content, call),
+            )
+            return [chunk async for chunk in gen]
+
+        async def run():
+            return await asyncio.gather(stream("a"), stream("b"))
+
+        with (
+            patch.object(AsyncGuard, "__call__", fake_call),
+            patch(
+                "guardrails_api.utils.openai.litellm.acompletion",
+                side_effect=fake_acompletion,
+            ),
+        ):
+            asyncio.run(run())
+
+        self.assertEqual(
+            {
+                content: call.inputs.messages[0]["content"]
+                for content, call in calls.items()
+            },
+            {"a": "a", "b": "b"},
+        )
+        # Streams ran on per request copies of the shared guard
+        self.assertEqual(len(guard.history), 0)
+
+
+class TestGuardedChatCompletionSharedGuard(unittest.TestCase):
+    """Concurrent completions on one shared AsyncGuard."""
+
+    @patch("guardrails_api.utils.openai.copy_guard", side_effect=lambda guard: guard)
+    def test_concurrent_calls_are_found_by_call_id(self, _):
+        # Without a copy both calls land on the shared history, so history.last
+        # is whichever call finished last
+        guard = AsyncGuard()
+
+        async def fake_call(guard, *args, llm_api, messages, **kwargs):
+            call = Call(inputs=CallInputs(messages=messages))
+            guard.history.push(call)
+            output = await llm_api(messages=messages)
+            await asyncio.sleep(0.01)
+            return ValidationOutcome(
+                callId=call.id,
+                validationPassed=True,
+                validatedOutput=output,
+                rawLlmOutput=output,
+            )
+
+        async def fake_acompletion(*args, messages, **kwargs):
+            message = SimpleNamespace(
+                content=messages[0]["content"], function_call=None, tool_calls=None
+            )
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=message)], model_fields_set=set()
+            )
+
+        calls = {}
+
+        async def complete(content):
+            await guarded_chat_completion(
+                guard,
+                {"messages": [{"role": "user", "content": content}]},
+                on_call=lambda call: calls.setdefault(content, call),
+            )
+
+        async def run():
+            await asyncio.gather(complete("a"), complete("b"))
+
+        with (
+            patch.object(AsyncGuard, "__call__", fake_call),
+            patch(
+                "guardrails_api.utils.openai.litellm.acompletion",
+                side_effect=fake_acompletion,
+            ),
+        ):
+            asyncio.run(run())
+
+        self.assertEqual(
+            {
+                content: call.inputs.messages[0]["content"]
+                for content, call in calls.items()
+            },
+            {"a": "a", "b": "b"},
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,182 @@
+"""Unit tests for guardrails_api.utils.request_coalescer module."""
+
+import asyncio
+import os
+import unittest
+from unittest.mock import Mock, patch
+from guardrails_ai.types import Guard as IGuard
+from guardrails_api.utils.metrics import Metrics
+from guardrails_api.utils.request_coalescer import (
+    RequestCoalescer,
+    default_coalesce_key,
+    get_coalesce_key_function,
+    validate_coalescing_is_enabled,
+)
+
+
+class TestValidateCoalescingIsEnabled(unittest.TestCase):
+    """Test cases for the validate_coalescing_is_enabled function."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_disabled_by_default(self):
+        self.assertFalse(validate_coalescing_is_enabled())
+
+    @patch.dict(os.environ, {"VALIDATE_COALESCING_ENABLED": "True"})
+    def test_enabled_case_insensitive(self):
+        self.assertTrue(validate_coalescing_is_enabled())
+
+
+class TestDefaultCoalesceKey(unittest.TestCase):
+    """Test cases for the default_coalesce_key function."""
+
+    def test_identical_requests_share_a_key(self):
+        """Test that the key only depends on the guard and request body."""
+        guard = IGuard(id="guard-id", name="guard")
+        request = {"llm_output": "Hello!", "metadata": {"a": 1, "b": 2}}
+        reordered = {"metadata": {"b": 2, "a": 1}, "llm_output": "Hello!"}
+
+        self.assertEqual(
+            default_coalesce_key(guard, "v1", request),
+            default_coalesce_key(guard, "v1", reordered),
+        )
+
+    def test_different_requests_or_guards_differ(self):
+        """Test that changing the body or the guard version changes the key."""
+        guard = IGuard(id="guard-id", name="guard")
+        key = default_coalesce_key(guard, "v1", {"llm_output": "Hello!"})
+
+        self.assertNotEqual(
+            key, default_coalesce_key(guard, "v1", {"llm_output": "Hi!"})
+        )
+        self.assertNotEqual(
+            key, default_coalesce_key(guard, "v2", {"llm_output": "Hello!"})
+        )
+
+
+class TestGetCoalesceKeyFunction(unittest.TestCase):
+    """Test cases for the get_coalesce_key_function function."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_defaults_to_default_coalesce_key(self):
+        self.assertIs(get_coalesce_key_function(), default_coalesce_key)
+
+    @patch.dict(
+        os.environ, {"VALIDATE_COALESCE_KEY_FUNCTION": "my_module:my_key_function"}
+    )
+    @patch("guardrails_api.utils.request_coalescer.importlib.import_module")
+    def test_imports_configured_function(self, mock_import_module):
+        """Test that module:function paths are imported."""
+        result = get_coalesce_key_function()
+
+        mock_import_module.assert_called_once_with("my_module")
+        self.assertIs(result, mock_import_module.return_value.my_key_function)
+
+    @patch.dict(os.environ, {"VALIDATE_COALESCE_KEY_FUNCTION": "my_module"})
+    def test_invalid_path_raises(self):
+        with self.assertRaises(ValueError):
+            get_coalesce_key_function()
+
+
+class TestRequestCoalescer(unittest.TestCase):
+    """Test cases for the RequestCoalescer class."""
+
+    def make_coalescer(self, env: dict) -> RequestCoalescer:
+        coalescer = RequestCoalescer()
+        with patch.dict(os.environ, env):
+            coalescer.initialize()
+        self.addCleanup(coalescer.initialize)
+        return coalescer
+
+    def test_get_key_disabled(self):
+        """Test that no key is produced while coalescing is disabled."""
+        coalescer = self.make_coalescer({"VALIDATE_COALESCING_ENABLED": "false"})
+
+        self.assertIsNone(coalescer.get_key(IGuard(id="g", name="g"), "v1", {}))
+
+    def test_get_key_uses_key_function(self):
+        """Test that the configured key function produces the key."""
+        coalescer = self.make_coalescer({"VALIDATE_COALESCING_ENABLED": "true"})
+        coalescer.key_function = Mock(return_value="key")
+        guard = IGuard(id="g", name="g")
+
+        self.assertEqual(coalescer.get_key(guard, "v1", {"llm_output": "x"}), "key")
+        coalescer.key_function.assert_called_once_with(guard, "v1", {"llm_output": "x"})
+
+    def test_concurrent_identical_requests_share_one_execution(self):
+        """Test that concurrent calls with the same key run the work once."""
+        coalescer = self.make_coalescer({"VALIDATE_COALESCING_ENABLED": "true"})
+        coalesced = Metrics().get("validate_coalesced_total")
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def run_all():
+            return await asyncio.gather(
+                coalescer.run("a", work),
+                coalescer.run("a", work),
+                coalescer.run("b", work),
+            )
+
+        results = asyncio.run(run_all())
+
+        self.assertEqual(results, ["result", "result", "result"])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(coalescer.in_flight, {})
+        self.assertEqual(Metrics().get("validate_coalesced_total"), coalesced + 1)
+
+    def test_sequential_requests_are_not_coalesced(self):
+        """Test that finished work is not reused by later requests."""
+        coalescer = self.make_coalescer({"VALIDATE_COALESCING_ENABLED": "true"})
+        calls = []
+
+        async def work():
+            calls.append(1)
+            return len(calls)
+
+        async def run_twice():
+            return [await coalescer.run("a", work), await coalescer.run("a", work)]
+
+        self.assertEqual(asyncio.run(run_twice()), [1, 2])
+
+    def test_exceptions_reach_every_waiter(self):
+        """Test that a failure is raised to all coalesced requests."""
+        coalescer = self.make_coalescer({"VALIDATE_COALESCING_ENABLED": "true"})
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        async def run_all():
+            return await asyncio.gather(
+                coalescer.run("a", work),
+                coalescer.run("a", work),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run_all())
+
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    def test_cancelled_waiter_does_not_cancel_others(self):
+        """Test that one waiter going away leaves the shared work running."""
+        coalescer = self.make_coalescer({"VALIDATE_COALESCING_ENABLED": "true"})
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        async def run_with_cancel():
+            first = asyncio.ensure_future(coalescer.run("a", work))
+            second = asyncio.ensure_future(coalescer.run("a", work))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        self.assertEqual(asyncio.run(run_with_cancel()), "result")
+
+
+if __name__ == "__main__":
+    unittest.main()